@@ -10,12 +10,22 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 django.setup()
 
 from apps.audit.models import AuditLog
+from apps.audit.partitions import archive_partitions, ensure_partitions, is_partitioned
 
 
 def archive_old_logs():
     """Archive audit logs older than 7 years."""
     seven_years_ago = datetime.now() - timedelta(days=7*365)
     
+    if is_partitioned():
+        # Whole months are detached into the audit_archive schema
+        archived = archive_partitions(seven_years_ago)
+        print(f"Archived {len(archived)} audit log partitions: {', '.join(archived) or 'none'}")
+        created = ensure_partitions()
+        if created:
+            print(f"Created audit log partitions: {', '.join(created)}")
+        return
+    
     logs_to_archive = AuditLog.objects.filter(
         archived_at__isnull=True,
         timestamp__lt=seven_years_ago
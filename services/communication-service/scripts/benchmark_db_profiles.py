@@ -0,0 +1,103 @@
+"""
+Benchmark the database connection profiles from hdms_core.db.
+
+Replays REQUESTS simulated requests (request_started, one chat-history
+query, request_finished, the same hooks Django uses to open and recycle
+connections) under each DB_POOL_PROFILE, twice per profile:
+    wsgi  WORKERS long-lived threads, like gunicorn workers
+    asgi  CONCURRENCY requests in flight, each in its own thread-sensitive
+          context as Django's ASGI handler runs sync code
+Reports requests per second and p50/p99 latency for each combination.
+
+Uses the configured database (through PgBouncer by default); the pool
+profile needs psycopg 3 with the pool extra and is skipped otherwise.
+Nothing is written.
+
+Run this manually: python manage.py shell < scripts/benchmark_db_profiles.py
+"""
+import asyncio
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from hdms_core.db import PROFILES, database_settings
+from apps.chat.models import ChatMessage
+
+REQUESTS = 2000
+WORKERS = 8
+CONCURRENCY = 32
+TICKET_ID = uuid.uuid4()
+
+original = dict(connections.settings['default'])
+base = {key: original[key] for key in ('NAME', 'USER', 'PASSWORD', 'HOST', 'PORT')}
+base['OPTIONS'] = {k: v for k, v in original['OPTIONS'].items() if k != 'pool'}
+
+
+def use_profile(profile):
+    connections.close_all()
+    config = database_settings(profile, conn_max_age=600, pool_options={'min_size': 2, 'max_size': CONCURRENCY}, **base)
+    connections.settings['default'] = connections.configure_settings({'default': config})['default']
+    del connections['default']
+
+
+def handle_request():
+    started = time.perf_counter()
+    request_started.send(sender=None)
+    try:
+        list(ChatMessage.objects.filter(ticket_id=TICKET_ID).order_by('-created_at')[:20])
+    finally:
+        request_finished.send(sender=None)
+    return time.perf_counter() - started
+
+
+def run_wsgi():
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        latencies = list(pool.map(lambda _: handle_request(), range(REQUESTS)))
+        # Worker threads keep their connections; close them like a worker exit would
+        list(pool.map(lambda _: connections.close_all(), range(WORKERS)))
+    return latencies
+
+
+async def run_asgi():
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            async with ThreadSensitiveContext():
+                return await sync_to_async(handle_request)()
+
+    return await asyncio.gather(*(one() for _ in range(REQUESTS)))
+
+
+def report(profile, mode, latencies, elapsed):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{profile:>10} {mode:>5}: {len(latencies) / elapsed:8.0f} req/s   p50 {p50:6.2f} ms   p99 {p99:7.2f} ms")
+
+
+try:
+    for profile in PROFILES:
+        try:
+            use_profile(profile)
+            handle_request()
+        except Exception as e:
+            print(f"{profile:>10}: skipped ({e})")
+            continue
+        for mode, runner in (('wsgi', run_wsgi), ('asgi', lambda: asyncio.run(run_asgi()))):
+            started = time.perf_counter()
+            try:
+                latencies = runner()
+            except Exception as e:
+                # e.g. persistent connections under ASGI exhausting max_connections
+                print(f"{profile:>10} {mode:>5}: failed ({type(e).__name__}: {str(e).strip()})")
+                connections.close_all()
+                continue
+            report(profile, mode, latencies, time.perf_counter() - started)
+finally:
+    connections.close_all()
+    connections.settings['default'] = original
+    del connections['default']
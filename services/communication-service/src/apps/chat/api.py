@@ -2,23 +2,43 @@
 Chat API endpoints.
 """
 from ninja import Router
-from typing import List
-from apps.chat.schemas import ChatMessageOut, ChatMessageIn
+from ninja.errors import HttpError
+from typing import List, Optional
+from apps.chat.schemas import ChatMessageOut, ChatMessageIn, ChatMessagePageOut
 from apps.chat.models import ChatMessage
+from apps.chat.services import ChatService
 
 from ninja.security import HttpBearer
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from hdms_core.authentication import RemoteJWTAuthentication
+from hdms_core.pagination import KeysetPaginator
 
 router = Router(tags=["chat"], auth=RemoteJWTAuthentication())
 
 
-@router.get("/messages/ticket/{ticket_id}", response=List[ChatMessageOut])
-def list_messages(request, ticket_id: str):
-    """List chat messages for a ticket."""
-    messages = ChatMessage.objects.filter(ticket_id=ticket_id, is_deleted=False)
-    return [ChatMessageOut.from_orm(msg) for msg in messages]
+@router.get("/messages/ticket/{ticket_id}", response=ChatMessagePageOut)
+def list_messages(
+    request,
+    ticket_id: str,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+    limit: int = KeysetPaginator.default_page_size,
+):
+    """List chat messages for a ticket, one page at a time.
+    
+    Args:
+        before: Cursor from a previous page's `before`; loads older messages
+        after: Cursor from a previous page's `after`; loads messages sent since
+        limit: Messages per page (capped at KeysetPaginator.max_page_size)
+    """
+    try:
+        page = ChatService.get_message_page(ticket_id, before=before, after=after, limit=limit)
+    except ValueError as e:  # Includes InvalidCursor
+        raise HttpError(400, str(e))
+    
+    page['results'] = ChatMessageOut.from_orm_many(page['results'])
+    return page
 
 
 @router.post("/messages", response=ChatMessageOut)
@@ -8,9 +8,13 @@ from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
 from urllib.parse import parse_qs
 from django.contrib.auth import get_user_model
+from hdms_core.user_cache import JITUserCache
 
 User = get_user_model()
 
+# Separate namespace from the HTTP cache: the handshake syncs a different field set
+ws_user_cache = JITUserCache(key_prefix='hdms:ws_jit_user', metric_prefix='ws_jit_user_cache')
+
 
 class JWTAuthMiddleware(BaseMiddleware):
     """
@@ -71,22 +75,55 @@ class JWTAuthMiddleware(BaseMiddleware):
         
         return await super().__call__(scope, receive, send)
 
+    @staticmethod
+    def user_defaults(payload):
+        """Fields synced onto the local User from a JWT payload."""
+        full_name = payload.get('full_name', '')
+        
+        # Split full_name into first/last
+        names = full_name.split(' ')
+        first_name = names[0] if names else ''
+        last_name = ' '.join(names[1:]) if len(names) > 1 else ''
+        
+        return {
+            'employee_code': payload.get('employee_code'),
+            'first_name': first_name,
+            'last_name': last_name,
+            'email': payload.get('email'),
+            'role': payload.get('role', 'requestor'),
+            'is_active': payload.get('is_active', True),
+        }
+
+    async def get_or_sync_user(self, payload):
+        """
+        Resolve the HDMS user for a handshake.
+        
+        Served from the claims-hash cache on the event loop when the token
+        claims match the last sync; only a miss pays for a thread-pool hop
+        and a database round trip.
+        """
+        user_id = payload.get('user_id')
+        defaults = self.user_defaults(payload)
+        claims_hash = ws_user_cache.claims_hash(user_id, defaults)
+        
+        user = await ws_user_cache.aget(user_id, claims_hash)
+        if user is not None:
+            return user
+        
+        user = await self.sync_user(user_id, defaults)
+        if user is not None:
+            await ws_user_cache.aset(user, claims_hash)
+        return user
+
     @database_sync_to_async
-    def get_or_sync_user(self, payload):
+    def sync_user(self, user_id, defaults):
         """
         Just-In-Time (JIT) synchronization of user from JWT payload.
-        Ensures HDMS local database has the user record.
+        Ensures HDMS local database has the user record, writing only
+        the fields that changed.
         """
         try:
-            user_id = payload.get('user_id')
-            employee_code = payload.get('employee_code')
-            full_name = payload.get('full_name', '')
-            email = payload.get('email')
-            
-            # Split full_name into first/last
-            names = full_name.split(' ')
-            first_name = names[0] if names else ''
-            last_name = ' '.join(names[1:]) if len(names) > 1 else ''
+            email = defaults['email']
 
             # JIT Sync: Try with original email, then mangled if duplicate
             emails_to_try = [email]
@@ -101,23 +138,23 @@ class JWTAuthMiddleware(BaseMiddleware):
                     # Get or create user by ID (UUID)
                     user, created = User.objects.get_or_create(
                         id=user_id,
-                        defaults={
-                            'employee_code': employee_code,
-                            'first_name': first_name,
-                            'last_name': last_name,
-                            'email': try_email,
-                            'role': payload.get('role', 'requestor'),
-                            'is_active': payload.get('is_active', True),
-                        }
+                        defaults={**defaults, 'email': try_email}
                     )
                     
                     if not created:
-                        # Update existing user data
-                        user.employee_code = employee_code
-                        user.first_name = first_name
-                        user.last_name = last_name
-                        if try_email: user.email = try_email
-                        user.save()
+                        # Update existing user data, skipping the write if nothing changed
+                        updates = {
+                            'employee_code': defaults['employee_code'],
+                            'first_name': defaults['first_name'],
+                            'last_name': defaults['last_name'],
+                        }
+                        if try_email:
+                            updates['email'] = try_email
+                        changed = [field for field, value in updates.items() if getattr(user, field) != value]
+                        if changed:
+                            for field in changed:
+                                setattr(user, field, updates[field])
+                            user.save(update_fields=changed + ['updated_at'])
                     
                     return user
                     
@@ -2,7 +2,7 @@
 Pydantic schemas for Chat Service.
 """
 from ninja import Schema
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -21,35 +21,46 @@ class ChatMessageOut(Schema):
     created_at: datetime
     
     @staticmethod
-    def from_orm(msg):
-        """Custom serializer to include sender details from User model."""
-        from django.contrib.auth import get_user_model
-        User = get_user_model()
+    def from_orm(msg, sender_profile: Optional[dict] = None):
+        """
+        Custom serializer to include sender details from User model.
         
-        # Try to get sender details
-        sender_name = "Unknown"
-        sender_role = "user"
-        employee_code = ""
-        
-        try:
-            sender = User.objects.get(id=msg.sender_id)
-            sender_name = f"{sender.first_name} {sender.last_name}".strip() or sender.employee_code
-            sender_role = sender.role
-            employee_code = sender.employee_code
-        except User.DoesNotExist:
-            pass
+        Pass `sender_profile` (from ChatSelector.get_sender_profiles) to skip
+        the per-message user lookup.
+        """
+        if sender_profile is None:
+            from apps.chat.selectors import ChatSelector
+            sender_profile = ChatSelector.get_sender_profiles([msg.sender_id]).get(str(msg.sender_id), {})
         
         return ChatMessageOut(
             id=msg.id,
             ticket_id=msg.ticket_id,
             sender_id=msg.sender_id,
-            sender_name=sender_name,
-            sender_role=sender_role,
-            employee_code=employee_code,
+            sender_name=sender_profile.get('sender_name', "Unknown"),
+            sender_role=sender_profile.get('sender_role', "user"),
+            employee_code=sender_profile.get('employee_code', ""),
             message=msg.message,
             mentions=msg.mentions,
             created_at=msg.created_at
         )
+    
+    @staticmethod
+    def from_orm_many(messages) -> List['ChatMessageOut']:
+        """Serialize many messages, resolving all senders in one batch."""
+        from apps.chat.selectors import ChatSelector
+        messages = list(messages)
+        profiles = ChatSelector.get_sender_profiles(msg.sender_id for msg in messages)
+        return [
+            ChatMessageOut.from_orm(msg, profiles.get(str(msg.sender_id), {}))
+            for msg in messages
+        ]
+
+
+class ChatMessagePageOut(Schema):
+    """A page of chat history, oldest message first."""
+    results: List[ChatMessageOut]
+    before: Optional[str] = None
+    after: Optional[str] = None
 
 
 class ChatMessageIn(Schema):
@@ -1,8 +1,14 @@
 """
 Optimized query selectors for Chat app.
 """
+import logging
+from typing import Dict, Iterable
+from django.conf import settings
+from django.core.cache import cache
 from .models import ChatMessage, TicketParticipant
 
+logger = logging.getLogger(__name__)
+
 
 class ChatSelector:
     """Optimized queries for Chat model."""
@@ -16,5 +22,56 @@ class ChatSelector:
     def get_user_tickets(user_id: str):
         """Get all tickets a user participates in."""
         return TicketParticipant.objects.filter(user_id=user_id).values_list('ticket_id', flat=True)
-
-
+    
+    @staticmethod
+    def get_sender_profiles(sender_ids: Iterable) -> Dict[str, dict]:
+        """
+        Resolve display details for many senders at once.
+        
+        Profiles are read from a short-TTL cache (CHAT_SENDER_PROFILE_TTL
+        seconds, 0 disables it) and the remainder with a single `id__in`
+        query, so hydrating a chat history costs O(1) queries.
+        
+        Returns:
+            Mapping of sender_id (str) to {'sender_name', 'sender_role',
+            'employee_code'}; unknown senders are omitted.
+        """
+        from django.contrib.auth import get_user_model
+        User = get_user_model()
+        
+        ids = {str(sender_id) for sender_id in sender_ids if sender_id}
+        if not ids:
+            return {}
+        
+        ttl = getattr(settings, 'CHAT_SENDER_PROFILE_TTL', 60)
+        keys = {f'chat:sender_profile:{sender_id}': sender_id for sender_id in ids}
+        profiles = {}
+        
+        if ttl:
+            try:
+                cached = cache.get_many(list(keys))
+                profiles = {keys[key]: profile for key, profile in cached.items()}
+            except Exception as e:
+                logger.warning(f"Sender profile cache read failed: {e}")
+        
+        missing = ids - profiles.keys()
+        if missing:
+            fetched = {}
+            senders = User.objects.filter(id__in=missing).only(
+                'id', 'first_name', 'last_name', 'role', 'employee_code'
+            )
+            for sender in senders:
+                fetched[str(sender.id)] = {
+                    'sender_name': f"{sender.first_name} {sender.last_name}".strip() or sender.employee_code,
+                    'sender_role': sender.role,
+                    'employee_code': sender.employee_code,
+                }
+            profiles.update(fetched)
+            
+            if ttl and fetched:
+                try:
+                    cache.set_many({f'chat:sender_profile:{sender_id}': profile for sender_id, profile in fetched.items()}, ttl)
+                except Exception as e:
+                    logger.warning(f"Sender profile cache write failed: {e}")
+        
+        return profiles
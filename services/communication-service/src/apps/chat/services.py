@@ -23,6 +23,53 @@ class ChatService:
         
         return queryset.order_by('created_at')
     
+    @staticmethod
+    def get_message_page(ticket_id: str, before: Optional[str] = None, after: Optional[str] = None, limit: Optional[int] = None) -> dict:
+        """
+        Get one page of a ticket's chat history in chronological order.
+        
+        Without a cursor the newest `limit` messages are returned. `before`
+        scrolls back from a position; `after` returns the messages that
+        arrived since a position (catch-up after a reconnect). Both use the
+        (ticket_id, created_at) index, so cost does not grow with history.
+        
+        Returns:
+            Dictionary with 'results', 'before' (cursor for older messages,
+            None at the start of the history) and 'after' (cursor for
+            messages newer than this page)
+        
+        Raises:
+            InvalidCursor: If a cursor cannot be decoded
+            ValueError: If both `before` and `after` are given
+        """
+        from hdms_core.pagination import KeysetPaginator, decode_cursor, encode_cursor, NEXT, PREVIOUS
+        
+        if before and after:
+            raise ValueError("Use either 'before' or 'after', not both")
+        
+        # The parameter name decides the direction, whatever the cursor was issued as
+        cursor = None
+        if before or after:
+            position = decode_cursor(before or after)
+            cursor = encode_cursor(position['timestamp'], position['pk'], NEXT if before else PREVIOUS)
+        
+        queryset = ChatMessage.objects.filter(ticket_id=ticket_id, is_deleted=False)
+        page = KeysetPaginator(queryset, page_size=limit).paginate(cursor)
+        
+        # Paginator pages are newest-first; chat reads oldest-first
+        messages = list(reversed(page['results']))
+        if messages:
+            newest = messages[-1]
+            after_cursor = encode_cursor(newest.created_at, newest.id, PREVIOUS)
+        else:
+            after_cursor = after
+        
+        return {
+            'results': messages,
+            'before': page['next'],
+            'after': after_cursor,
+        }
+    
     @staticmethod
     @db_transaction.atomic
     def send_message(ticket_id: str, sender_id: str, message: str, mentions: List[str] = None) -> ChatMessage:
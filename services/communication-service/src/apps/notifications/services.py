@@ -35,7 +35,7 @@ class NotificationService:
     ) -> Notification:
         """Create a new notification."""
         # Lazy import to avoid Django settings access at module level
-        from core.clients.user_client import UserClient
+        from hdms_core.clients.user_client import UserClient
         
         # Validate user exists
         if not UserClient.validate_user(user_id):
@@ -130,20 +130,30 @@ ROOT_URLCONF = 'core.urls'
 ASGI_APPLICATION = 'core.asgi.application'
 WSGI_APPLICATION = 'core.wsgi.application'
 
+# Database connection profile (see hdms_core.db): none, persistent, pgbouncer or pool.
+# Under ASGI Django cannot reuse persistent per-thread connections, so this
+# service defaults to the psycopg pool.
+from hdms_core.db import database_settings
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': config('DB_NAME', default='hdms_db'),
-        'USER': config('DB_USER', default='hdms_user'),
-        'PASSWORD': config('DB_PASSWORD', default='hdms_pwd'),
-        'HOST': config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
-        'PORT': config('DB_PORT', default='6432'),  # PgBouncer port
-        'CONN_MAX_AGE': 0,
-        'OPTIONS': {
+    'default': database_settings(
+        config('DB_POOL_PROFILE', default='pool'),
+        conn_max_age=config('DB_CONN_MAX_AGE', default=600, cast=int),
+        pool_options={
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+        },
+        NAME=config('DB_NAME', default='hdms_db'),
+        USER=config('DB_USER', default='hdms_user'),
+        PASSWORD=config('DB_PASSWORD', default='hdms_pwd'),
+        HOST=config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
+        PORT=config('DB_PORT', default='6432'),  # PgBouncer port
+        OPTIONS={
             'connect_timeout': int(config('DB_CONNECT_TIMEOUT', default=20))
             # Note: 'options' parameter not supported by PgBouncer in transaction pooling mode
-        }
-    }
+        },
+    )
 }
 
 # Cache Configuration (Redis)
@@ -237,6 +247,9 @@ TICKET_SERVICE_URL = config('TICKET_SERVICE_URL', default='http://ticket-service
 COMMUNICATION_SERVICE_URL = config('COMMUNICATION_SERVICE_URL', default='http://communication-service:8003')
 FILE_SERVICE_URL = config('FILE_SERVICE_URL', default='http://file-service:8005')
 
+# Chat history: seconds a sender's display profile is cached (0 disables)
+CHAT_SENDER_PROFILE_TTL = config('CHAT_SENDER_PROFILE_TTL', default=60, cast=int)
+
 # Logging - use shared logging configuration
 LOGGING = get_logging_config()
 
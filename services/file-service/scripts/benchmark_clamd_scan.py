@@ -0,0 +1,86 @@
+"""
+Benchmark virus scanning of many small files (screenshot-sized).
+
+Scans FILES files of FILE_SIZE bytes three ways against clamd:
+    spawn    one process per file, like the clamdscan backend
+    connect  a new clamd connection per file
+    pool     ClamdScanner's persistent connections, CONCURRENCY scans
+             in flight from as many threads
+Reports files per second for each.
+
+Starts scripts/fake_clamd.py (with DELAY seconds of "engine" time per
+scan) unless CLAMD_ADDRESS is set in the environment, in which case that
+clamd is used. Files are written to a temporary directory and removed.
+
+Run this manually: python manage.py shell < scripts/benchmark_clamd_scan.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from apps.files.services.virus_scanner import ClamdScanner
+
+FILES = 300
+FILE_SIZE = 200 * 1024
+CONCURRENCY = 4
+DELAY = 0.002
+
+# What the clamdscan backend pays per file: a fresh process, connection and INSTREAM
+SPAWN_CLIENT = """
+import socket, struct, sys
+data = open(sys.argv[2], 'rb').read()
+address = sys.argv[1]
+if address.startswith('/'):
+    sock = socket.socket(socket.AF_UNIX); sock.connect(address)
+else:
+    host, _, port = address.rpartition(':'); sock = socket.create_connection((host, int(port)))
+sock.sendall(b'zINSTREAM\\0' + struct.pack('!L', len(data)) + data + struct.pack('!L', 0))
+sys.exit(0 if sock.recv(4096).rstrip(b'\\0').endswith(b'OK') else 1)
+"""
+
+
+def run(label, scan, paths, workers=1):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        results = list(executor.map(scan, paths))
+    elapsed = time.perf_counter() - started
+    print(f"{label:>8}: {len(paths) / elapsed:7.0f} files/s ({workers} in flight, {len(results)} scanned)")
+    return len(paths) / elapsed
+
+
+def main():
+    address = os.environ.get('CLAMD_ADDRESS')
+    server = None
+    with tempfile.TemporaryDirectory() as tmp:
+        if not address:
+            address = os.path.join(tmp, 'clamd.sock')
+            fake = settings.BASE_DIR.parent / 'scripts' / 'fake_clamd.py'
+            server = subprocess.Popen([sys.executable, str(fake), '--listen', address, '--delay', str(DELAY)],
+                                      stdout=subprocess.DEVNULL)
+            while not os.path.exists(address):
+                time.sleep(0.05)
+        try:
+            paths = []
+            for n in range(FILES):
+                path = os.path.join(tmp, f'screenshot-{n}.png')
+                with open(path, 'wb') as f:
+                    f.write(os.urandom(FILE_SIZE))
+                paths.append(path)
+
+            spawn = run('spawn', lambda path: subprocess.run(
+                [sys.executable, '-c', SPAWN_CLIENT, address, path], check=True), paths[:FILES // 5])
+            run('connect', lambda path: ClamdScanner(address, max_connections=1).scan_file(path), paths)
+            run('pool', ClamdScanner(address).scan_file, paths)
+            pooled = run('pool', ClamdScanner(address, max_connections=CONCURRENCY).scan_file, paths,
+                         workers=CONCURRENCY)
+            print(f"speedup over spawn: {pooled / spawn:.1f}x")
+        finally:
+            if server:
+                server.terminate()
+                server.wait()
+
+
+main()
@@ -0,0 +1,136 @@
+"""
+Fake clamd for tests and benchmarks.
+
+Speaks enough of the clamd protocol for apps.files.services.virus_scanner:
+PING, VERSION, INSTREAM, SCAN <path> and IDSESSION/END sessions, with
+'z' (NUL-terminated) or 'n' (newline-terminated) commands. A file is
+"infected" if it contains the EICAR test string; everything else is OK.
+--delay adds a fixed scan time to mimic a real engine.
+
+Run this manually:
+    python scripts/fake_clamd.py --listen 127.0.0.1:3310 [--delay 0.005]
+    python scripts/fake_clamd.py --listen /tmp/clamd.sock
+
+Then point the file service at it with CLAMD_ADDRESS.
+"""
+import argparse
+import os
+import socketserver
+import struct
+import time
+
+EICAR = b'X5O!P%@AP[4\\PZX54(P^)7CC)7}$EICAR-STANDARD-ANTIVIRUS-TEST-FILE!$H+H*'
+
+
+class ClamdHandler(socketserver.StreamRequestHandler):
+    delay = 0.0
+    stream_max_length = 25 * 1024 * 1024
+    idle_timeout = 30
+
+    def handle(self):
+        self.request.settimeout(self.idle_timeout)
+        self.session = False
+        self.request_id = 0
+        try:
+            while True:
+                command = self.read_command()
+                if command is None or command == b'END':
+                    return
+                if command == b'IDSESSION':
+                    self.session = True
+                    continue
+                self.request_id += 1
+                self.reply(self.run(command))
+                if not self.session:
+                    return
+        except (OSError, ValueError, struct.error):
+            return
+
+    def read_command(self):
+        first = self.rfile.read(1)
+        if not first:
+            return None
+        terminator = {b'z': b'\0', b'n': b'\n'}.get(first)
+        if terminator is None:
+            raise ValueError("Commands must start with 'z' or 'n'")
+        self.terminator = terminator
+        command = bytearray()
+        while True:
+            byte = self.rfile.read(1)
+            if not byte:
+                return None
+            if byte == terminator:
+                return bytes(command)
+            command += byte
+
+    def run(self, command):
+        if command == b'PING':
+            return 'PONG'
+        if command == b'VERSION':
+            return 'ClamAV 1.0.0/fake'
+        if command == b'INSTREAM':
+            data = bytearray()
+            while True:
+                (length,) = struct.unpack('!L', self.rfile.read(4))
+                if not length:
+                    break
+                data += self.rfile.read(length)
+                if len(data) > self.stream_max_length:
+                    return 'INSTREAM size limit exceeded. ERROR'
+            return 'stream: ' + self.verdict(data)
+        if command.startswith(b'SCAN '):
+            path = os.fsdecode(command[5:])
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError as e:
+                return f'{path}: {e.strerror}. ERROR'
+            return f'{path}: ' + self.verdict(data)
+        return 'UNKNOWN COMMAND'
+
+    def verdict(self, data):
+        if self.delay:
+            time.sleep(self.delay)
+        return 'Eicar-Test-Signature FOUND' if EICAR in data else 'OK'
+
+    def reply(self, text):
+        if self.session:
+            text = f'{self.request_id}: {text}'
+        self.wfile.write(text.encode() + self.terminator)
+
+
+class TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(listen, delay=0.0):
+    """Build (not start) a fake clamd on a unix socket path or host:port."""
+    handler = type('Handler', (ClamdHandler,), {'delay': delay})
+    if listen.startswith('/'):
+        if os.path.exists(listen):
+            os.remove(listen)
+        return UnixServer(listen, handler)
+    host, _, port = listen.rpartition(':')
+    return TCPServer((host, int(port)), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--listen', default='127.0.0.1:3310', help='host:port or unix socket path')
+    parser.add_argument('--delay', type=float, default=0.0, help='seconds added to every scan')
+    args = parser.parse_args()
+    server = make_server(args.listen, args.delay)
+    print(f'fake clamd listening on {args.listen}', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
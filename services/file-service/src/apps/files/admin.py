@@ -2,7 +2,7 @@
 Django admin configuration for File app.
 """
 from django.contrib import admin
-from .models import Attachment
+from .models import Attachment, Blob
 
 
 @admin.register(Attachment)
@@ -13,3 +13,13 @@ class AttachmentAdmin(admin.ModelAdmin):
     search_fields = ['file_key', 'original_filename', 'ticket_id', 'chat_message_id']
     ordering = ['-created_at']
     readonly_fields = ['file_key', 'scan_status', 'scanned_at', 'scan_result']
+
+
+@admin.register(Blob)
+class BlobAdmin(admin.ModelAdmin):
+    """Admin interface for Blob model."""
+    list_display = ['sha256', 'size', 'ref_count', 'scan_status', 'scan_attempts', 'is_processed', 'created_at']
+    list_filter = ['scan_status', 'is_processed', 'created_at']
+    search_fields = ['sha256']
+    ordering = ['-created_at']
+    readonly_fields = ['sha256', 'size', 'file_path', 'ref_count', 'scan_status', 'scanned_at', 'scan_result', 'scan_attempts', 'scan_retry_at']
@@ -2,10 +2,15 @@ import os
 from ninja import Router
 from ninja.errors import HttpError
 from typing import List, Optional
+from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import UploadedFile
-from apps.files.schemas import AttachmentOut, FileUploadResponse
-from apps.files.models import Attachment
+from apps.files.schemas import (
+    AttachmentOut, FileUploadResponse, ChunkedUploadIn, ChunkedUploadOut, UploadChunkOut,
+)
+from apps.files.models import Attachment, ScanStatus
 from apps.files.services.upload_service import UploadService
+from apps.files.services.chunked_upload_service import ChunkedUploadService
+from apps.files.services.download_service import DownloadService
 from hdms_core.clients.user_client import UserClient
 from hdms_core.clients.ticket_client import TicketClient
 from hdms_core.authentication import RemoteJWTAuthentication
@@ -50,12 +55,119 @@ def upload_file(request, ticket_id: Optional[str] = None, chat_message_id: Optio
     )
     
     # Construct URL for response
+    result['url'] = _download_url(result['file_key'])
+    
+    return result
+
+
+def _download_url(file_key: str) -> str:
     gateway_url = os.environ.get('PUBLIC_GATEWAY_URL', 'http://localhost')
-    result['url'] = f"{gateway_url}/api/v1/files/{result['file_key']}/download"
+    return f"{gateway_url}/api/v1/files/{file_key}/download"
+
+
+def _get_upload(request, upload_id: str) -> Attachment:
+    """The caller's chunked upload; only the authenticated user who started it may touch it."""
+    caller_id = request.user.id if hasattr(request, 'user') else None
+    if not caller_id:
+        raise HttpError(401, "User not authenticated")
+    try:
+        attachment = Attachment.objects.get(id=upload_id, upload_chunk_size__isnull=False)
+    except (Attachment.DoesNotExist, ValueError, ValidationError):
+        raise HttpError(404, f"Upload {upload_id} not found")
+    # Someone else's upload is reported as missing rather than forbidden
+    if str(attachment.uploaded_by_id) != str(caller_id):
+        raise HttpError(404, f"Upload {upload_id} not found")
+    return attachment
+
+
+def _upload_state(attachment: Attachment) -> dict:
+    service = ChunkedUploadService()
+    uploading = attachment.scan_status == ScanStatus.UPLOADING
+    return {
+        'id': str(attachment.id),
+        'file_key': str(attachment.file_key),
+        'filename': attachment.original_filename,
+        'size': attachment.file_size,
+        'scan_status': attachment.scan_status,
+        'chunk_size': attachment.upload_chunk_size,
+        'total_chunks': service.total_chunks(attachment),
+        'missing_chunks': service.missing_chunks(attachment) if uploading else [],
+    }
+
+
+@router.post("/uploads", response={201: ChunkedUploadOut}, auth=RemoteJWTAuthentication())
+def initiate_upload(request, payload: ChunkedUploadIn):
+    """Start a chunked, resumable upload (see services.chunked_upload_service)."""
+    if payload.ticket_id:
+        ticket_client = TicketClient()
+        if not ticket_client.validate_ticket(payload.ticket_id):
+            raise HttpError(404, "Ticket not found")
     
+    # Chunk, complete and abort check ownership against the token, so the upload belongs to its user
+    final_uploader_id = request.user.id if hasattr(request, 'user') else None
+    if not final_uploader_id:
+        raise HttpError(401, "User not authenticated")
+    
+    try:
+        attachment = ChunkedUploadService().initiate(
+            filename=payload.filename,
+            size=payload.size,
+            content_type=payload.content_type,
+            uploaded_by_id=str(final_uploader_id),
+            ticket_id=payload.ticket_id,
+            chat_message_id=payload.chat_message_id,
+            category=payload.category or 'general',
+        )
+    except ValueError as e:
+        raise HttpError(400, str(e))
+    return 201, _upload_state(attachment)
+
+
+@router.get("/uploads/{upload_id}", response=ChunkedUploadOut, auth=RemoteJWTAuthentication())
+def get_upload(request, upload_id: str):
+    """Get a chunked upload's progress, including the chunks still missing."""
+    return _upload_state(_get_upload(request, upload_id))
+
+
+@router.put("/uploads/{upload_id}", response=UploadChunkOut, auth=RemoteJWTAuthentication())
+def upload_chunk(request, upload_id: str, offset: int):
+    """Upload one chunk as the raw body; X-Chunk-SHA256 carries its hex digest."""
+    attachment = _get_upload(request, upload_id)
+    sha256 = request.headers.get('X-Chunk-SHA256')
+    if not sha256:
+        raise HttpError(400, "X-Chunk-SHA256 header is required")
+    try:
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+        # Read the body as a stream; request.body would buffer the whole chunk
+        chunk = ChunkedUploadService().write_chunk(attachment, offset, request, length, sha256)
+    except ValueError as e:
+        raise HttpError(400, str(e))
+    return {'index': chunk.index, 'offset': offset, 'size': chunk.size, 'sha256': chunk.sha256}
+
+
+@router.post("/uploads/{upload_id}/complete", response=FileUploadResponse, auth=RemoteJWTAuthentication())
+def complete_upload(request, upload_id: str, sha256: Optional[str] = None):
+    """Finish a chunked upload and start the virus scan; `sha256` is checked against the whole file."""
+    attachment = _get_upload(request, upload_id)
+    try:
+        result = ChunkedUploadService().complete(str(attachment.id), sha256=sha256)
+    except ValueError as e:
+        raise HttpError(400, str(e))
+    result['url'] = _download_url(result['file_key'])
     return result
 
 
+@router.delete("/uploads/{upload_id}", response={204: None}, auth=RemoteJWTAuthentication())
+def abort_upload(request, upload_id: str):
+    """Discard an unfinished chunked upload."""
+    attachment = _get_upload(request, upload_id)
+    try:
+        ChunkedUploadService().abort(attachment)
+    except ValueError as e:
+        raise HttpError(400, str(e))
+    return 204, None
+
+
 @router.get("/{file_id_or_key}/status", response=AttachmentOut)
 def get_file_status(request, file_id_or_key: str):
     """Get file scan/processing status."""
@@ -76,8 +188,8 @@ def get_file_status(request, file_id_or_key: str):
 
 
 @router.get("/{file_id_or_key}/download")
-def download_file(request, file_id_or_key: str):
-    """Download file."""
+def download_file(request, file_id_or_key: str, variant: Optional[str] = None):
+    """Download file, or one of its image variants (thumb, preview, full)."""
     print(f"DEBUG: download_file for {file_id_or_key}", flush=True)
     try:
         try:
@@ -90,12 +202,12 @@ def download_file(request, file_id_or_key: str):
     if attachment.scan_status != 'clean':
         raise HttpError(400, f"File {file_id_or_key} not available for download (Status: {attachment.scan_status})")
 
-    from django.http import FileResponse
-    return FileResponse(
-        open(attachment.file_path, 'rb'),
-        as_attachment=True,
-        filename=attachment.original_filename
-    )
+    try:
+        return DownloadService().build_response(request, attachment, variant)
+    except ValueError as e:
+        raise HttpError(400, str(e))
+    except LookupError as e:
+        raise HttpError(404, str(e))
 
 
 @router.get("/{file_id_or_key}", response=AttachmentOut)
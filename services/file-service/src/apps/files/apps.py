@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class FilesConfig(AppConfig):
+    name = 'apps.files'
+    label = 'files'
+
+    def ready(self):
+        # Scan queueing for new attachments and blob reference release
+        from . import signals  # noqa: F401
@@ -0,0 +1,45 @@
+# Generated by Django 5.0.1 on 2026-10-17 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0002_attachment_category'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attachment',
+            name='upload_chunk_size',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='attachment',
+            name='scan_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('clean', 'Clean'), ('infected', 'Infected'), ('failed', 'Scan Failed'), ('uploading', 'Uploading')], db_index=True, default='pending', max_length=20),
+        ),
+        migrations.CreateModel(
+            name='UploadChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveIntegerField()),
+                ('size', models.PositiveIntegerField()),
+                ('sha256', models.CharField(max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('attachment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_chunks', to='files.attachment')),
+            ],
+            options={
+                'verbose_name': 'Upload Chunk',
+                'verbose_name_plural': 'Upload Chunks',
+                'db_table': 'upload_chunks',
+                'ordering': ['index'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='uploadchunk',
+            constraint=models.UniqueConstraint(fields=('attachment', 'index'), name='upload_chunk_unique_index'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-17 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0004_blobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blob',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
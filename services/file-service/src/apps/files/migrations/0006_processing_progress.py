@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-17 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0005_blob_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attachment',
+            name='processing_progress',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='blob',
+            name='processing_progress',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-17 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0006_processing_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blob',
+            name='scan_attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='blob',
+            name='scan_retry_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
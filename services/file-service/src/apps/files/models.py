@@ -12,6 +12,48 @@ class ScanStatus(models.TextChoices):
     CLEAN = 'clean', 'Clean'
     INFECTED = 'infected', 'Infected'
     FAILED = 'failed', 'Scan Failed'
+    UPLOADING = 'uploading', 'Uploading'  # Chunked upload not completed yet
+
+
+class Blob(models.Model):
+    """
+    Content-addressed file shared by every Attachment with the same bytes
+    (see services.blob_store). Scan and processing results live here, so
+    a duplicate upload of a known-clean file is neither rescanned nor
+    reprocessed.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)  # Of the uploaded bytes
+    size = models.BigIntegerField()
+    file_path = models.CharField(max_length=1000)  # Served file (the processed one once processed)
+    file_extension = models.CharField(max_length=20)
+    ref_count = models.PositiveIntegerField(default=0)
+    
+    scan_status = models.CharField(max_length=20, choices=ScanStatus.choices, default=ScanStatus.PENDING, db_index=True)
+    scan_result = models.TextField(blank=True)
+    scanned_at = models.DateTimeField(null=True, blank=True)
+    # Scans re-enqueued after being lost or failing (see tasks.reconcile_scans_task)
+    scan_attempts = models.PositiveSmallIntegerField(default=0)
+    scan_retry_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    
+    is_processed = models.BooleanField(default=False)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    processing_progress = models.PositiveSmallIntegerField(null=True, blank=True)  # Percent, while transcoding
+    # Transcodes that failed or stalled, retried with backoff (see tasks.reconcile_transcodes_task)
+    transcode_attempts = models.PositiveSmallIntegerField(default=0)
+    transcode_retry_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    # Image variants: {name: {'path', 'width', 'height', 'size'}} (see services.image_variants)
+    variants = models.JSONField(default=dict, blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'blobs'
+        verbose_name = 'Blob'
+        verbose_name_plural = 'Blobs'
+    
+    def __str__(self):
+        return f"{self.sha256} ({self.ref_count} refs)"
 
 
 class Attachment(BaseModel):
@@ -30,6 +72,8 @@ class Attachment(BaseModel):
     
     # Storage
     file_path = models.CharField(max_length=1000, blank=True)  # Only set after scan passes
+    upload_chunk_size = models.PositiveIntegerField(null=True, blank=True)  # Set for chunked uploads
+    blob = models.ForeignKey(Blob, null=True, blank=True, on_delete=models.PROTECT, related_name='attachments')  # Null until stored
     
     # Security & Processing
     scan_status = models.CharField(max_length=20, choices=ScanStatus.choices, default=ScanStatus.PENDING, db_index=True)
@@ -38,6 +82,7 @@ class Attachment(BaseModel):
     
     is_processed = models.BooleanField(default=False)
     processed_at = models.DateTimeField(null=True, blank=True)
+    processing_progress = models.PositiveSmallIntegerField(null=True, blank=True)  # Percent, while transcoding
     
     # Relationships (UUID references)
     category = models.CharField(max_length=50, default='general', db_index=True, help_text="Collection/Folder name (e.g., resumes, tickets)")
@@ -61,6 +106,11 @@ class Attachment(BaseModel):
     def __str__(self):
         return f"{self.original_filename} ({self.file_key})"
     
+    @property
+    def variants(self):
+        """Names of the image variants that can be downloaded."""
+        return sorted(self.blob.variants) if self.blob_id else []
+    
     def clean(self):
         """Validate that attachment belongs to a context or category."""
         from django.core.exceptions import ValidationError
@@ -72,3 +122,24 @@ class Attachment(BaseModel):
             raise ValidationError("Attachment must belong to either a ticket, chat message, or a non-general category")
         if self.ticket_id and self.chat_message_id:
             raise ValidationError("Attachment cannot belong to both ticket and chat message")
+
+
+class UploadChunk(models.Model):
+    """
+    A chunk received for a chunked upload (see ChunkedUploadService).
+    Chunk `index` covers bytes [index * chunk_size, index * chunk_size + size).
+    """
+    attachment = models.ForeignKey(Attachment, on_delete=models.CASCADE, related_name='upload_chunks')
+    index = models.PositiveIntegerField()
+    size = models.PositiveIntegerField()
+    sha256 = models.CharField(max_length=64)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'upload_chunks'
+        verbose_name = 'Upload Chunk'
+        verbose_name_plural = 'Upload Chunks'
+        constraints = [
+            models.UniqueConstraint(fields=['attachment', 'index'], name='upload_chunk_unique_index'),
+        ]
+        ordering = ['index']
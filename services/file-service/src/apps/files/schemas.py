@@ -2,7 +2,7 @@
 Pydantic schemas for File Service.
 """
 from ninja import Schema
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
@@ -20,10 +20,12 @@ class AttachmentOut(Schema):
     scanned_at: Optional[datetime]
     is_processed: bool
     processed_at: Optional[datetime]
+    processing_progress: Optional[int] = None  # Percent, while a video is transcoding
     ticket_id: Optional[UUID]
     chat_message_id: Optional[UUID]
     uploaded_by_id: UUID
     created_at: datetime
+    variants: List[str] = []  # Image variants for ?variant= downloads
 
 
 class FileUploadResponse(Schema):
@@ -38,3 +40,32 @@ class FileUploadResponse(Schema):
     content_type: str
 
 
+class ChunkedUploadIn(Schema):
+    """Chunked upload initiation schema."""
+    filename: str
+    size: int
+    content_type: Optional[str] = None
+    category: Optional[str] = None
+    ticket_id: Optional[str] = None
+    chat_message_id: Optional[str] = None
+
+
+class ChunkedUploadOut(Schema):
+    """Chunked upload state schema."""
+    id: str
+    file_key: str
+    filename: str
+    size: int
+    scan_status: str
+    chunk_size: int
+    total_chunks: int
+    missing_chunks: List[int]
+
+
+class UploadChunkOut(Schema):
+    """Received chunk schema."""
+    index: int
+    offset: int
+    size: int
+    sha256: str
+
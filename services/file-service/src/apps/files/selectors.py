@@ -1,7 +1,11 @@
 """
 Optimized query selectors for File app.
 """
-from .models import Attachment, ScanStatus
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+from .models import Attachment, Blob, ScanStatus
 
 
 class FileSelector:
@@ -22,5 +26,51 @@ class FileSelector:
             scan_status=ScanStatus.PENDING,
             is_deleted=False
         )
-
-
+    
+    @staticmethod
+    def get_scans_to_retry():
+        """
+        Get Blobs whose scan was lost or failed and is due again, oldest first.
+        
+        A scan counts as lost once the Blob has been pending without a
+        retry for FILE_SCAN_RETRY_AFTER seconds; after a retry, once its
+        scan_retry_at has passed. Blobs that used up FILE_SCAN_MAX_ATTEMPTS
+        are left alone. Each Blob is annotated with `attachment_id`, a live
+        attachment to scan it through.
+        """
+        now = timezone.now()
+        stale = now - timedelta(seconds=settings.FILE_SCAN_RETRY_AFTER)
+        first_attachment = Attachment.objects.filter(
+            blob=OuterRef('pk'),
+            is_deleted=False
+        ).order_by('created_at').values('id')[:1]
+        return Blob.objects.filter(
+            scan_status__in=(ScanStatus.PENDING, ScanStatus.FAILED),
+            scan_attempts__lt=settings.FILE_SCAN_MAX_ATTEMPTS
+        ).filter(
+            Q(scan_retry_at__isnull=True, updated_at__lt=stale) | Q(scan_retry_at__lte=now)
+        ).annotate(
+            attachment_id=Subquery(first_attachment)
+        ).exclude(attachment_id=None).order_by('updated_at')
+    
+    @staticmethod
+    def get_transcodes_to_retry():
+        """
+        Get Blobs whose failed or stalled transcode is due again, oldest first.
+        
+        Blobs that used up VIDEO_TRANSCODE_MAX_ATTEMPTS have no
+        transcode_retry_at and are left alone. Each Blob is annotated with
+        `attachment_id`, a live attachment to transcode it through.
+        """
+        first_attachment = Attachment.objects.filter(
+            blob=OuterRef('pk'),
+            is_deleted=False
+        ).order_by('created_at').values('id')[:1]
+        return Blob.objects.filter(
+            scan_status=ScanStatus.CLEAN,
+            is_processed=False,
+            processing_progress__isnull=True,
+            transcode_retry_at__lte=timezone.now()
+        ).annotate(
+            attachment_id=Subquery(first_attachment)
+        ).exclude(attachment_id=None).order_by('transcode_retry_at')
@@ -0,0 +1,167 @@
+"""
+Content-addressed, deduplicating storage for attachments.
+
+Uploads are hashed (SHA-256) while they are written to a temporary file.
+The file then becomes a Blob at MEDIA_ROOT/blobs/<aa>/<bb>/<sha256><ext>,
+or, when a Blob with that hash already exists, the temporary file is
+dropped and the existing Blob gains a reference. Every Attachment points
+at its Blob and mirrors the Blob's scan and processing state:
+
+- A duplicate of a clean file is clean at once; no scan, no processing.
+- A duplicate of an infected file is infected at once.
+- A duplicate of a file still being scanned waits for that scan; the
+  result is copied to every Attachment of the Blob.
+
+Blob files are deleted when the last Attachment referencing them is
+deleted. Soft-deleted attachments keep their reference.
+"""
+import hashlib
+import os
+import uuid
+from typing import Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.files.models import Attachment, Blob, ScanStatus
+from apps.files.services.image_variants import variant_files
+from apps.files.services.virus_scanner import ScanResult
+
+
+def _remove_files(paths) -> None:
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class BlobStore:
+    """Stores attachment files once per distinct content."""
+
+    ROOT_DIR = 'blobs'
+    READ_SIZE = 1024 * 1024
+
+    @classmethod
+    def temp_path(cls) -> str:
+        """Fresh path for an upload being written and hashed."""
+        path = os.path.join(settings.MEDIA_ROOT, cls.ROOT_DIR, 'tmp', uuid.uuid4().hex)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    @classmethod
+    def blob_path(cls, sha256: str, extension: str) -> str:
+        return os.path.join(settings.MEDIA_ROOT, cls.ROOT_DIR, sha256[:2], sha256[2:4], f"{sha256}{extension}")
+
+    @classmethod
+    def hash_file(cls, path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for data in iter(lambda: f.read(cls.READ_SIZE), b''):
+                digest.update(data)
+        return digest.hexdigest()
+
+    @classmethod
+    def ingest(cls, path: str, sha256: str, size: int, extension: str) -> Tuple[Blob, bool]:
+        """
+        Take ownership of the file at `path` (already hashed to `sha256`)
+        and add one reference to its Blob.
+
+        Returns (blob, created). When the content was already stored the
+        file at `path` is removed.
+        """
+        with transaction.atomic():
+            blob = Blob.objects.select_for_update().filter(sha256=sha256).first()
+            if blob is None:
+                blob_path = cls.blob_path(sha256, extension)
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                os.replace(path, blob_path)
+                try:
+                    with transaction.atomic():
+                        return Blob.objects.create(
+                            sha256=sha256, size=size, file_path=blob_path,
+                            file_extension=extension, ref_count=1,
+                        ), True
+                except IntegrityError:
+                    # Stored concurrently by another upload with the same bytes
+                    blob = Blob.objects.select_for_update().get(sha256=sha256)
+                    if blob.file_path != blob_path and os.path.exists(blob_path):
+                        os.remove(blob_path)
+            elif os.path.exists(path):
+                os.remove(path)
+
+            blob.ref_count = F('ref_count') + 1
+            update_fields = ['ref_count', 'updated_at']
+            if blob.scan_status == ScanStatus.FAILED:
+                # Give the failed scan another go with this upload
+                blob.scan_status = ScanStatus.PENDING
+                blob.scan_attempts = 0
+                blob.scan_retry_at = None
+                update_fields += ['scan_status', 'scan_attempts', 'scan_retry_at']
+            blob.save(update_fields=update_fields)
+            blob.refresh_from_db()
+            return blob, False
+
+    @classmethod
+    def adopt(cls, attachment: Attachment) -> Blob:
+        """Move a file stored before deduplication into the blob store."""
+        sha256 = cls.hash_file(attachment.file_path)
+        blob, _ = cls.ingest(attachment.file_path, sha256, attachment.file_size, attachment.file_extension)
+        attachment.blob = blob
+        attachment.file_path = blob.file_path
+        attachment.save(update_fields=['blob', 'file_path', 'updated_at'])
+        return blob
+
+    @staticmethod
+    def record_scan(blob: Blob, result: ScanResult) -> None:
+        """Store a scan verdict on the Blob; infected content is deleted."""
+        blob.scan_status = ScanStatus.INFECTED if result.infected else ScanStatus.CLEAN
+        blob.scan_result = result.detail
+        blob.scanned_at = timezone.now()
+        blob.scan_attempts = 0
+        blob.scan_retry_at = None
+        if result.infected and os.path.exists(blob.file_path):
+            os.remove(blob.file_path)
+        blob.save()
+
+    @staticmethod
+    def attachment_fields(blob: Blob) -> dict:
+        """Attachment fields that mirror the Blob's state."""
+        fields = {
+            'file_path': blob.file_path,
+            'scan_status': blob.scan_status,
+            'scan_result': blob.scan_result,
+            'scanned_at': blob.scanned_at,
+            'is_processed': blob.is_processed,
+            'processed_at': blob.processed_at,
+            'processing_progress': blob.processing_progress,
+        }
+        if blob.is_processed:
+            fields['file_extension'] = blob.file_extension
+        return fields
+
+    @classmethod
+    def sync_attachments(cls, blob: Blob) -> int:
+        """Copy the Blob's scan/processing state to all its attachments."""
+        return Attachment.objects.with_deleted().filter(blob=blob).update(**cls.attachment_fields(blob))
+
+    @staticmethod
+    def release(blob_id: int) -> None:
+        """Drop one reference; the last one deletes the Blob and its files."""
+        with transaction.atomic():
+            blob = Blob.objects.select_for_update().filter(id=blob_id).first()
+            if blob is None:
+                return
+            if blob.ref_count > 1:
+                blob.ref_count = F('ref_count') - 1
+                blob.save(update_fields=['ref_count', 'updated_at'])
+                return
+            remaining = Attachment.objects.with_deleted().filter(blob_id=blob_id).count()
+            if remaining:
+                # References were miscounted; trust the attachments and keep the file
+                blob.ref_count = remaining
+                blob.save(update_fields=['ref_count', 'updated_at'])
+                return
+            paths = {blob.file_path} | variant_files(blob.variants)
+            blob.delete()
+            transaction.on_commit(lambda: _remove_files(paths))
@@ -0,0 +1,251 @@
+"""
+Chunked, resumable file uploads.
+
+Protocol:
+1. POST /files/uploads with the file name and size creates an Attachment
+   in the `uploading` state and a sparse part file of the final size.
+   The response gives the chunk size and the number of chunks.
+2. PUT /files/uploads/{id}?offset=N sends one chunk as the raw request
+   body, with its SHA-256 (hex) in the X-Chunk-SHA256 header. N must be a
+   multiple of the chunk size. Chunks may arrive in any order and in
+   parallel; a failed chunk is simply sent again.
+3. GET /files/uploads/{id} lists the chunks still missing, for resuming.
+4. POST /files/uploads/{id}/complete checks that every chunk arrived,
+   hands the file to the blob store and starts the virus scan, exactly
+   as a single-request upload does.
+
+Chunk bodies are streamed straight to their offset in the part file, so
+no chunk is ever held in memory whole. Uploads that receive no chunk for
+UPLOAD_EXPIRE_AFTER are discarded by tasks.expire_uploads_task.
+"""
+import hashlib
+import os
+import time
+import uuid
+from datetime import timedelta
+from typing import BinaryIO, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.files.models import Attachment, ScanStatus, UploadChunk
+from apps.files.services.blob_store import BlobStore
+from apps.files.services.upload_service import UploadService
+from apps.files.tasks import scan_file_task
+
+
+class ChunkedUploadService:
+    """Service for chunked, resumable uploads."""
+
+    READ_SIZE = 64 * 1024
+    PART_DIR = '.uploads'
+    GONE_MESSAGE = "Upload was aborted or has expired"
+
+    def initiate(self, filename: str, size: int, uploaded_by_id: str, content_type: Optional[str] = None,
+                 ticket_id: str = None, chat_message_id: str = None, category: str = 'general') -> Attachment:
+        """
+        Start a chunked upload.
+
+        Raises:
+            ValueError: If the file is empty, too large or of a disallowed type
+        """
+        if size <= 0:
+            raise ValueError("File size must be positive")
+        file_ext = UploadService().validate(filename, size)
+
+        file_key = uuid.uuid4()
+        part_path = os.path.join(settings.MEDIA_ROOT, self.PART_DIR, f"{file_key}.part")
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+        with open(part_path, 'wb') as part:
+            # Sparse file of the final size; chunks are written in place
+            part.truncate(size)
+
+        return Attachment.objects.create(
+            file_key=file_key,
+            category=category or 'general',
+            original_filename=filename,
+            file_size=size,
+            mime_type=content_type or 'application/octet-stream',
+            file_extension=file_ext,
+            file_path=part_path,
+            upload_chunk_size=settings.UPLOAD_CHUNK_SIZE,
+            scan_status=ScanStatus.UPLOADING,
+            ticket_id=ticket_id,
+            chat_message_id=chat_message_id,
+            uploaded_by_id=uploaded_by_id,
+        )
+
+    @staticmethod
+    def total_chunks(attachment: Attachment) -> int:
+        return -(-attachment.file_size // attachment.upload_chunk_size)
+
+    def missing_chunks(self, attachment: Attachment) -> List[int]:
+        """Indexes of the chunks not received yet."""
+        received = set(attachment.upload_chunks.values_list('index', flat=True))
+        return [index for index in range(self.total_chunks(attachment)) if index not in received]
+
+    def write_chunk(self, attachment: Attachment, offset: int, body: BinaryIO, length: int, sha256: str) -> UploadChunk:
+        """
+        Stream one chunk from `body` into the part file at `offset`.
+
+        The attachment row is locked only to check the upload is still in
+        progress, before streaming and again before recording the chunk, so
+        chunks still stream in parallel while complete() and abort() cannot
+        interleave with either step.
+
+        Raises:
+            ValueError: If the upload is not in progress (or was aborted or
+                expired meanwhile), the offset or length is wrong, the body
+                ends early or the checksum does not match
+        """
+        chunk_size = attachment.upload_chunk_size
+        if offset < 0 or offset >= attachment.file_size or offset % chunk_size:
+            raise ValueError(f"Offset must be a multiple of {chunk_size} below {attachment.file_size}")
+        index = offset // chunk_size
+        expected = min(chunk_size, attachment.file_size - offset)
+        if length != expected:
+            raise ValueError(f"Chunk {index} must be {expected} bytes, got {length}")
+
+        with transaction.atomic():
+            attachment = self._lock_uploading(attachment.id)
+            # Until the new bytes are verified the chunk counts as missing
+            UploadChunk.objects.filter(attachment=attachment, index=index).delete()
+
+        digest = hashlib.sha256()
+        remaining = expected
+        try:
+            with open(attachment.file_path, 'r+b') as part:
+                part.seek(offset)
+                while remaining:
+                    data = body.read(min(self.READ_SIZE, remaining))
+                    if not data:
+                        break
+                    part.write(data)
+                    digest.update(data)
+                    remaining -= len(data)
+        except FileNotFoundError:
+            # abort() or expiry removed the part file since the check above
+            raise ValueError(self.GONE_MESSAGE)
+        if remaining:
+            raise ValueError(f"Chunk {index} ended {remaining} bytes early")
+        if digest.hexdigest() != sha256.strip().lower():
+            raise ValueError(f"Checksum mismatch for chunk {index}")
+
+        with transaction.atomic():
+            attachment = self._lock_uploading(attachment.id)
+            chunk = UploadChunk(attachment=attachment, index=index, size=expected, sha256=digest.hexdigest())
+            # Upsert: a retried chunk may race with its own earlier attempt
+            UploadChunk.objects.bulk_create(
+                [chunk],
+                update_conflicts=True,
+                unique_fields=['attachment', 'index'],
+                update_fields=['size', 'sha256'],
+            )
+        return chunk
+
+    def complete(self, attachment_id: str, sha256: Optional[str] = None) -> dict:
+        """
+        Finish a chunked upload and trigger the scan.
+
+        `sha256`, if given, is checked against the assembled file.
+
+        Raises:
+            ValueError: If chunks are missing or the file checksum does not match
+        """
+        with transaction.atomic():
+            attachment = Attachment.objects.select_for_update().get(id=attachment_id)
+            self._check_uploading(attachment)
+            missing = self.missing_chunks(attachment)
+            if missing:
+                raise ValueError(f"{len(missing)} chunks missing, first: {missing[:20]}")
+            digest = BlobStore.hash_file(attachment.file_path)
+            if sha256 and digest != sha256.strip().lower():
+                raise ValueError("Checksum mismatch for assembled file")
+
+            # Identical content is stored once; a known verdict is reused
+            blob, _ = BlobStore.ingest(attachment.file_path, digest, attachment.file_size, attachment.file_extension)
+            attachment.blob = blob
+            for field, value in BlobStore.attachment_fields(blob).items():
+                setattr(attachment, field, value)
+            attachment.save()
+            attachment.upload_chunks.all().delete()
+            if attachment.scan_status == ScanStatus.PENDING:
+                attachment_id = str(attachment.id)
+                transaction.on_commit(lambda: scan_file_task.delay(attachment_id))
+
+        return {
+            'id': str(attachment.id),
+            'file_key': str(attachment.file_key),
+            'message': UploadService.STATUS_MESSAGES.get(
+                attachment.scan_status, UploadService.STATUS_MESSAGES[ScanStatus.PENDING]
+            ),
+            'scan_status': attachment.scan_status,
+            'filename': attachment.original_filename,
+            'size': attachment.file_size,
+            'content_type': attachment.mime_type
+        }
+
+    def abort(self, attachment: Attachment) -> None:
+        """Discard an unfinished upload and its part file."""
+        with transaction.atomic():
+            # Waits for a complete() or chunk being recorded on the same upload
+            attachment = self._lock_uploading(attachment.id)
+            if os.path.exists(attachment.file_path):
+                os.remove(attachment.file_path)
+            attachment.delete()
+
+    def expire(self, max_age: int, batch_size: int = 500) -> int:
+        """
+        Discard uploads with no chunk received for `max_age` seconds, and
+        part files older than that which no upload refers to.
+
+        Returns the number of uploads discarded.
+        """
+        cutoff = timezone.now() - timedelta(seconds=max_age)
+        stale = Attachment.objects.filter(
+            scan_status=ScanStatus.UPLOADING, created_at__lt=cutoff
+        ).exclude(upload_chunks__created_at__gte=cutoff)
+
+        expired = 0
+        while True:
+            with transaction.atomic():
+                # Skip uploads being completed right now (complete() holds their row lock)
+                batch = list(stale.select_for_update(skip_locked=True).order_by('created_at')[:batch_size])
+                for attachment in batch:
+                    self.abort(attachment)
+            expired += len(batch)
+            if len(batch) < batch_size:
+                break
+
+        part_dir = os.path.join(settings.MEDIA_ROOT, self.PART_DIR)
+        if os.path.isdir(part_dir):
+            uploading = {
+                f"{file_key}.part"
+                for file_key in Attachment.objects.filter(scan_status=ScanStatus.UPLOADING).values_list('file_key', flat=True)
+            }
+            oldest = time.time() - max_age
+            with os.scandir(part_dir) as entries:
+                for entry in entries:
+                    if entry.name in uploading or not entry.is_file():
+                        continue
+                    try:
+                        if entry.stat().st_mtime < oldest:
+                            os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
+        return expired
+
+    @classmethod
+    def _lock_uploading(cls, attachment_id) -> Attachment:
+        """Lock the upload's row (inside a transaction) and check it is still in progress."""
+        attachment = Attachment.objects.select_for_update().filter(id=attachment_id).first()
+        if attachment is None:
+            raise ValueError(cls.GONE_MESSAGE)
+        cls._check_uploading(attachment)
+        return attachment
+
+    @staticmethod
+    def _check_uploading(attachment: Attachment) -> None:
+        if attachment.scan_status != ScanStatus.UPLOADING:
+            raise ValueError(f"Upload already completed (Status: {attachment.scan_status})")
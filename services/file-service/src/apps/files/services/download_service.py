@@ -0,0 +1,178 @@
+"""
+File download responses.
+
+Two modes, chosen by FILE_DOWNLOAD_MODE:
+
+- 'accel': Django only authorizes the download and answers with an
+  X-Accel-Redirect header; nginx serves the file from its internal
+  /protected-media/ location with sendfile, handling Range and ETag
+  itself. No file bytes pass through a Python worker.
+- 'direct': Django serves the file itself (no nginx in front, local
+  development). Responses carry an ETag and Last-Modified, answer
+  conditional requests with 304 and single byte ranges with 206, and
+  stay eligible for the WSGI server's sendfile path.
+
+Files outside MEDIA_ROOT are always served directly.
+
+Images can be downloaded as one of their WEBP variants ('thumb',
+'preview', 'full'; see services.image_variants) once processed, and
+videos as their 'poster' frame.
+"""
+import os
+import re
+from typing import Optional
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date
+
+from apps.files.models import Attachment
+from apps.files.services.image_variants import VARIANT_NAMES
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class _FileRange:
+    """
+    File object limited to one byte range. It keeps fileno() so gunicorn
+    can still sendfile() it; Content-Length bounds what is sent.
+    """
+
+    def __init__(self, file, start: int, length: int):
+        file.seek(start)
+        self._file = file
+        self._remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size) if size else b''
+        self._remaining -= len(data)
+        return data
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _Download:
+    """What to send: a file, its type, the client-facing name and a cache tag."""
+
+    def __init__(self, path: str, content_type: str, filename: str, tag: str):
+        self.path = path
+        self.content_type = content_type
+        self.filename = filename
+        self.tag = tag
+
+
+class DownloadService:
+    """Builds download responses for attachments."""
+
+    def build_response(self, request, attachment: Attachment, variant: Optional[str] = None) -> HttpResponse:
+        """
+        Return the download response for a clean attachment.
+
+        Raises:
+            ValueError: If `variant` is not a variant name
+            LookupError: If the attachment has no such variant (yet)
+        """
+        download = self._resolve(attachment, variant)
+        relative = self._media_relative_path(download.path)
+        if settings.FILE_DOWNLOAD_MODE == 'accel' and relative is not None:
+            return self._accel_response(download, relative)
+        return self._direct_response(request, download)
+
+    @staticmethod
+    def _resolve(attachment: Attachment, variant: Optional[str]) -> _Download:
+        if variant is None:
+            return _Download(attachment.file_path, attachment.mime_type, attachment.original_filename,
+                             attachment.file_key.hex)
+        if variant not in VARIANT_NAMES:
+            raise ValueError(f"Unknown variant '{variant}'. Choose from: {', '.join(VARIANT_NAMES)}")
+        variants = attachment.blob.variants if attachment.blob_id else {}
+        if variant not in variants:
+            raise LookupError(f"No {variant} variant for this file")
+        stem = os.path.splitext(attachment.original_filename)[0]
+        return _Download(variants[variant]['path'], 'image/webp', f"{stem}-{variant}.webp",
+                         f"{attachment.file_key.hex}-{variant}")
+
+    @staticmethod
+    def _media_relative_path(path: str) -> Optional[str]:
+        media_root = os.path.realpath(settings.MEDIA_ROOT)
+        real_path = os.path.realpath(path)
+        if os.path.commonpath([media_root, real_path]) != media_root:
+            return None
+        return os.path.relpath(real_path, media_root)
+
+    def _accel_response(self, download: _Download, relative: str) -> HttpResponse:
+        response = HttpResponse(content_type=download.content_type)
+        response['X-Accel-Redirect'] = settings.FILE_ACCEL_REDIRECT_PREFIX + quote(relative.replace(os.sep, '/'))
+        response['Content-Disposition'] = content_disposition_header(True, download.filename)
+        return response
+
+    def _direct_response(self, request, download: _Download) -> HttpResponse:
+        stat = os.stat(download.path)
+        size = stat.st_size
+        etag = f'"{download.tag}-{size:x}-{stat.st_mtime_ns:x}"'
+
+        not_modified = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+        if not_modified is not None:
+            return not_modified
+
+        byte_range = self._requested_range(request, etag, size)
+        if byte_range == 'unsatisfiable':
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+        file = open(download.path, 'rb')
+        if byte_range is None:
+            response = FileResponse(file, content_type=download.content_type)
+            length = size
+        else:
+            start, end = byte_range
+            length = end - start + 1
+            response = FileResponse(_FileRange(file, start, length), status=206, content_type=download.content_type)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+        response['Content-Length'] = str(length)
+        response['Content-Disposition'] = content_disposition_header(True, download.filename)
+        response['Accept-Ranges'] = 'bytes'
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(stat.st_mtime)
+        return response
+
+    @staticmethod
+    def _requested_range(request, etag: str, size: int):
+        """
+        Parse a single-range Range header.
+
+        Returns (start, end) inclusive, None to send the whole file (no
+        Range, multiple ranges, or a stale If-Range) or 'unsatisfiable'.
+        """
+        header = request.headers.get('Range')
+        if not header:
+            return None
+        if_range = request.headers.get('If-Range')
+        if if_range and if_range != etag:
+            return None
+        match = RANGE_RE.match(header.strip())
+        if not match or (not match.group(1) and not match.group(2)):
+            return None
+
+        first, last = match.groups()
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length == 0:
+                return 'unsatisfiable'
+            return max(size - length, 0), size - 1
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or end < start:
+            return 'unsatisfiable'
+        return start, end
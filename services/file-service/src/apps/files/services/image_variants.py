@@ -0,0 +1,97 @@
+"""
+WEBP size variants for uploaded images.
+
+Every clean JPEG, PNG or GIF gets three variants, each bounded by a
+square box:
+
+    thumb    IMAGE_THUMB_SIZE     (chat and ticket list previews)
+    preview  IMAGE_PREVIEW_SIZE   (lightbox / inline view)
+    full     IMAGE_FULL_MAX_SIZE  (replaces the original as the Blob's file)
+
+The image is decoded once. JPEGs are decoded in draft mode straight at
+the smallest DCT scale that still covers the full variant, so a 48MP
+photo never occupies its full size in memory. Orientation is applied from
+EXIF and the EXIF block itself is dropped; each smaller variant is
+resized from the previous one. A variant no smaller than the one before
+it shares that variant's file. Animated GIFs keep their first frame.
+"""
+import os
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+from apps.files.models import Blob
+
+IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif']
+VARIANTS = ('full', 'preview', 'thumb')
+# Videos get a 'poster' frame instead (see services.video_transcoder)
+VARIANT_NAMES = VARIANTS + ('poster',)
+
+
+def variant_sizes() -> Dict[str, int]:
+    return {
+        'full': settings.IMAGE_FULL_MAX_SIZE,
+        'preview': settings.IMAGE_PREVIEW_SIZE,
+        'thumb': settings.IMAGE_THUMB_SIZE,
+    }
+
+
+def variant_path(blob: Blob, name: str) -> str:
+    stem = os.path.splitext(blob.file_path)[0]
+    return f"{stem}.webp" if name == 'full' else f"{stem}.{name}.webp"
+
+
+def _fit(size: Tuple[int, int], box: int) -> Tuple[int, int]:
+    """`size` scaled down to fit a box x box square."""
+    scale = min(1.0, box / max(size))
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def build_variants(blob: Blob) -> Dict[str, dict]:
+    """
+    Write the WEBP variants of the Blob's image.
+
+    Returns the Blob.variants mapping; the caller makes the 'full' file
+    the Blob's file and removes the original.
+    """
+    sizes = variant_sizes()
+    variants = {}
+    with Image.open(blob.file_path) as source:
+        # JPEG only: decode at 1/2, 1/4 or 1/8 scale when that still covers the full variant
+        source.draft('RGB', _fit(source.size, sizes['full']))
+        image = ImageOps.exif_transpose(source)
+        icc_profile = source.info.get('icc_profile')
+
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    previous = None
+    for name in VARIANTS:
+        box = sizes[name]
+        if previous is not None and max(image.size) <= box:
+            # Already small enough: share the larger variant's file
+            variants[name] = dict(variants[previous])
+            previous = name
+            continue
+        variants[name] = save_variant(image, variant_path(blob, name), box, icc_profile)
+        previous = name
+    image.close()
+    return variants
+
+
+def save_variant(image: Image.Image, path: str, box: int, icc_profile: Optional[bytes] = None) -> dict:
+    """Shrink `image` in place to fit the box, save it as WEBP and describe the file."""
+    image.thumbnail((box, box), Image.Resampling.LANCZOS, reducing_gap=2.0)
+    # No exif= argument, so EXIF (GPS, camera serials) is not written
+    image.save(path, 'WEBP', quality=settings.IMAGE_WEBP_QUALITY, method=4, icc_profile=icc_profile)
+    return {
+        'path': path,
+        'width': image.width,
+        'height': image.height,
+        'size': os.path.getsize(path),
+    }
+
+
+def variant_files(variants: Dict[str, dict]) -> set:
+    return {variant['path'] for variant in variants.values()}
@@ -1,12 +1,16 @@
 """
 File upload service.
 """
+import hashlib
 import os
 import uuid
-from django.core.files.uploadedfile import UploadedFile
 from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
 from apps.files.models import Attachment, ScanStatus
-from apps.files.tasks import scan_file_task, process_file_task
+from apps.files.services.blob_store import BlobStore
+from apps.files.services.virus_scanner import get_scanner
+from apps.files.tasks import process_file_task
 
 
 class UploadService:
@@ -18,69 +22,102 @@ class UploadService:
         'images': ['.jpg', '.jpeg', '.png', '.gif'],
         'videos': ['.mp4', '.mov', '.mkv', '.avi']
     }
+    STATUS_MESSAGES = {
+        ScanStatus.PENDING: 'File uploaded successfully. Scan in progress.',
+        ScanStatus.CLEAN: 'File uploaded successfully. Scan passed.',
+        ScanStatus.INFECTED: 'File rejected. Malware detected.',
+    }
     
-    def upload_file(self, file: UploadedFile, ticket_id: str = None, chat_message_id: str = None, uploaded_by_id: str = None, category: str = 'general') -> dict:
+    def validate(self, filename: str, size: int) -> str:
         """
-        Upload file to temporary storage and trigger scan.
+        Check size and extension limits.
         
         Returns:
-            dict: {
-                'file_key': str,
-                'message': str,
-                'scan_status': str
-            }
+            str: The lower-cased file extension
+        
+        Raises:
+            ValueError: If the file is too large or of a disallowed type
         """
         # Validate file size
-        if file.size > self.MAX_FILE_SIZE:
+        if size > self.MAX_FILE_SIZE:
             raise ValueError(f"File size exceeds maximum limit of {self.MAX_FILE_SIZE} bytes")
         
         # Validate file extension
-        file_ext = os.path.splitext(file.name)[1].lower()
+        file_ext = os.path.splitext(filename)[1].lower()
         allowed = []
         for ext_list in self.ALLOWED_EXTENSIONS.values():
             allowed.extend(ext_list)
         
         if file_ext not in allowed:
             raise ValueError(f"File type not allowed. Allowed: {allowed}")
+        return file_ext
+    
+    def upload_file(self, file: UploadedFile, ticket_id: str = None, chat_message_id: str = None, uploaded_by_id: str = None, category: str = 'general') -> dict:
+        """
+        Store the file in the blob store and trigger scan.
+        
+        Returns:
+            dict: {
+                'file_key': str,
+                'message': str,
+                'scan_status': str
+            }
+        """
+        file_ext = self.validate(file.name, file.size)
         
         # Generate unique file key
         file_key = uuid.uuid4()
         
-        # Save to storage (categorized folder)
-        folder = category if category else 'general'
-        temp_path = os.path.join(settings.MEDIA_ROOT, folder, f"{file_key}{file_ext}")
-        os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-        
-        with open(temp_path, 'wb+') as destination:
-            for chunk in file.chunks():
-                destination.write(chunk)
+        # Write to a temporary file, hashing (and, when clamd has a free
+        # connection, scanning) as the chunks arrive
+        temp_path = BlobStore.temp_path()
+        digest = hashlib.sha256()
+        scan = get_scanner().open_stream(file.size) if settings.CLAMD_SCAN_ON_UPLOAD else None
+        try:
+            with open(temp_path, 'wb+') as destination:
+                for chunk in file.chunks():
+                    destination.write(chunk)
+                    digest.update(chunk)
+                    if scan:
+                        scan.feed(chunk)
+        except Exception:
+            if scan:
+                scan.abort()
+            raise
+        verdict = scan.finish() if scan else None
         
-        # Create attachment record
-        attachment = Attachment.objects.create(
-            file_key=file_key,
-            category=category,
-            original_filename=file.name,
-            file_size=file.size,
-            mime_type=file.content_type,
-            file_extension=file_ext,
-            file_path=temp_path,
-            scan_status=ScanStatus.PENDING,
-            ticket_id=ticket_id,
-            chat_message_id=chat_message_id,
-            uploaded_by_id=uploaded_by_id
-        )
-        
-        # Trigger background scan
-        scan_file_task.delay(str(attachment.id))
+        with transaction.atomic():
+            # Identical content is stored once; a known verdict is reused
+            blob, _ = BlobStore.ingest(temp_path, digest.hexdigest(), file.size, file_ext)
+            if verdict is not None and blob.scan_status == ScanStatus.PENDING:
+                BlobStore.record_scan(blob, verdict)
+                BlobStore.sync_attachments(blob)
+            # A processed blob may carry a converted extension
+            fields = {'file_extension': file_ext, **BlobStore.attachment_fields(blob)}
+            
+            # Create attachment record (a pending one is queued for scanning by signals.attachment_saved)
+            attachment = Attachment.objects.create(
+                file_key=file_key,
+                category=category,
+                original_filename=file.name,
+                file_size=file.size,
+                mime_type=file.content_type,
+                blob=blob,
+                ticket_id=ticket_id,
+                chat_message_id=chat_message_id,
+                uploaded_by_id=uploaded_by_id,
+                **fields
+            )
+            if verdict is not None and attachment.scan_status == ScanStatus.CLEAN and not attachment.is_processed:
+                attachment_id = str(attachment.id)
+                transaction.on_commit(lambda: process_file_task.delay(attachment_id))
         
         return {
             'id': str(attachment.id),
             'file_key': str(file_key),
-            'message': 'File uploaded successfully. Scan in progress.',
-            'scan_status': 'pending',
+            'message': self.STATUS_MESSAGES.get(attachment.scan_status, self.STATUS_MESSAGES[ScanStatus.PENDING]),
+            'scan_status': attachment.scan_status,
             'filename': attachment.original_filename,
             'size': attachment.file_size,
             'content_type': attachment.mime_type
         }
-
-
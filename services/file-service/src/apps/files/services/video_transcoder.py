@@ -0,0 +1,161 @@
+"""
+Video transcoding with FFmpeg.
+
+Uploaded videos are rewritten as web-friendly MP4: H.264 (yuv420p, at
+most VIDEO_MAX_HEIGHT lines) with AAC audio and the index at the front
+of the file (+faststart), so playback starts before the download ends.
+Inputs that already are H.264/AAC within the size limit are only
+remuxed. A poster frame is taken VIDEO_POSTER_OFFSET seconds in (or from
+the middle of shorter clips) and stored as the Blob's 'poster' variant.
+
+This runs in transcode_video_task on its own queue. FFmpeg runs at a
+lower CPU priority (VIDEO_TRANSCODE_NICE) with VIDEO_TRANSCODE_THREADS
+threads, so a transcode cannot starve the scan workers.
+"""
+import json
+import os
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from django.conf import settings
+from PIL import Image
+
+from apps.files.services.image_variants import save_variant
+
+VIDEO_EXTENSIONS = ['.mp4', '.mov', '.mkv', '.avi']
+
+
+class TranscodeError(Exception):
+    """FFmpeg could not read or convert the video."""
+
+
+@dataclass
+class VideoInfo:
+    duration: float
+    video_codec: Optional[str]
+    audio_codec: Optional[str]
+    height: int
+    pix_fmt: Optional[str]
+
+
+class VideoTranscoder:
+    """Runs ffprobe/ffmpeg for one video."""
+
+    PROGRESS_INTERVAL = 2  # seconds between progress reports
+
+    def probe(self, path: str) -> VideoInfo:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams', path],
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+        if result.returncode != 0:
+            raise TranscodeError(f"ffprobe failed: {result.stderr.strip()}")
+        data = json.loads(result.stdout)
+        video = next((s for s in data.get('streams', []) if s.get('codec_type') == 'video'), None)
+        audio = next((s for s in data.get('streams', []) if s.get('codec_type') == 'audio'), None)
+        if video is None:
+            raise TranscodeError("No video stream found")
+        return VideoInfo(
+            duration=float(data.get('format', {}).get('duration') or 0),
+            video_codec=video.get('codec_name'),
+            audio_codec=audio.get('codec_name') if audio else None,
+            height=int(video.get('height') or 0),
+            pix_fmt=video.get('pix_fmt'),
+        )
+
+    @staticmethod
+    def can_remux(info: VideoInfo) -> bool:
+        """True if the streams can be copied into MP4 as they are."""
+        return (
+            info.video_codec == 'h264'
+            and info.pix_fmt == 'yuv420p'
+            and info.height <= settings.VIDEO_MAX_HEIGHT
+            and info.audio_codec in (None, 'aac')
+        )
+
+    def transcode(self, source: str, target: str, info: VideoInfo,
+                  on_progress: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Write `source` to `target` as faststart MP4.
+
+        `on_progress` is called with the percentage done, at most every
+        PROGRESS_INTERVAL seconds.
+
+        Raises:
+            TranscodeError: If FFmpeg fails
+        """
+        if self.can_remux(info):
+            codec_args = ['-c', 'copy']
+        else:
+            max_height = settings.VIDEO_MAX_HEIGHT
+            codec_args = [
+                # Never upscale; keep both dimensions even, as yuv420p requires
+                '-vf', f'scale=-2:trunc(min(ih\\,{max_height})/2)*2',
+                '-c:v', 'libx264', '-preset', settings.VIDEO_TRANSCODE_PRESET,
+                '-crf', str(settings.VIDEO_TRANSCODE_CRF), '-pix_fmt', 'yuv420p',
+                '-c:a', 'aac', '-b:a', '128k',
+            ]
+        args = [
+            'ffmpeg', '-hide_banner', '-nostdin', '-y', '-loglevel', 'error',
+            '-i', source,
+            '-map', '0:v:0', '-map', '0:a:0?',
+            *codec_args,
+            '-threads', str(settings.VIDEO_TRANSCODE_THREADS),
+            '-movflags', '+faststart',
+            '-progress', 'pipe:1', '-nostats',
+            '-f', 'mp4', target,
+        ]
+        with tempfile.TemporaryFile() as errors:
+            process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=errors, text=True,
+                                       preexec_fn=self._lower_priority)
+            try:
+                self._follow_progress(process, info.duration, on_progress)
+                process.wait()
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+            if process.returncode != 0:
+                errors.seek(0)
+                raise TranscodeError(f"ffmpeg failed: {errors.read().decode('utf-8', 'replace').strip()[-2000:]}")
+
+    def make_poster(self, source: str, target: str, info: VideoInfo) -> dict:
+        """Save one frame of the video as a WEBP variant at `target`."""
+        offset = min(settings.VIDEO_POSTER_OFFSET, info.duration / 2)
+        frame_path = f"{target}.png"
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-nostdin', '-y', '-loglevel', 'error',
+             '-ss', f'{offset:.3f}', '-i', source, '-frames:v', '1', frame_path],
+            capture_output=True,
+            text=True,
+            timeout=120
+        )
+        try:
+            if result.returncode != 0 or not os.path.exists(frame_path):
+                raise TranscodeError(f"Poster extraction failed: {result.stderr.strip()}")
+            with Image.open(frame_path) as frame:
+                return save_variant(frame.convert('RGB'), target, settings.IMAGE_PREVIEW_SIZE)
+        finally:
+            if os.path.exists(frame_path):
+                os.remove(frame_path)
+
+    def _follow_progress(self, process, duration: float, on_progress) -> None:
+        last_report = 0.0
+        for line in process.stdout:
+            key, _, value = line.strip().partition('=')
+            # out_time_us is the position written so far, in microseconds
+            if key != 'out_time_us' or not value.isdigit() or not duration or on_progress is None:
+                continue
+            now = time.monotonic()
+            if now - last_report >= self.PROGRESS_INTERVAL:
+                last_report = now
+                on_progress(min(99, int(int(value) / (duration * 1e6) * 100)))
+
+    @staticmethod
+    def _lower_priority() -> None:
+        os.nice(settings.VIDEO_TRANSCODE_NICE)
@@ -1,7 +1,8 @@
 """
 Signals for File app.
 """
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from .models import Attachment
 from .tasks import scan_file_task
@@ -11,6 +12,15 @@ from .tasks import scan_file_task
 def attachment_saved(sender, instance, created, **kwargs):
     """Handle attachment save signal."""
     if created and instance.scan_status == 'pending':
-        # Trigger antivirus scan task
-        scan_file_task.delay(str(instance.id))
+        # Trigger antivirus scan task once the row is visible to the worker
+        attachment_id = str(instance.id)
+        transaction.on_commit(lambda: scan_file_task.delay(attachment_id))
+
+
+@receiver(post_delete, sender=Attachment)
+def attachment_deleted(sender, instance, **kwargs):
+    """Release the attachment's reference to its stored file."""
+    if instance.blob_id is not None:
+        from .services.blob_store import BlobStore
+        BlobStore.release(instance.blob_id)
 
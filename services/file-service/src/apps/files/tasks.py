@@ -1,99 +1,318 @@
 """
 Celery tasks for File Service.
+
+Scanning and processing work on the attachment's Blob (see
+services.blob_store), so each distinct file is scanned and processed once;
+results are copied to every attachment sharing the Blob.
+
+Queues, priorities and time limits for these tasks are set by
+CELERY_TASK_ROUTES and CELERY_TASK_ANNOTATIONS in settings: scans,
+image processing and video transcoding each run on their own worker.
 """
+import logging
 import os
-import subprocess
+from datetime import timedelta
 from celery import shared_task
 from django.conf import settings
-from apps.files.models import Attachment, ScanStatus
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from apps.files.models import Attachment, Blob, ScanStatus
+from apps.files.selectors import FileSelector
+from apps.files.services.blob_store import BlobStore
+from apps.files.services.image_variants import IMAGE_EXTENSIONS, build_variants, variant_path
+from apps.files.services.video_transcoder import VIDEO_EXTENSIONS, VideoTranscoder
+from apps.files.services.virus_scanner import FALLBACK_RESULT, ClamdUnavailable, ScanResult, get_scanner
+
+logger = logging.getLogger(__name__)
+
+# A transcode whose progress has not moved for this long is presumed dead
+TRANSCODE_STALE_AFTER = 600
+# Re-enqueued scans queue behind fresh uploads on file_scan
+RETRY_PRIORITY = 9
+
+
+def _blob_for(attachment_id: str):
+    """Return the attachment's Blob, moving a pre-dedup file into the store first."""
+    attachment = Attachment.objects.select_related('blob').get(id=attachment_id)
+    return attachment.blob or BlobStore.adopt(attachment)
 
 
 @shared_task
 def scan_file_task(attachment_id: str):
     """Scan file for viruses."""
-    attachment = Attachment.objects.get(id=attachment_id)
-    
     try:
-        # Run ClamAV scan
-        result = subprocess.run(
-            ['clamdscan', attachment.file_path],
-            capture_output=True,
-            text=True,
-            timeout=300
+        blob = _blob_for(attachment_id)
+    except OSError as e:
+        # Stored before deduplication and the file is gone: nothing left to scan
+        logger.error(f"Cannot scan attachment {attachment_id}: {e}")
+        Attachment.objects.filter(id=attachment_id, blob__isnull=True).update(
+            scan_status=ScanStatus.FAILED, scan_result=str(e)
         )
-        
-        # Combine stdout and stderr for checking
-        scan_output = (result.stdout or "") + (result.stderr or "")
-        
-        if result.returncode == 0 or "not found" in scan_output.lower() or "could not connect to clamd" in scan_output.lower():
-            # File is clean or ClamAV missing/daemon not running (fallback)
-            attachment.scan_status = ScanStatus.CLEAN
-            attachment.scan_result = "File scanned (fallback: clean)" if result.returncode != 0 else "File clean"
-            
-            # Move to permanent storage (respecting category)
-            category_dir = attachment.category or 'uploads'
-            permanent_path = os.path.join(settings.MEDIA_ROOT, category_dir, f"{attachment.file_key}{attachment.file_extension}")
-            os.makedirs(os.path.dirname(permanent_path), exist_ok=True)
-            
-            # Only rename if path is different
-            if attachment.file_path != permanent_path:
-                os.rename(attachment.file_path, permanent_path)
-                attachment.file_path = permanent_path
-            
-            # Trigger processing
-            process_file_task.delay(str(attachment.id))
-        else:
-            # File is infected
-            attachment.scan_status = ScanStatus.INFECTED
-            attachment.scan_result = scan_output
-            # Delete infected file
-            if os.path.exists(attachment.file_path):
-                os.remove(attachment.file_path)
-        
-        from django.utils import timezone
-        attachment.scanned_at = timezone.now()
-        attachment.save()
+        return
+    
+    if blob.scan_status in (ScanStatus.CLEAN, ScanStatus.INFECTED):
+        # Known file: reuse the verdict instead of rescanning
+        BlobStore.sync_attachments(blob)
+        return
+    
+    lock = f"scan_lock:{blob.id}"
+    if not cache.add(lock, attachment_id, timeout=settings.FILE_SCAN_TIME_LIMIT + 30):
+        # Another task is scanning this Blob (a retry next to a late original); it syncs every attachment
+        return
+    
+    try:
+        try:
+            result = get_scanner().scan_file(blob.file_path)
+        except ClamdUnavailable as e:
+            # ClamAV missing/daemon not running (fallback)
+            logger.warning(f"Virus scan skipped for blob {blob.sha256}: {e}")
+            result = ScanResult(infected=False, detail=FALLBACK_RESULT)
+        BlobStore.record_scan(blob, result)
         
     except Exception as e:
-        attachment.scan_status = ScanStatus.FAILED
-        attachment.scan_result = str(e)
-        attachment.save()
+        blob.scan_status = ScanStatus.FAILED
+        blob.scan_result = str(e)
+        blob.save()
+    finally:
+        cache.delete(lock)
+    
+    BlobStore.sync_attachments(blob)
+    if blob.scan_status == ScanStatus.CLEAN:
+        # Trigger processing
+        process_file_task.delay(attachment_id)
 
 
 @shared_task
 def process_file_task(attachment_id: str):
-    """Process file (convert images to WebP, transcode videos to MP4)."""
-    attachment = Attachment.objects.get(id=attachment_id)
+    """Process file (WebP variants for images, transcode videos to MP4)."""
+    blob = _blob_for(attachment_id)
+    
+    if blob.is_processed or blob.scan_status != ScanStatus.CLEAN:
+        BlobStore.sync_attachments(blob)
+        return
     
     try:
-        # Image processing (convert to WebP)
-        if attachment.file_extension.lower() in ['.jpg', '.jpeg', '.png', '.gif']:
-            from PIL import Image
-            img = Image.open(attachment.file_path)
-            webp_path = os.path.splitext(attachment.file_path)[0] + '.webp'
-            img.save(webp_path, 'WEBP')
-            # Update file path
-            if os.path.exists(attachment.file_path):
-                os.remove(attachment.file_path)
-            attachment.file_path = webp_path
-            attachment.file_extension = '.webp'
+        # Image processing (WebP thumb/preview/full variants)
+        if blob.file_extension.lower() in IMAGE_EXTENSIONS:
+            blob.variants = build_variants(blob)
+            # The full variant replaces the original
+            if os.path.exists(blob.file_path):
+                os.remove(blob.file_path)
+            blob.file_path = blob.variants['full']['path']
+            blob.file_extension = '.webp'
         
-        # Video processing (transcode to MP4) - simplified
-        elif attachment.file_extension.lower() in ['.mov', '.mkv', '.avi']:
-            # Use FFmpeg to transcode (simplified - actual implementation needs FFmpeg)
-            # mp4_path = os.path.splitext(attachment.file_path)[0] + '.mp4'
-            # subprocess.run(['ffmpeg', '-i', attachment.file_path, mp4_path])
-            # attachment.file_path = mp4_path
-            # attachment.file_extension = '.mp4'
-            pass  # Implement FFmpeg transcoding
+        # Video processing: transcoding is slow and CPU-heavy, so it runs on its own queue
+        elif blob.file_extension.lower() in VIDEO_EXTENSIONS:
+            transcode_video_task.delay(attachment_id)
+            return
         
-        from django.utils import timezone
-        attachment.is_processed = True
-        attachment.processed_at = timezone.now()
-        attachment.save()
+        blob.is_processed = True
+        blob.processed_at = timezone.now()
+        blob.save()
+        BlobStore.sync_attachments(blob)
         
     except Exception as e:
         # Log error but don't fail
         print(f"File processing error: {str(e)}")
 
 
+@shared_task(name='files.reconcile_scans', ignore_result=True)
+def reconcile_scans_task():
+    """
+    Re-enqueue scans that were lost or failed (run by Celery beat).
+    
+    A message lost by the broker, or a worker killed mid-scan, leaves the
+    Blob pending and its attachments undownloadable. Due Blobs (see
+    FileSelector.get_scans_to_retry) are claimed in batches under row
+    locks that skip Blobs another sweep holds; each claim counts an
+    attempt and doubles the wait before the next one. Attachments stored
+    before deduplication (no Blob yet) that have been pending for
+    FILE_SCAN_RETRY_AFTER are claimed the same way and retried at that
+    interval; the scan adopts them into the blob store.
+    
+    The claims are what keep two sweeps from publishing the same retry.
+    Task ids (scan-<sha256>-<attempt>) only make retries easy to trace;
+    the broker does not deduplicate them. A retry that meets the original
+    scan is a no-op thanks to the scan lock. The batch is published over
+    one broker connection, and a full batch starts the next sweep at once,
+    so a backlog left by an outage drains in a few passes.
+    """
+    batch_size = settings.FILE_SCAN_RECONCILE_BATCH
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.FILE_SCAN_RETRY_AFTER)
+    with transaction.atomic():
+        blobs = list(FileSelector.get_scans_to_retry().select_for_update(skip_locked=True, of=('self',))[:batch_size])
+        for attempts in {blob.scan_attempts for blob in blobs}:
+            Blob.objects.filter(id__in=[blob.id for blob in blobs if blob.scan_attempts == attempts]).update(
+                scan_attempts=attempts + 1,
+                scan_retry_at=now + timedelta(seconds=settings.FILE_SCAN_RETRY_AFTER * 2 ** (attempts + 1)),
+            )
+        unstored = list(
+            FileSelector.get_pending_scans().filter(blob__isnull=True, updated_at__lt=stale)
+            .order_by('updated_at').select_for_update(skip_locked=True)
+            .values_list('id', flat=True)[:batch_size - len(blobs)]
+        )
+        # Not due again for another FILE_SCAN_RETRY_AFTER
+        Attachment.objects.filter(id__in=unstored).update(updated_at=now)
+    if not blobs and not unstored:
+        return
+    
+    with scan_file_task.app.producer_or_acquire() as producer:
+        for blob in blobs:
+            attempt = blob.scan_attempts + 1
+            if attempt == settings.FILE_SCAN_MAX_ATTEMPTS:
+                logger.warning(f"Last scan attempt for blob {blob.sha256} ({blob.scan_status})")
+            scan_file_task.apply_async(
+                args=[str(blob.attachment_id)],
+                task_id=f"scan-{blob.sha256}-{attempt}",
+                priority=RETRY_PRIORITY,
+                producer=producer,
+            )
+        for attachment_id in unstored:
+            scan_file_task.apply_async(args=[str(attachment_id)], priority=RETRY_PRIORITY, producer=producer)
+    logger.info(f"Re-enqueued {len(blobs) + len(unstored)} lost or failed scans")
+    
+    if len(blobs) + len(unstored) == batch_size:
+        # More may be due; don't wait for the next beat
+        reconcile_scans_task.delay()
+
+
+def _claim_transcode(blob: Blob, takeover: bool = False) -> bool:
+    """
+    Mark the Blob as transcoding unless another live transcode has it.
+    
+    With `takeover` (this message was redelivered, so the run that
+    claimed the Blob died) the claim is taken whatever its age.
+    """
+    queryset = Blob.objects.filter(id=blob.id, is_processed=False)
+    if not takeover:
+        stale = timezone.now() - timedelta(seconds=TRANSCODE_STALE_AFTER)
+        queryset = queryset.filter(Q(processing_progress__isnull=True) | Q(updated_at__lt=stale))
+    claimed = queryset.update(processing_progress=0, updated_at=timezone.now())
+    if claimed:
+        blob.processing_progress = 0
+        BlobStore.sync_attachments(blob)
+    return bool(claimed)
+
+
+def _transcode_failed_fields(attempts: int) -> dict:
+    """
+    Fields recording one more failed (or stalled) transcode after `attempts`.
+    
+    The next try is due after VIDEO_TRANSCODE_RETRY_AFTER, doubling with
+    each failure; after VIDEO_TRANSCODE_MAX_ATTEMPTS none is scheduled and
+    the original is served as uploaded.
+    """
+    attempts += 1
+    retry_at = None
+    if attempts < settings.VIDEO_TRANSCODE_MAX_ATTEMPTS:
+        retry_at = timezone.now() + timedelta(seconds=settings.VIDEO_TRANSCODE_RETRY_AFTER * 2 ** (attempts - 1))
+    return {
+        'processing_progress': None,
+        'transcode_attempts': attempts,
+        'transcode_retry_at': retry_at,
+        'updated_at': timezone.now(),
+    }
+
+
+def _report_progress(blob: Blob, percent: int) -> None:
+    Blob.objects.filter(id=blob.id).update(processing_progress=percent, updated_at=timezone.now())
+    Attachment.objects.with_deleted().filter(blob=blob).update(processing_progress=percent)
+
+
+@shared_task(bind=True, name='files.transcode_video', acks_late=True, reject_on_worker_lost=True)
+def transcode_video_task(self, attachment_id: str):
+    """Transcode a video to faststart MP4 and extract its poster frame."""
+    blob = _blob_for(attachment_id)
+    # Redelivered after its worker was lost: the claim left behind is our own
+    redelivered = bool((self.request.delivery_info or {}).get('redelivered'))
+    if blob.scan_status != ScanStatus.CLEAN or not _claim_transcode(blob, takeover=redelivered):
+        return
+    
+    source = blob.file_path
+    stem = os.path.splitext(source)[0]
+    target = f"{stem}.transcode.mp4"
+    transcoder = VideoTranscoder()
+    try:
+        info = transcoder.probe(source)
+        transcoder.transcode(source, target, info, on_progress=lambda percent: _report_progress(blob, percent))
+        poster = transcoder.make_poster(target, variant_path(blob, 'poster'), info)
+        
+        os.replace(target, f"{stem}.mp4")
+        if source != f"{stem}.mp4":
+            os.remove(source)
+        blob.file_path = f"{stem}.mp4"
+        blob.file_extension = '.mp4'
+        blob.variants = {'poster': poster}
+        blob.is_processed = True
+        blob.processed_at = timezone.now()
+        blob.processing_progress = None
+        blob.transcode_retry_at = None
+        blob.save()
+        BlobStore.sync_attachments(blob)
+        Attachment.objects.with_deleted().filter(blob=blob).update(mime_type='video/mp4')
+        
+    except Exception as e:
+        # The original stays downloadable; reconcile_transcodes_task retries it after a backoff
+        fields = _transcode_failed_fields(blob.transcode_attempts)
+        logger.error(
+            f"Transcoding failed for blob {blob.sha256} (attempt {fields['transcode_attempts']}): {e}"
+            + ("" if fields['transcode_retry_at'] else "; giving up, the original is served as uploaded")
+        )
+        if os.path.exists(target):
+            os.remove(target)
+        Blob.objects.filter(id=blob.id).update(**fields)
+        for field, value in fields.items():
+            setattr(blob, field, value)
+        BlobStore.sync_attachments(blob)
+
+
+@shared_task(name='files.reconcile_transcodes', ignore_result=True)
+def reconcile_transcodes_task():
+    """
+    Retry failed transcodes and those whose run died (run by Celery beat).
+    
+    A run killed by its hard time limit is acked, not redelivered, and
+    leaves its progress behind. Once that progress is older than
+    TRANSCODE_STALE_AFTER the claim is released and counted as a failed
+    attempt, like a run that raised. Failed Blobs due again (see
+    FileSelector.get_transcodes_to_retry) are queued once more; the claim
+    pushes their next retry out by the current backoff, so a retry lost
+    before it starts is queued again later rather than forgotten.
+    """
+    stale = timezone.now() - timedelta(seconds=TRANSCODE_STALE_AFTER)
+    stalled = Blob.objects.filter(
+        scan_status=ScanStatus.CLEAN,
+        is_processed=False,
+        processing_progress__isnull=False,
+        updated_at__lt=stale
+    )
+    for blob in stalled:
+        # Conditional, so a run that reported progress meanwhile keeps its claim
+        released = Blob.objects.filter(id=blob.id, processing_progress__isnull=False, updated_at__lt=stale).update(
+            **_transcode_failed_fields(blob.transcode_attempts)
+        )
+        if released:
+            logger.warning(f"Transcode of blob {blob.sha256} stalled at {blob.processing_progress}%")
+            BlobStore.sync_attachments(Blob.objects.get(id=blob.id))
+    
+    for blob in FileSelector.get_transcodes_to_retry():
+        backoff = settings.VIDEO_TRANSCODE_RETRY_AFTER * 2 ** blob.transcode_attempts
+        claimed = Blob.objects.filter(id=blob.id, transcode_retry_at=blob.transcode_retry_at).update(
+            transcode_retry_at=timezone.now() + timedelta(seconds=backoff)
+        )
+        if claimed:
+            logger.warning(f"Retrying transcode of blob {blob.sha256} (attempt {blob.transcode_attempts + 1})")
+            transcode_video_task.delay(str(blob.attachment_id))
+
+
+@shared_task(name='files.expire_uploads', ignore_result=True)
+def expire_uploads_task():
+    """Discard abandoned chunked uploads and their part files (run by Celery beat)."""
+    # Imported here: the upload service imports this module for scan_file_task
+    from apps.files.services.chunked_upload_service import ChunkedUploadService
+    expired = ChunkedUploadService().expire(settings.UPLOAD_EXPIRE_AFTER, batch_size=settings.FILE_SCAN_RECONCILE_BATCH)
+    if expired:
+        logger.info(f"Discarded {expired} abandoned chunked uploads")
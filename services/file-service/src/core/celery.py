@@ -10,4 +10,7 @@ app = Celery('file_service')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
+# Publish/start/end signals feeding the queue metrics
+from core import task_metrics  # noqa: E402,F401
+
 
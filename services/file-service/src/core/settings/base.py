@@ -124,20 +124,28 @@ TEMPLATES = [
 ROOT_URLCONF = 'core.urls'
 WSGI_APPLICATION = 'core.wsgi.application'
 
+# Database connection profile (see hdms_core.db): none, persistent, pgbouncer or pool
+from hdms_core.db import database_settings
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': config('DB_NAME', default='hdms_db'),
-        'USER': config('DB_USER', default='hdms_user'),
-        'PASSWORD': config('DB_PASSWORD', default='hdms_pwd'),
-        'HOST': config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
-        'PORT': config('DB_PORT', default='6432'),  # PgBouncer port
-        'CONN_MAX_AGE': 0,
-        'OPTIONS': {
+    'default': database_settings(
+        config('DB_POOL_PROFILE', default='pgbouncer'),
+        conn_max_age=config('DB_CONN_MAX_AGE', default=600, cast=int),
+        pool_options={
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+        },
+        NAME=config('DB_NAME', default='hdms_db'),
+        USER=config('DB_USER', default='hdms_user'),
+        PASSWORD=config('DB_PASSWORD', default='hdms_pwd'),
+        HOST=config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
+        PORT=config('DB_PORT', default='6432'),  # PgBouncer port
+        OPTIONS={
             'connect_timeout': int(config('DB_CONNECT_TIMEOUT', default=20))
             # Note: 'options' parameter not supported by PgBouncer in transaction pooling mode
-        }
-    }
+        },
+    )
 }
 
 # Cache Configuration (Redis)
@@ -222,6 +230,107 @@ MAX_FILE_SIZE = config('MAX_FILE_SIZE', default=524288000, cast=int)  # 500MB
 ALLOWED_IMAGE_TYPES = config('ALLOWED_IMAGE_TYPES', default='image/jpeg,image/png,image/gif').split(',')
 ALLOWED_DOCUMENT_TYPES = config('ALLOWED_DOCUMENT_TYPES', default='application/pdf,text/plain').split(',')
 ALLOWED_VIDEO_TYPES = config('ALLOWED_VIDEO_TYPES', default='video/mp4').split(',')
+# Chunked uploads (POST /files/uploads): bytes per chunk
+UPLOAD_CHUNK_SIZE = config('UPLOAD_CHUNK_SIZE', default=8388608, cast=int)  # 8MB
+# Chunked uploads receiving no chunk for this long are discarded (see tasks.expire_uploads_task)
+UPLOAD_EXPIRE_AFTER = config('UPLOAD_EXPIRE_AFTER', default=86400, cast=int)  # seconds
+
+# Downloads: 'accel' hands files to nginx via X-Accel-Redirect (MEDIA_ROOT must be
+# mounted at the internal location below); 'direct' serves them from Django
+FILE_DOWNLOAD_MODE = config('FILE_DOWNLOAD_MODE', default='direct')
+FILE_ACCEL_REDIRECT_PREFIX = config('FILE_ACCEL_REDIRECT_PREFIX', default='/protected-media/')
+
+# Virus scanning (see apps.files.services.virus_scanner): 'clamd' talks to clamd over
+# CLAMD_ADDRESS (unix socket path or host:port) with a pool of persistent connections;
+# 'clamdscan' runs the clamdscan command per file
+CLAMAV_BACKEND = config('CLAMAV_BACKEND', default='clamd')
+CLAMD_ADDRESS = config('CLAMD_ADDRESS', default='/var/run/clamav/clamd.ctl')
+CLAMD_MAX_CONNECTIONS = config('CLAMD_MAX_CONNECTIONS', default=4, cast=int)  # concurrent scans per process
+CLAMD_TIMEOUT = config('CLAMD_TIMEOUT', default=300, cast=int)
+CLAMD_STREAM_MAX_LENGTH = config('CLAMD_STREAM_MAX_LENGTH', default=26214400, cast=int)  # clamd StreamMaxLength, 25MB
+# Scan single-request uploads while they are received, instead of in the scan task
+CLAMD_SCAN_ON_UPLOAD = config('CLAMD_SCAN_ON_UPLOAD', default=True, cast=bool)
+
+# Image variants (see apps.files.services.image_variants): longest edge in pixels
+IMAGE_THUMB_SIZE = config('IMAGE_THUMB_SIZE', default=320, cast=int)
+IMAGE_PREVIEW_SIZE = config('IMAGE_PREVIEW_SIZE', default=1280, cast=int)
+IMAGE_FULL_MAX_SIZE = config('IMAGE_FULL_MAX_SIZE', default=4096, cast=int)
+IMAGE_WEBP_QUALITY = config('IMAGE_WEBP_QUALITY', default=80, cast=int)
+
+# Video transcoding (see apps.files.services.video_transcoder), run by the worker
+# consuming the file_transcode queue
+VIDEO_MAX_HEIGHT = config('VIDEO_MAX_HEIGHT', default=1080, cast=int)
+VIDEO_TRANSCODE_PRESET = config('VIDEO_TRANSCODE_PRESET', default='veryfast')
+VIDEO_TRANSCODE_CRF = config('VIDEO_TRANSCODE_CRF', default=23, cast=int)
+VIDEO_TRANSCODE_THREADS = config('VIDEO_TRANSCODE_THREADS', default=2, cast=int)  # FFmpeg threads per transcode
+VIDEO_TRANSCODE_NICE = config('VIDEO_TRANSCODE_NICE', default=10, cast=int)
+VIDEO_TRANSCODE_TIMEOUT = config('VIDEO_TRANSCODE_TIMEOUT', default=3600, cast=int)  # seconds
+VIDEO_POSTER_OFFSET = config('VIDEO_POSTER_OFFSET', default=1.0, cast=float)  # seconds into the video
+# A failed or stalled transcode is retried after this long, twice as long after each
+# further failure; after the last attempt the video is served as uploaded
+VIDEO_TRANSCODE_RETRY_AFTER = config('VIDEO_TRANSCODE_RETRY_AFTER', default=600, cast=int)  # seconds
+VIDEO_TRANSCODE_MAX_ATTEMPTS = config('VIDEO_TRANSCODE_MAX_ATTEMPTS', default=3, cast=int)
+
+# Celery task routing: scans, image processing and video transcoding each have their
+# own queue and worker (see docker-compose), so conversion bursts never delay the
+# scans that gate downloads. With Redis, priority 0 is served first within a queue.
+CELERY_TASK_DEFAULT_QUEUE = 'file_scan'
+CELERY_TASK_ROUTES = {
+    'apps.files.tasks.scan_file_task': {'queue': 'file_scan', 'priority': 0},
+    'apps.files.tasks.process_file_task': {'queue': 'file_image', 'priority': 3},
+    'files.transcode_video': {'queue': 'file_transcode', 'priority': 6},
+    'files.reconcile_scans': {'queue': 'file_scan', 'priority': 0},
+    'files.reconcile_transcodes': {'queue': 'file_scan', 'priority': 0},
+    'files.expire_uploads': {'queue': 'file_scan', 'priority': 0},
+    # Shared users app (bulk imports); consumed by celery-worker-users
+    'users.import_users': {'queue': 'user_imports'},
+}
+FILE_SCAN_TIME_LIMIT = config('FILE_SCAN_TIME_LIMIT', default=CLAMD_TIMEOUT + 60, cast=int)  # seconds
+FILE_PROCESS_TIME_LIMIT = config('FILE_PROCESS_TIME_LIMIT', default=300, cast=int)  # seconds
+# Soft limit raises inside the task (which records the failure); the hard limit kills it
+CELERY_TASK_ANNOTATIONS = {
+    'apps.files.tasks.scan_file_task': {
+        'soft_time_limit': FILE_SCAN_TIME_LIMIT, 'time_limit': FILE_SCAN_TIME_LIMIT + 30,
+    },
+    'apps.files.tasks.process_file_task': {
+        'soft_time_limit': FILE_PROCESS_TIME_LIMIT, 'time_limit': FILE_PROCESS_TIME_LIMIT + 30,
+    },
+    'files.transcode_video': {
+        'soft_time_limit': VIDEO_TRANSCODE_TIMEOUT, 'time_limit': VIDEO_TRANSCODE_TIMEOUT + 60,
+    },
+}
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'queue_order_strategy': 'priority',
+    # Unacknowledged (acks_late) tasks are redelivered after this; keep it above the longest task
+    'visibility_timeout': VIDEO_TRANSCODE_TIMEOUT + 600,
+}
+
+# Scan reconciler (celery-beat): scans pending this long without a retry are presumed
+# lost and re-enqueued, as are failed ones; each further retry waits twice as long
+FILE_SCAN_RETRY_AFTER = config('FILE_SCAN_RETRY_AFTER', default=600, cast=int)  # seconds
+FILE_SCAN_MAX_ATTEMPTS = config('FILE_SCAN_MAX_ATTEMPTS', default=6, cast=int)
+FILE_SCAN_RECONCILE_INTERVAL = config('FILE_SCAN_RECONCILE_INTERVAL', default=60, cast=int)  # seconds
+FILE_SCAN_RECONCILE_BATCH = config('FILE_SCAN_RECONCILE_BATCH', default=500, cast=int)
+CELERY_BEAT_SCHEDULE = {
+    'reconcile-file-scans': {
+        'task': 'files.reconcile_scans',
+        'schedule': FILE_SCAN_RECONCILE_INTERVAL,
+        # A sweep that could not start before the next one is due is redundant
+        'options': {'expires': FILE_SCAN_RECONCILE_INTERVAL},
+    },
+    # Failed transcodes and those killed by their hard time limit (see tasks.reconcile_transcodes_task)
+    'reconcile-transcodes': {
+        'task': 'files.reconcile_transcodes',
+        'schedule': 300,
+        'options': {'expires': 300},
+    },
+    # Abandoned chunked uploads (see tasks.expire_uploads_task)
+    'expire-uploads': {
+        'task': 'files.expire_uploads',
+        'schedule': 3600,
+        'options': {'expires': 3600},
+    },
+}
 
 # Logging - use shared logging configuration
 LOGGING = get_logging_config()
@@ -0,0 +1,127 @@
+"""
+Celery queue metrics, reported by /metrics/ (see hdms_core.metrics).
+
+Workers record for every task how long it waited between publish and
+start (latency) and how long it ran, per queue, in the shared cache, so
+the web process can report what the worker processes measured. Queue
+depth is read from the broker when /metrics/ is requested.
+
+Gauges, per queue in CELERY_TASK_ROUTES (and the default queue):
+    celery.<queue>.depth            messages waiting
+    celery.<queue>.tasks            tasks run
+    celery.<queue>.failures         tasks that raised
+    celery.<queue>.latency_ms_avg   publish -> start, average
+    celery.<queue>.latency_ms_last  publish -> start, latest task
+    celery.<queue>.runtime_ms_avg   start -> end, average
+"""
+import logging
+import time
+
+from celery.signals import before_task_publish, task_postrun, task_prerun
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'celery_metrics'
+COUNTERS = ('tasks', 'failures', 'latency_ms', 'latency_samples', 'runtime_ms')
+
+# task id -> (monotonic start, queue), for tasks running in this process
+_running = {}
+
+
+def _key(queue: str, name: str) -> str:
+    return f"{KEY_PREFIX}:{queue}:{name}"
+
+
+def _incr(queue: str, name: str, amount: int) -> None:
+    from django.core.cache import cache
+    key = _key(queue, name)
+    cache.add(key, 0, timeout=None)
+    cache.incr(key, amount)
+
+
+@before_task_publish.connect
+def stamp_published(headers=None, **kwargs):
+    # Read back as task.request.published_at in the worker
+    if headers is not None:
+        headers.setdefault('published_at', time.time())
+
+
+@task_prerun.connect
+def record_start(task_id=None, task=None, **kwargs):
+    queue = (task.request.delivery_info or {}).get('routing_key') or 'unknown'
+    _running[task_id] = (time.monotonic(), queue)
+    published_at = getattr(task.request, 'published_at', None)
+    if published_at is None:
+        return
+    latency_ms = max(0, int((time.time() - published_at) * 1000))
+    try:
+        from django.core.cache import cache
+        _incr(queue, 'latency_ms', latency_ms)
+        _incr(queue, 'latency_samples', 1)
+        cache.set(_key(queue, 'latency_ms_last'), latency_ms, timeout=None)
+    except Exception as e:
+        logger.warning(f"Could not record task latency: {e}")
+
+
+@task_postrun.connect
+def record_end(task_id=None, state=None, **kwargs):
+    started = _running.pop(task_id, None)
+    if started is None:
+        return
+    start, queue = started
+    try:
+        _incr(queue, 'tasks', 1)
+        _incr(queue, 'runtime_ms', int((time.monotonic() - start) * 1000))
+        if state == 'FAILURE':
+            _incr(queue, 'failures', 1)
+    except Exception as e:
+        logger.warning(f"Could not record task runtime: {e}")
+
+
+def _queues():
+    from django.conf import settings
+    routed = {route['queue'] for route in settings.CELERY_TASK_ROUTES.values()}
+    return sorted(routed | {settings.CELERY_TASK_DEFAULT_QUEUE})
+
+
+def queue_depths() -> dict:
+    """Messages waiting in each queue, read from the broker."""
+    from celery import current_app
+    from kombu.exceptions import ChannelError
+    gauges = {}
+    with current_app.connection_for_read() as connection:
+        connection.ensure_connection(max_retries=1)
+        channel = connection.default_channel
+        for queue in _queues():
+            try:
+                depth = channel.queue_declare(queue=queue, passive=True).message_count
+            except ChannelError:
+                # Redis drops the list of an empty queue
+                depth = 0
+            gauges[f"celery.{queue}.depth"] = depth
+    return gauges
+
+
+def task_stats() -> dict:
+    """Counts and averages recorded by the workers."""
+    from django.core.cache import cache
+    gauges = {}
+    for queue in _queues():
+        values = cache.get_many([_key(queue, name) for name in COUNTERS + ('latency_ms_last',)])
+        tasks = values.get(_key(queue, 'tasks'), 0)
+        gauges[f"celery.{queue}.tasks"] = tasks
+        gauges[f"celery.{queue}.failures"] = values.get(_key(queue, 'failures'), 0)
+        gauges[f"celery.{queue}.latency_ms_last"] = values.get(_key(queue, 'latency_ms_last'), 0)
+        samples = values.get(_key(queue, 'latency_samples'), 0)
+        if samples:
+            gauges[f"celery.{queue}.latency_ms_avg"] = round(values.get(_key(queue, 'latency_ms'), 0) / samples, 1)
+        if tasks:
+            gauges[f"celery.{queue}.runtime_ms_avg"] = round(values.get(_key(queue, 'runtime_ms'), 0) / tasks, 1)
+    return gauges
+
+
+def register_collectors() -> None:
+    """Add the queue gauges to /metrics/ (called from core.urls)."""
+    from hdms_core import metrics
+    metrics.register_collector(queue_depths)
+    metrics.register_collector(task_stats)
@@ -141,12 +141,11 @@ export default function NewRequestPage() {
     const checkOpenTickets = async () => {
       if (!user?.id) return;
       try {
-        const response = await ticketService.getTickets({
+        const openCount = await ticketService.countTickets({
           requestorId: user.id,
-          status: 'pending,assigned,in_progress'
+          status: ['pending', 'assigned', 'in_progress']
         });
-        const tickets = Array.isArray(response) ? response : (response?.results || []);
-        setOpenTicketsCount(tickets.length);
+        setOpenTicketsCount(openCount);
       } catch (error) {
         // Silently fail
       }
@@ -12,7 +12,9 @@ import { TicketCard } from '../../../../components/common/TicketCard';
 import DataTable from '../../../../components/ui/DataTable';
 import { Plus, Eye } from 'lucide-react';
 import { Ticket } from '../../../../types';
-import { ticketService } from '../../../../services/api/ticketService';
+import { TicketFilters } from '../../../../services/api/ticketService';
+import { LoadMoreButton } from '../../../../components/common/LoadMoreButton';
+import { useTicketPages } from '../../../../hooks/useTicketPages';
 import { getMockTickets } from '../../../../lib/mockData';
 import { formatRelativeTime, truncateText } from '../../../../lib/helpers';
 import { SelectOption } from '../../../../components/ui/Select';
@@ -68,6 +70,13 @@ export default function RequestsPage() {
     dateRange: searchParams.get('dateRange') || 'all',
   });
 
+  // Server-side filters; search, department and date range are applied to the loaded tickets below
+  const apiFilters = useMemo<TicketFilters>(() => ({
+    requestorId: user?.id,
+    status: filters.status !== 'all' ? filters.status : undefined,
+  }), [user?.id, filters.status]);
+  const { loadFirstPage, loadMore, hasMore, loadingMore } = useTicketPages(apiFilters);
+
   // Department options (dynamically from tickets)
   const departmentOptions = useMemo<SelectOption[]>(() => {
     const departments = Array.from(new Set(tickets.map(t => t.department))).sort();
@@ -97,27 +106,9 @@ export default function RequestsPage() {
 
       setLoading(true);
       try {
-        const apiFilters: any = {
-          requestorId: user.id,
-          page: currentPage,
-          pageSize,
-        };
-
-        if (filters.status !== 'all') apiFilters.status = filters.status;
-        if (filters.priority !== 'all') apiFilters.priority = filters.priority;
-        if (filters.department !== 'all') apiFilters.department = filters.department;
-        if (filters.search) apiFilters.search = filters.search;
-
-        // Date range filter
-        if (filters.dateRange !== 'all' && filters.dateRange !== 'custom') {
-          const days = parseInt(filters.dateRange);
-          const startDate = new Date();
-          startDate.setDate(startDate.getDate() - days);
-          apiFilters.createdAfter = startDate.toISOString();
-        }
-
         try {
-          const response = await ticketService.getTickets(apiFilters);
+          // Newest page only; older requests load on demand
+          const response = await loadFirstPage();
           // Handle both TicketListResponse and array responses
           const ticketsArray = Array.isArray(response)
             ? response
@@ -141,7 +132,16 @@ export default function RequestsPage() {
     };
 
     fetchTickets();
-  }, [user?.id, filters, currentPage, pageSize]);
+  }, [user?.id, apiFilters, loadFirstPage]);
+
+  const handleLoadMore = async () => {
+    try {
+      const older = await loadMore();
+      setTickets(prev => [...prev, ...older]);
+    } catch (error) {
+      console.error('Failed to load more tickets:', error);
+    }
+  };
 
   // Filter and search tickets
   const filteredTickets = useMemo(() => {
@@ -441,6 +441,8 @@ export default function RequestsPage() {
               </div>
             </div>
           )}
+
+          <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={handleLoadMore} />
         </>
       )}
     </div>
@@ -11,7 +11,7 @@ import { ResolutionTimeTrendChart } from '../../../../components/charts/Resoluti
 import { PriorityDistributionChart } from '../../../../components/charts/PriorityDistributionChart';
 import { StatusDistributionChart } from '../../../../components/charts/StatusDistributionChart';
 import { THEME } from '../../../../lib/theme';
-import ticketService from '../../../../services/api/ticketService';
+import ticketService, { TicketAggregates, sumTicketGroups } from '../../../../services/api/ticketService';
 import { Ticket } from '../../../../types';
 import { formatDate } from '../../../../lib/helpers';
 import {
@@ -72,9 +72,15 @@ const SLAComplianceGauge: React.FC<{ value: number; height?: number }> = ({ valu
   );
 };
 
+// Local calendar day as YYYY-MM-DD, the format of the server's per-day counts
+const dayKey = (date: Date): string =>
+  `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}-${String(date.getDate()).padStart(2, '0')}`;
+
 const AdminAnalyticsPage: React.FC = () => {
   const { user } = useAuth();
   const [tickets, setTickets] = useState<Ticket[]>([]);
+  // Server-side counts for the selected date range; null while showing demo data
+  const [aggregates, setAggregates] = useState<TicketAggregates | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -90,6 +96,7 @@ const AdminAnalyticsPage: React.FC = () => {
         setLoading(true);
         setError(null);
         try {
+          // Newest page for the resolution-time charts; counts come from the stats endpoint
           const response = await ticketService.getTickets();
           const ticketsList = Array.isArray(response)
             ? response
@@ -115,6 +122,23 @@ const AdminAnalyticsPage: React.FC = () => {
     fetchTickets();
   }, []);
 
+  useEffect(() => {
+    const fetchAggregates = async () => {
+      // Per-day counts reach back to the start of the range (the endpoint allows a year)
+      const days = Math.ceil((Date.now() - new Date(dateRange.start).getTime()) / (1000 * 60 * 60 * 24)) + 1;
+      try {
+        setAggregates(await ticketService.getTicketStats(
+          { createdFrom: dateRange.start, createdTo: dateRange.end },
+          Math.min(Math.max(days, 1), 366)
+        ));
+      } catch (error) {
+        console.warn('Ticket stats not available, using loaded tickets:', error);
+        setAggregates(null);
+      }
+    };
+    fetchAggregates();
+  }, [dateRange]);
+
   // Generate demo tickets
   function generateDemoTickets(): Ticket[] {
     const now = new Date();
@@ -148,11 +172,18 @@ const AdminAnalyticsPage: React.FC = () => {
     });
   }, [tickets, dateRange]);
 
+  // Count rows: server groups for the range, or one row per loaded ticket for demo data
+  const countRows: Array<{ status: string; priority: string; department: string; count: number }> = useMemo(() => (
+    aggregates
+      ? aggregates.groups
+      : filteredTickets.map(t => ({ status: t.status, priority: t.priority, department: t.department, count: 1 }))
+  ), [aggregates, filteredTickets]);
+
   // Calculate KPIs
-  const totalTickets = filteredTickets.length;
-  const resolvedTickets = filteredTickets.filter(t =>
-    ['resolved', 'completed', 'closed'].includes(t.status)
-  ).length;
+  const totalTickets = aggregates ? aggregates.total : filteredTickets.length;
+  const resolvedTickets = aggregates
+    ? sumTicketGroups(aggregates, g => ['resolved', 'completed', 'closed'].includes(g.status))
+    : filteredTickets.filter(t => ['resolved', 'completed', 'closed'].includes(t.status)).length;
   const avgResolutionTime = useMemo(() => {
     const completed = filteredTickets.filter(t => t.resolvedDate || t.completedDate);
     if (completed.length === 0) return 0;
@@ -182,6 +213,7 @@ const AdminAnalyticsPage: React.FC = () => {
     const days = Math.ceil((new Date(dateRange.end).getTime() - new Date(dateRange.start).getTime()) / (1000 * 60 * 60 * 24));
     const data = [];
     const startDate = new Date(dateRange.start);
+    const createdByDay = new Map((aggregates?.createdByDay || []).map(d => [d.date, d.count]));
 
     for (let i = 0; i < Math.min(days, 30); i++) {
       const date = new Date(startDate);
@@ -193,7 +225,7 @@ const AdminAnalyticsPage: React.FC = () => {
         return ticketDate.toDateString() === date.toDateString();
       });
 
-      const created = dayTickets.length;
+      const created = aggregates ? (createdByDay.get(dayKey(date)) || 0) : dayTickets.length;
       const resolved = dayTickets.filter(t =>
         t.resolvedDate && new Date(t.resolvedDate).toDateString() === date.toDateString()
       ).length;
@@ -202,20 +234,20 @@ const AdminAnalyticsPage: React.FC = () => {
     }
 
     return data;
-  }, [filteredTickets, dateRange]);
+  }, [filteredTickets, aggregates, dateRange]);
+
+  const sumRows = (predicate: (row: { status: string; priority: string; department: string }) => boolean) =>
+    countRows.filter(predicate).reduce((sum, row) => sum + row.count, 0);
 
   const departmentWorkloadData = useMemo(() => {
-    const departments = Array.from(new Set(filteredTickets.map(t => t.department).filter(Boolean)));
-    return departments.map(dept => {
-      const deptTickets = filteredTickets.filter(t => t.department === dept);
-      return {
-        department: dept,
-        assigned: deptTickets.length,
-        completed: deptTickets.filter(t => t.status === 'resolved' || t.status === 'completed').length,
-        pending: deptTickets.filter(t => t.status === 'assigned' || t.status === 'pending').length,
-      };
-    });
-  }, [filteredTickets]);
+    const departments = Array.from(new Set(countRows.map(r => r.department).filter(Boolean)));
+    return departments.map(dept => ({
+      department: dept,
+      assigned: sumRows(r => r.department === dept),
+      completed: sumRows(r => r.department === dept && (r.status === 'resolved' || r.status === 'completed')),
+      pending: sumRows(r => r.department === dept && (r.status === 'assigned' || r.status === 'pending')),
+    }));
+  }, [countRows]);
 
   const resolutionTimeData = useMemo(() => {
     const days = Math.min(30, Math.ceil((new Date(dateRange.end).getTime() - new Date(dateRange.start).getTime()) / (1000 * 60 * 60 * 24)));
@@ -252,8 +284,8 @@ const AdminAnalyticsPage: React.FC = () => {
 
   const priorityDistributionData = useMemo(() => {
     const priorityCounts: Record<string, number> = {};
-    filteredTickets.forEach(t => {
-      priorityCounts[t.priority] = (priorityCounts[t.priority] || 0) + 1;
+    countRows.forEach(t => {
+      priorityCounts[t.priority] = (priorityCounts[t.priority] || 0) + t.count;
     });
 
     const colors: Record<string, string> = {
@@ -268,13 +300,13 @@ const AdminAnalyticsPage: React.FC = () => {
       value,
       color: colors[name] || '#9ca3af',
     }));
-  }, [filteredTickets]);
+  }, [countRows]);
 
   const statusDistributionData = useMemo(() => {
     const statusCounts: Record<string, number> = {};
-    filteredTickets.forEach(t => {
+    countRows.forEach(t => {
       const status = t.status.charAt(0).toUpperCase() + t.status.slice(1).replace('_', ' ');
-      statusCounts[status] = (statusCounts[status] || 0) + 1;
+      statusCounts[status] = (statusCounts[status] || 0) + t.count;
     });
 
     const colors: Record<string, string> = {
@@ -291,30 +323,32 @@ const AdminAnalyticsPage: React.FC = () => {
       count,
       color: colors[name] || '#9ca3af',
     }));
-  }, [filteredTickets]);
+  }, [countRows]);
 
-  // Reports data
+  // Reports data (resolution times are only known for the loaded tickets)
   const departmentPerformanceReport = useMemo(() => {
-    const departments = Array.from(new Set(filteredTickets.map(t => t.department).filter(Boolean)));
+    const departments = Array.from(new Set(countRows.map(r => r.department).filter(Boolean)));
     return departments.map(dept => {
       const deptTickets = filteredTickets.filter(t => t.department === dept);
-      const completed = deptTickets.filter(t => t.status === 'resolved' || t.status === 'completed').length;
-      const avgTime = deptTickets.filter(t => t.resolvedDate || t.completedDate).reduce((sum, t) => {
+      const total = sumRows(r => r.department === dept);
+      const completed = sumRows(r => r.department === dept && (r.status === 'resolved' || r.status === 'completed'));
+      const resolvedLoaded = deptTickets.filter(t => t.resolvedDate || t.completedDate);
+      const avgTime = resolvedLoaded.reduce((sum, t) => {
         const resolvedDate = new Date(t.resolvedDate || t.completedDate || '');
         const createdDate = new Date(t.submittedDate);
         return sum + (resolvedDate.getTime() - createdDate.getTime()) / (1000 * 60 * 60 * 24);
-      }, 0) / (completed || 1);
+      }, 0) / (resolvedLoaded.length || 1);
 
       return {
         department: dept,
-        totalTickets: deptTickets.length,
+        totalTickets: total,
         completed,
-        pending: deptTickets.length - completed,
+        pending: total - completed,
         avgResolutionTime: Math.round(avgTime * 10) / 10,
-        completionRate: deptTickets.length > 0 ? Math.round((completed / deptTickets.length) * 100) : 0,
+        completionRate: total > 0 ? Math.round((completed / total) * 100) : 0,
       };
     });
-  }, [filteredTickets]);
+  }, [countRows, filteredTickets]);
 
   const handleExportReport = (type: string) => {
     // In real implementation, this would generate and download a CSV/PDF
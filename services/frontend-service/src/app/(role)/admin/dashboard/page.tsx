@@ -9,7 +9,7 @@ import { DepartmentLoadChart } from '../../../../components/charts/DepartmentLoa
 import { ResolutionTimeTrendChart } from '../../../../components/charts/ResolutionTimeTrendChart';
 import { StatusDistributionChart } from '../../../../components/charts/StatusDistributionChart';
 import { THEME } from '../../../../lib/theme';
-import ticketService from '../../../../services/api/ticketService';
+import ticketService, { TicketAggregates, sumTicketGroups } from '../../../../services/api/ticketService';
 import userService from '../../../../services/api/userService';
 import { Ticket } from '../../../../types';
 import { User } from '../../../../types';
@@ -69,9 +69,25 @@ const generateDemoUsers = (): User[] => {
   }));
 };
 
+const CLOSED_STATUSES = ['resolved', 'completed', 'closed'];
+
+// Days allowed per priority before an open ticket breaches its SLA
+const SLA_DAYS: Array<{ priorities: string[]; days: number }> = [
+  { priorities: ['urgent', 'high'], days: 7 },
+  { priorities: ['medium'], days: 14 },
+  { priorities: ['low'], days: 30 },
+];
+
+// Local calendar day as YYYY-MM-DD, the format of the server's per-day counts
+const dayKey = (date: Date): string =>
+  `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}-${String(date.getDate()).padStart(2, '0')}`;
+
 const AdminDashboardPage: React.FC = () => {
   const { user } = useAuth();
   const [tickets, setTickets] = useState<Ticket[]>([]);
+  // Server-side counts over every ticket; null while showing demo data
+  const [aggregates, setAggregates] = useState<TicketAggregates | null>(null);
+  const [slaBreachCount, setSlaBreachCount] = useState<number | null>(null);
   const [users, setUsers] = useState<User[]>([]);
   const [institutions, setInstitutions] = useState<Institution[]>([]);
   const [branches, setBranches] = useState<Branch[]>([]);
@@ -86,9 +102,11 @@ const AdminDashboardPage: React.FC = () => {
         setLoading(true);
         setError(null);
 
-        // Fetch all resources in parallel
-        const [ticketsResult, usersResult, instsResult, branchesResult, deptsResult] = await Promise.allSettled([
+        // Fetch all resources in parallel; tickets are the newest page, the
+        // counts come from the stats endpoint
+        const [ticketsResult, breachResult, usersResult, instsResult, branchesResult, deptsResult] = await Promise.allSettled([
           ticketService.getTickets(),
+          Promise.all(SLA_DAYS.map(({ days }) => ticketService.getTicketStats({ olderThanHours: days * 24 }))),
           userService.getUsers(),
           fetchInstitutions(),
           fetchBranches(),
@@ -103,6 +121,16 @@ const AdminDashboardPage: React.FC = () => {
           setTickets(generateDemoTickets());
         }
 
+        // Open tickets older than their priority's SLA
+        if (breachResult.status === 'fulfilled') {
+          setSlaBreachCount(SLA_DAYS.reduce((sum, { priorities }, i) => sum + sumTicketGroups(
+            breachResult.value[i],
+            g => priorities.includes(g.priority) && !CLOSED_STATUSES.includes(g.status)
+          ), 0));
+        } else {
+          setSlaBreachCount(null);
+        }
+
         // Process Users
         if (usersResult.status === 'fulfilled') {
           const response = usersResult.value;
@@ -137,13 +165,26 @@ const AdminDashboardPage: React.FC = () => {
     fetchDashboardData();
   }, []);
 
+  useEffect(() => {
+    const fetchAggregates = async () => {
+      try {
+        setAggregates(await ticketService.getTicketStats(undefined, Number(timeRange)));
+      } catch (error) {
+        console.warn('Ticket stats not available, using loaded tickets:', error);
+        setAggregates(null);
+      }
+    };
+
+    fetchAggregates();
+  }, [timeRange]);
+
   // Calculate KPIs
   const totalUsers = users.length;
   const activeUsers = users.filter(u => u.status === 'active').length;
-  const totalTickets = tickets.length;
-  const activeTickets = tickets.filter(t =>
-    !['resolved', 'completed', 'closed', 'rejected'].includes(t.status)
-  ).length;
+  const totalTickets = aggregates ? aggregates.total : tickets.length;
+  const activeTickets = aggregates
+    ? sumTicketGroups(aggregates, g => ![...CLOSED_STATUSES, 'rejected'].includes(g.status))
+    : tickets.filter(t => ![...CLOSED_STATUSES, 'rejected'].includes(t.status)).length;
   const totalInstitutions = institutions.length;
   const totalBranches = branches.length;
   const totalDepartments = departmentsList.length > 0 ? departmentsList.length : Array.from(new Set(users.map(u => u.department).filter(Boolean))).length;
@@ -154,6 +195,7 @@ const AdminDashboardPage: React.FC = () => {
     const days = timeRange === '30' ? 30 : timeRange === '180' ? 180 : 365;
     const data = [];
     const now = new Date();
+    const createdByDay = new Map((aggregates?.createdByDay || []).map(d => [d.date, d.count]));
 
     for (let i = days - 1; i >= 0; i--) {
       const date = new Date(now);
@@ -165,7 +207,7 @@ const AdminDashboardPage: React.FC = () => {
         return ticketDate.toDateString() === date.toDateString();
       });
 
-      const created = dayTickets.length;
+      const created = aggregates ? (createdByDay.get(dayKey(date)) || 0) : dayTickets.length;
       const resolved = dayTickets.filter(t =>
         t.resolvedDate && new Date(t.resolvedDate).toDateString() === date.toDateString()
       ).length;
@@ -174,20 +216,23 @@ const AdminDashboardPage: React.FC = () => {
     }
 
     return data;
-  }, [tickets, timeRange]);
+  }, [tickets, aggregates, timeRange]);
 
   const departmentWorkloadData = useMemo(() => {
-    const departments = Array.from(new Set(tickets.map(t => t.department).filter(Boolean)));
-    return departments.map(dept => {
-      const deptTickets = tickets.filter(t => t.department === dept);
-      return {
-        department: dept,
-        assigned: deptTickets.length,
-        completed: deptTickets.filter(t => t.status === 'resolved' || t.status === 'completed').length,
-        pending: deptTickets.filter(t => t.status === 'assigned' || t.status === 'pending').length,
-      };
-    });
-  }, [tickets]);
+    const rows: Array<{ status: string; department: string; count: number }> = aggregates
+      ? aggregates.groups
+      : tickets.map(t => ({ status: t.status, department: t.department, count: 1 }));
+    const departments = Array.from(new Set(rows.map(r => r.department).filter(Boolean)));
+    const countRows = (dept: string, statuses?: string[]) => rows
+      .filter(r => r.department === dept && (!statuses || statuses.includes(r.status)))
+      .reduce((sum, r) => sum + r.count, 0);
+    return departments.map(dept => ({
+      department: dept,
+      assigned: countRows(dept),
+      completed: countRows(dept, ['resolved', 'completed']),
+      pending: countRows(dept, ['assigned', 'pending']),
+    }));
+  }, [tickets, aggregates]);
 
   const resolutionTimeData = useMemo(() => {
     const days = 30;
@@ -224,9 +269,12 @@ const AdminDashboardPage: React.FC = () => {
 
   const statusDistributionData = useMemo(() => {
     const statusCounts: Record<string, number> = {};
-    tickets.forEach(t => {
+    const rows: Array<{ status: string; count: number }> = aggregates
+      ? aggregates.groups
+      : tickets.map(t => ({ status: t.status, count: 1 }));
+    rows.forEach(t => {
       const status = t.status.charAt(0).toUpperCase() + t.status.slice(1).replace('_', ' ');
-      statusCounts[status] = (statusCounts[status] || 0) + 1;
+      statusCounts[status] = (statusCounts[status] || 0) + t.count;
     });
 
     return Object.entries(statusCounts).map(([name, count]) => ({
@@ -234,7 +282,7 @@ const AdminDashboardPage: React.FC = () => {
       count,
       color: THEME.colors.primary,
     }));
-  }, [tickets]);
+  }, [tickets, aggregates]);
 
   // Recent Users Activity
   const recentUserActivity = useMemo(() => {
@@ -261,38 +309,39 @@ const AdminDashboardPage: React.FC = () => {
   const systemAlerts = useMemo(() => {
     const alerts = [];
 
-    // SLA breaches
-    const slaBreaches = tickets.filter(t => {
-      if (['resolved', 'completed', 'closed'].includes(t.status)) return false;
+    // SLA breaches (server count; demo data is checked directly)
+    const slaBreaches = slaBreachCount ?? tickets.filter(t => {
+      if (CLOSED_STATUSES.includes(t.status)) return false;
       const createdDate = new Date(t.submittedDate);
       const now = new Date();
       const daysSinceCreation = (now.getTime() - createdDate.getTime()) / (1000 * 60 * 60 * 24);
       const slaDays = t.priority === 'urgent' || t.priority === 'high' ? 7 : t.priority === 'medium' ? 14 : 30;
       return daysSinceCreation > slaDays;
-    });
+    }).length;
 
-    if (slaBreaches.length > 0) {
+    if (slaBreaches > 0) {
       alerts.push({
         id: 'sla-breaches',
         type: 'warning',
-        title: `${slaBreaches.length} SLA Breaches`,
-        message: `${slaBreaches.length} tickets have exceeded their SLA`,
+        title: `${slaBreaches} SLA Breaches`,
+        message: `${slaBreaches} tickets have exceeded their SLA`,
         icon: AlertCircle,
       });
     }
 
     // High priority pending
-    const highPriorityPending = tickets.filter(t =>
-      (t.priority === 'high' || t.priority === 'urgent') &&
-      ['assigned', 'pending'].includes(t.status)
-    );
+    const isHighPriorityPending = (t: { priority: string; status: string }) =>
+      (t.priority === 'high' || t.priority === 'urgent') && ['assigned', 'pending'].includes(t.status);
+    const highPriorityPending = aggregates
+      ? sumTicketGroups(aggregates, isHighPriorityPending)
+      : tickets.filter(isHighPriorityPending).length;
 
-    if (highPriorityPending.length > 0) {
+    if (highPriorityPending > 0) {
       alerts.push({
         id: 'high-priority',
         type: 'error',
-        title: `${highPriorityPending.length} High Priority Pending`,
-        message: `${highPriorityPending.length} urgent/high priority tickets are pending`,
+        title: `${highPriorityPending} High Priority Pending`,
+        message: `${highPriorityPending} urgent/high priority tickets are pending`,
         icon: XCircle,
       });
     }
@@ -307,7 +356,7 @@ const AdminDashboardPage: React.FC = () => {
     });
 
     return alerts;
-  }, [tickets]);
+  }, [tickets, aggregates, slaBreachCount]);
 
   // Calculate SLA Compliance Rate
   const slaComplianceRate = useMemo(() => {
@@ -5,7 +5,7 @@ import { useAuth } from '../../../../lib/auth';
 import { Card, CardContent, CardHeader, CardTitle } from '../../../../components/ui/card';
 import { Button } from '../../../../components/ui/Button';
 import { THEME } from '../../../../lib/theme';
-import ticketService from '../../../../services/api/ticketService';
+import ticketService, { TicketAggregates, TicketFilters, sumTicketGroups } from '../../../../services/api/ticketService';
 import userService from '../../../../services/api/userService';
 import { Ticket } from '../../../../types';
 import { User } from '../../../../types';
@@ -61,6 +61,8 @@ const generateDemoUsers = (): User[] => {
 const AdminReportsPage: React.FC = () => {
   const { user } = useAuth();
   const [tickets, setTickets] = useState<Ticket[]>([]);
+  // Server-side counts for the current criteria; null while showing demo data
+  const [aggregates, setAggregates] = useState<TicketAggregates | null>(null);
   const [users, setUsers] = useState<User[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -83,29 +85,20 @@ const AdminReportsPage: React.FC = () => {
   });
   const [exportFormat, setExportFormat] = useState<'csv' | 'json' | 'pdf'>('csv');
 
+  // Criteria the ticket service filters on; department is matched on the label below
+  const reportFilters: TicketFilters = useMemo(() => ({
+    requestorId: filters.userId || undefined,
+    status: filters.status || undefined,
+    createdFrom: dateRange.from,
+    createdTo: dateRange.end,
+  }), [filters.userId, filters.status, dateRange]);
+
   useEffect(() => {
     const fetchData = async () => {
       try {
         setLoading(true);
         setError(null);
 
-        // Fetch tickets
-        try {
-          const ticketsResponse = await ticketService.getTickets();
-          const ticketsList = Array.isArray(ticketsResponse)
-            ? ticketsResponse
-            : (ticketsResponse?.results || []);
-          setTickets(ticketsList.length > 0 ? ticketsList : generateDemoTickets());
-        } catch (error: any) {
-          const isNetworkError = error?.isNetworkError || !error?.response;
-          if (isNetworkError) {
-            console.warn('API not available, using demo tickets');
-            setTickets(generateDemoTickets());
-          } else {
-            throw error;
-          }
-        }
-
         // Fetch users
         try {
           const usersResponse = await userService.getUsers();
@@ -123,7 +116,6 @@ const AdminReportsPage: React.FC = () => {
       } catch (error: any) {
         console.error('Error fetching data:', error);
         setError('Failed to load data');
-        setTickets(generateDemoTickets());
         setUsers(generateDemoUsers());
       } finally {
         setLoading(false);
@@ -132,10 +124,36 @@ const AdminReportsPage: React.FC = () => {
     fetchData();
   }, []);
 
+  useEffect(() => {
+    const fetchTickets = async () => {
+      try {
+        // Preview page and counts for the current criteria; the export loads the rest
+        const [page, stats] = await Promise.all([
+          ticketService.getTickets(reportFilters),
+          ticketService.getTicketStats(reportFilters),
+        ]);
+        setTickets(page.results);
+        setAggregates(stats);
+      } catch (error: any) {
+        const isNetworkError = error?.isNetworkError || !error?.response;
+        if (isNetworkError) {
+          console.warn('API not available, using demo tickets');
+        } else {
+          console.error('Error fetching tickets:', error);
+          setError('Failed to load data');
+        }
+        setTickets(generateDemoTickets());
+        setAggregates(null);
+      }
+    };
+    fetchTickets();
+  }, [reportFilters]);
+
   // Get unique departments
   const departments = useMemo(() => {
-    return Array.from(new Set(tickets.map(t => t.department).filter(Boolean))).sort();
-  }, [tickets]);
+    const names = [...(aggregates?.groups.map(g => g.department) || []), ...tickets.map(t => t.department)];
+    return Array.from(new Set(names.filter(Boolean))).sort();
+  }, [tickets, aggregates]);
 
   // Filter tickets based on report criteria
   const filteredTickets = useMemo(() => {
@@ -154,20 +172,35 @@ const AdminReportsPage: React.FC = () => {
     });
   }, [tickets, dateRange, filters]);
 
+  // Matching tickets across all pages (demo data only has the loaded list)
+  const matchCount = aggregates
+    ? sumTicketGroups(aggregates, g => !filters.department || g.department === filters.department)
+    : filteredTickets.length;
+
   const handleGenerateReport = async () => {
     setGenerating(true);
 
-    // Simulate report generation
-    await new Promise(resolve => setTimeout(resolve, 2000));
+    // The report covers every matching ticket, so load them all now, once
+    let reportTickets = filteredTickets;
+    if (aggregates) {
+      try {
+        reportTickets = (await ticketService.exportTickets(reportFilters))
+          .filter(t => !filters.department || t.department === filters.department);
+      } catch (error) {
+        console.error('Error loading report tickets:', error);
+        setGenerating(false);
+        alert('Failed to load tickets for the report');
+        return;
+      }
+    }
 
-    // In real implementation, this would call an API to generate the report
     const reportData = {
       type: reportType,
       dateRange,
       filters,
       format: exportFormat,
-      ticketCount: filteredTickets.length,
-      tickets: filteredTickets,
+      ticketCount: reportTickets.length,
+      tickets: reportTickets,
     };
 
     // Export based on format
@@ -185,7 +218,7 @@ const AdminReportsPage: React.FC = () => {
 
   const exportToCSV = (data: any) => {
     const headers = ['Ticket ID', 'Subject', 'Department', 'Priority', 'Status', 'requestor', 'Submitted Date', 'Resolved Date'];
-    const rows = filteredTickets.map(t => [
+    const rows = data.tickets.map((t: Ticket) => [
       t.ticketId || t.id,
       t.subject,
       t.department || 'N/A',
@@ -198,7 +231,7 @@ const AdminReportsPage: React.FC = () => {
 
     const csvContent = [
       headers.join(','),
-      ...rows.map(row => row.map(cell => `"${cell}"`).join(','))
+      ...rows.map((row: string[]) => row.map(cell => `"${cell}"`).join(','))
     ].join('\n');
 
     const blob = new Blob([csvContent], { type: 'text/csv' });
@@ -443,7 +476,7 @@ const AdminReportsPage: React.FC = () => {
             {/* Generate Button */}
             <div className="flex items-center justify-between pt-4 border-t" style={{ borderColor: THEME.colors.background }}>
               <div className="text-sm" style={{ color: THEME.colors.gray }}>
-                {filteredTickets.length} ticket{filteredTickets.length !== 1 ? 's' : ''} match your criteria
+                {matchCount} ticket{matchCount !== 1 ? 's' : ''} match your criteria
               </div>
               <Button
                 variant="primary"
@@ -511,9 +544,9 @@ const AdminReportsPage: React.FC = () => {
                   ))}
                 </tbody>
               </table>
-              {filteredTickets.length > 10 && (
+              {matchCount > 10 && (
                 <div className="mt-4 text-center text-sm" style={{ color: THEME.colors.gray }}>
-                  Showing 10 of {filteredTickets.length} tickets. Full report will be exported.
+                  Showing 10 of {matchCount} tickets. Full report will be exported.
                 </div>
               )}
             </div>
@@ -10,7 +10,7 @@ import { PriorityBadge } from '../../../../components/common/PriorityBadge';
 import { StatusBadge } from '../../../../components/common/StatusBadge';
 import { DepartmentLoadChart } from '../../../../components/charts/DepartmentLoadChart';
 import { ResolutionTimeTrendChart } from '../../../../components/charts/ResolutionTimeTrendChart';
-import ticketService from '../../../../services/api/ticketService';
+import ticketService, { TicketAggregates, sumTicketGroups } from '../../../../services/api/ticketService';
 import userService from '../../../../services/api/userService';
 import { Ticket } from '../../../../types';
 import { User } from '../../../../types';
@@ -162,10 +162,25 @@ const AssigneeDashboardPage: React.FC = () => {
   const router = useRouter();
   const [loading, setLoading] = useState(true);
   const [tickets, setTickets] = useState<Ticket[]>([]);
+  // Server-side counts for the KPIs; null while showing demo data
+  const [aggregates, setAggregates] = useState<TicketAggregates | null>(null);
   const [departmentHead, setDepartmentHead] = useState<User | null>(null);
   const [departmentWorkload, setDepartmentWorkload] = useState<DepartmentWorkloadData[]>([]);
   const [performanceMetrics, setPerformanceMetrics] = useState<PerformanceMetricsData[]>([]);
 
+  // Newest page of the user's tickets for the tables, plus server-side counts
+  const fetchAssignedTickets = async (
+    assigneeId: string
+  ): Promise<{ results: Ticket[]; stats: TicketAggregates | null }> => {
+    const [page, counts] = await Promise.all([
+      ticketService.getTickets({ assigneeId }),
+      ticketService.getTicketStats({ assigneeId }),
+    ]);
+    const stats = counts.total > 0 ? counts : null;
+    setAggregates(stats);
+    return { results: page.results, stats };
+  };
+
   useEffect(() => {
     const fetchDashboardData = async () => {
       try {
@@ -174,13 +189,12 @@ const AssigneeDashboardPage: React.FC = () => {
         // Fetch assigned tickets
         if (user?.id) {
           let ticketsList: Ticket[] = [];
+          let stats: TicketAggregates | null = null;
           try {
-            const ticketsResponse = await ticketService.getTickets({ assigneeId: user.id });
-            ticketsList = Array.isArray(ticketsResponse)
-              ? ticketsResponse
-              : (ticketsResponse?.results || []);
+            ({ results: ticketsList, stats } = await fetchAssignedTickets(user.id));
           } catch (error) {
             console.warn('API not available, using demo data');
+            setAggregates(null);
             ticketsList = generateDemoTickets();
           }
 
@@ -231,7 +245,12 @@ const AssigneeDashboardPage: React.FC = () => {
           const workloadData: DepartmentWorkloadData[] = [];
           const dept = user.department || 'IT';
           const deptTickets = ticketsList.filter(t => t.department === dept);
-          workloadData.push({
+          workloadData.push(stats ? {
+            department: dept,
+            assigned: sumTicketGroups(stats, g => g.department === dept),
+            completed: sumTicketGroups(stats, g => g.department === dept && (g.status === 'resolved' || g.status === 'completed')),
+            pending: sumTicketGroups(stats, g => g.department === dept && (g.status === 'assigned' || g.status === 'pending')),
+          } : {
             department: dept,
             assigned: deptTickets.length,
             completed: deptTickets.filter(t => t.status === 'resolved' || t.status === 'completed').length,
@@ -277,6 +296,7 @@ const AssigneeDashboardPage: React.FC = () => {
         console.error('Error fetching dashboard data:', error);
         const demoTickets = generateDemoTickets();
         setTickets(demoTickets);
+        setAggregates(null);
         setDepartmentHead({
           id: 'head1',
           name: 'Mike Assignee',
@@ -305,14 +325,14 @@ const AssigneeDashboardPage: React.FC = () => {
     }
   }, [user?.id, user?.department]);
 
-  // Calculate KPIs
-  const activeTasks = tickets.filter(t =>
-    t.status === 'in_progress'
-  ).length;
+  // Calculate KPIs (server counts cover every assigned ticket, not just the loaded page)
+  const activeTasks = aggregates
+    ? sumTicketGroups(aggregates, g => g.status === 'in_progress')
+    : tickets.filter(t => t.status === 'in_progress').length;
 
-  const pendingTasks = tickets.filter(t =>
-    t.status === 'assigned' || t.status === 'pending'
-  ).length;
+  const pendingTasks = aggregates
+    ? sumTicketGroups(aggregates, g => g.status === 'assigned' || g.status === 'pending')
+    : tickets.filter(t => t.status === 'assigned' || t.status === 'pending').length;
 
   const currentMonth = new Date().getMonth();
   const currentYear = new Date().getFullYear();
@@ -372,8 +392,7 @@ const AssigneeDashboardPage: React.FC = () => {
   const handleStartWork = async (ticketId: string) => {
     try {
       await ticketService.changeStatus(ticketId, 'in_progress');
-      const response = await ticketService.getTickets({ assigneeId: user?.id });
-      const ticketsList = Array.isArray(response) ? response : (response?.results || []);
+      const ticketsList = user?.id ? (await fetchAssignedTickets(user.id)).results : [];
       setTickets(ticketsList.length > 0 ? ticketsList : generateDemoTickets());
     } catch (error) {
       console.error('Error starting work:', error);
@@ -390,8 +409,7 @@ const AssigneeDashboardPage: React.FC = () => {
   const handleMarkComplete = async (ticketId: string) => {
     try {
       await ticketService.changeStatus(ticketId, 'completed', 'Task completed by assignee');
-      const response = await ticketService.getTickets({ assigneeId: user?.id });
-      const ticketsList = Array.isArray(response) ? response : (response?.results || []);
+      const ticketsList = user?.id ? (await fetchAssignedTickets(user.id)).results : [];
       setTickets(ticketsList.length > 0 ? ticketsList : generateDemoTickets());
     } catch (error) {
       console.error('Error completing ticket:', error);
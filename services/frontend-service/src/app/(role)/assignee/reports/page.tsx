@@ -7,7 +7,7 @@ import { Card, CardContent } from '../../../../components/ui/card';
 import { Button } from '../../../../components/ui/Button';
 import { THEME } from '../../../../lib/theme';
 import { Ticket } from '../../../../types';
-import ticketService from '../../../../services/api/ticketService';
+import ticketService, { sumTicketGroups, TicketAggregates, TicketStatsGroup } from '../../../../services/api/ticketService';
 import {
   BarChart3,
   TrendingUp,
@@ -136,6 +136,8 @@ const AnalyticsCard: React.FC<{
 const AssigneeReportsPage: React.FC = () => {
   const { user } = useAuth();
   const [tickets, setTickets] = useState<Ticket[]>([]);
+  // Server-side counts for the user's tickets; null while showing demo data
+  const [aggregates, setAggregates] = useState<TicketAggregates | null>(null);
   const router = useRouter();
   const [selectedPeriod, setSelectedPeriod] = useState('30');
   const [loading, setLoading] = useState(true);
@@ -146,12 +148,12 @@ const AssigneeReportsPage: React.FC = () => {
       try {
         setLoading(true);
         setError(null);
+        setAggregates(null);
         if (user?.id) {
           try {
-            const response = await ticketService.getTickets({ assigneeId: user.id });
-            const ticketsList = Array.isArray(response) ? response : (response?.results || []);
-            if (ticketsList.length > 0) {
-              setTickets(ticketsList);
+            const stats = await ticketService.getTicketStats({ assigneeId: user.id });
+            if (stats.total > 0) {
+              setAggregates(stats);
             } else {
               // If API returns empty, use demo data
               setTickets(generateDemoTasks(user.id));
@@ -185,22 +187,26 @@ const AssigneeReportsPage: React.FC = () => {
   // Filter tickets assigned to current user
   const myTasks: Ticket[] = tickets.filter((t: Ticket) => t.assigneeName === user?.name || t.assigneeId === user?.id);
 
+  // Count from the server aggregates, or from the demo tickets when there are none
+  const countTasks = (predicate: (t: Pick<TicketStatsGroup, 'status' | 'priority'>) => boolean): number =>
+    aggregates ? sumTicketGroups(aggregates, predicate) : myTasks.filter(predicate).length;
+
   // Calculate analytics data
-  const totalTasks = myTasks.length;
-  const resolvedTasks = myTasks.filter((t: Ticket) => t.status === 'resolved' || t.status === 'completed').length;
-  const pendingTasks = myTasks.filter((t: Ticket) => t.status === 'pending' || t.status === 'assigned').length;
-  const inProgressTasks = myTasks.filter((t: Ticket) => t.status === 'in_progress').length;
-  const rejectedTasks = myTasks.filter((t: Ticket) => t.status === 'rejected').length;
+  const totalTasks = aggregates ? aggregates.total : myTasks.length;
+  const resolvedTasks = countTasks(t => t.status === 'resolved' || t.status === 'completed');
+  const pendingTasks = countTasks(t => t.status === 'pending' || t.status === 'assigned');
+  const inProgressTasks = countTasks(t => t.status === 'in_progress');
+  const rejectedTasks = countTasks(t => t.status === 'rejected');
 
   const completionRate = totalTasks > 0 ? Math.round((resolvedTasks / totalTasks) * 100) : 0;
   const avgResolutionTime = resolvedTasks > 0 ? '1.8 days' : 'N/A';
 
   // Priority distribution
   const priorityStats = [
-    { name: 'Urgent', count: myTasks.filter((t: Ticket) => t.priority === 'urgent').length, color: THEME.colors.error },
-    { name: 'High', count: myTasks.filter((t: Ticket) => t.priority === 'high').length, color: THEME.colors.warning },
-    { name: 'Medium', count: myTasks.filter((t: Ticket) => t.priority === 'medium').length, color: THEME.colors.info },
-    { name: 'Low', count: myTasks.filter((t: Ticket) => t.priority === 'low').length, color: THEME.colors.success }
+    { name: 'Urgent', count: countTasks(t => t.priority === 'urgent'), color: THEME.colors.error },
+    { name: 'High', count: countTasks(t => t.priority === 'high'), color: THEME.colors.warning },
+    { name: 'Medium', count: countTasks(t => t.priority === 'medium'), color: THEME.colors.info },
+    { name: 'Low', count: countTasks(t => t.priority === 'low'), color: THEME.colors.success }
   ];
 
   // Status distribution
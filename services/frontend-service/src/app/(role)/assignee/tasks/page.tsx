@@ -7,7 +7,8 @@ import { Card, CardContent, CardHeader } from '../../../../components/ui/card';
 import { Button } from '../../../../components/ui/Button';
 import { PriorityBadge } from '../../../../components/common/PriorityBadge';
 import { StatusBadge } from '../../../../components/common/StatusBadge';
-import ticketService from '../../../../services/api/ticketService';
+import { LoadMoreButton } from '../../../../components/common/LoadMoreButton';
+import { useTicketPages } from '../../../../hooks/useTicketPages';
 import { Ticket } from '../../../../types';
 import { THEME } from '../../../../lib/theme';
 import { formatDate } from '../../../../lib/helpers';
@@ -27,6 +28,7 @@ const MyTasksPage: React.FC = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [activeFilter, setActiveFilter] = useState<'all' | 'active' | 'resolved'>('all');
+  const { loadFirstPage, loadMore, hasMore, loadingMore } = useTicketPages({ assigneeId: user?.id });
 
   useEffect(() => {
     const fetchTickets = async () => {
@@ -34,10 +36,9 @@ const MyTasksPage: React.FC = () => {
         setLoading(true);
         setError(null);
         if (user?.id) {
-          // Fetch all tickets assigned to user
-          const response = await ticketService.getTickets({ assigneeId: user.id });
-          const ticketsList = Array.isArray(response) ? response : (response?.results || []);
-          setTickets(ticketsList);
+          // Newest page of the user's tickets; older ones load on demand
+          const response = await loadFirstPage();
+          setTickets(response.results);
         }
       } catch (error: any) {
         console.error('Error fetching tickets:', error);
@@ -47,7 +48,16 @@ const MyTasksPage: React.FC = () => {
       }
     };
     fetchTickets();
-  }, [user?.id]);
+  }, [user?.id, loadFirstPage]);
+
+  const handleLoadMore = async () => {
+    try {
+      const older = await loadMore();
+      setTickets(prev => [...prev, ...older]);
+    } catch (error) {
+      console.error('Failed to load more tasks:', error);
+    }
+  };
 
   const filteredTickets = useMemo(() => {
     if (activeFilter === 'active') {
@@ -211,6 +221,7 @@ const MyTasksPage: React.FC = () => {
               onRowClick={(ticket) => router.push(`/assignee/task-detail/${ticket.id}`)}
             />
           )}
+          <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={handleLoadMore} />
         </CardContent>
       </Card>
     </div>
@@ -24,8 +24,10 @@ import DataTable, { Column } from '../../../../components/ui/DataTable';
 import PageSkeleton from '../../../../components/ui/PageSkeleton';
 import ErrorBanner from '../../../../components/ui/ErrorBanner';
 import ConfirmModal from '../../../../components/modals/ConfirmModal';
-import ticketService from '../../../../services/api/ticketService';
+import ticketService, { TicketAggregates, sumTicketGroups } from '../../../../services/api/ticketService';
 import { Ticket } from '../../../../types';
+import { LoadMoreButton } from '../../../../components/common/LoadMoreButton';
+import { useTicketPages } from '../../../../hooks/useTicketPages';
 import { THEME } from '../../../../lib/theme';
 import { formatDate, formatRelativeTime } from '../../../../lib/helpers';
 
@@ -71,6 +73,8 @@ const generateMockAssignedTickets = (): Ticket[] => {
   return mockTickets;
 };
 
+const ASSIGNED_STATUSES = ['assigned', 'in_progress'];
+
 const AssignedTicketsPage: React.FC = () => {
   const router = useRouter();
   const [tickets, setTickets] = useState<Ticket[]>([]);
@@ -83,6 +87,8 @@ const AssignedTicketsPage: React.FC = () => {
   const [statusFilter, setStatusFilter] = useState('all');
   const [priorityFilter, setPriorityFilter] = useState('all');
   const [departmentFilter, setDepartmentFilter] = useState('all');
+  const [aggregates, setAggregates] = useState<TicketAggregates | null>(null);
+  const { loadFirstPage, loadMore, hasMore, loadingMore } = useTicketPages({ status: ASSIGNED_STATUSES });
 
   // Fetch tickets function
   const fetchTickets = async (showRefreshing = false) => {
@@ -93,8 +99,12 @@ const AssignedTicketsPage: React.FC = () => {
     }
 
     try {
-      // Fetch both assigned and in_progress tickets
-      const response = await ticketService.getTickets();
+      // Newest page of assigned and in_progress tickets; the counts come from the server
+      const [response, counts] = await Promise.all([
+        loadFirstPage(),
+        ticketService.getTicketStats({ status: ASSIGNED_STATUSES }),
+      ]);
+      setAggregates(counts);
 
       // ✅ Check if response exists and has results
       if (response && (Array.isArray(response) || response.results)) {
@@ -123,12 +133,14 @@ const AssignedTicketsPage: React.FC = () => {
         console.warn('API not available, using mock data');
         const mockTickets = generateMockAssignedTickets();
         setTickets(mockTickets);
+        setAggregates(null);
         setUseMockData(true);
         setError(null);
       } else {
         console.error('Error fetching tickets:', error?.message || error);
         setError('Failed to load tickets. Please try again.');
         setTickets([]);
+        setAggregates(null);
         setUseMockData(false);
       }
     } finally {
@@ -153,15 +165,26 @@ const AssignedTicketsPage: React.FC = () => {
 
   const assignedTickets = tickets.filter(t => t.status === 'assigned' || t.status === 'in_progress');
 
-  // Calculate statistics
-  const stats = {
+  // Statistics cover every assigned ticket (server counts); mock data falls back to the list
+  const stats = aggregates ? {
+    total: aggregates.total,
+    assigned: sumTicketGroups(aggregates, g => g.status === 'assigned'),
+    inProgress: sumTicketGroups(aggregates, g => g.status === 'in_progress'),
+    departments: new Set(aggregates.groups.map(g => g.department)).size,
+  } : {
     total: assignedTickets.length,
     assigned: assignedTickets.filter(t => t.status === 'assigned').length,
     inProgress: assignedTickets.filter(t => t.status === 'in_progress').length,
-    byDepartment: assignedTickets.reduce((acc, t) => {
-      acc[t.department] = (acc[t.department] || 0) + 1;
-      return acc;
-    }, {} as Record<string, number>),
+    departments: new Set(assignedTickets.map(t => t.department)).size,
+  };
+
+  const handleLoadMore = async () => {
+    try {
+      const older = await loadMore();
+      setTickets(prev => [...prev, ...older]);
+    } catch (error) {
+      console.error('Failed to load more tickets:', error);
+    }
   };
 
   const handleViewTicket = (ticketId: string) => {
@@ -386,7 +409,7 @@ const AssignedTicketsPage: React.FC = () => {
               <div>
                 <p className="text-xs font-semibold text-gray-600 mb-1">Departments</p>
                 <p className="text-2xl font-bold" style={{ color: THEME.colors.success }}>
-                  {Object.keys(stats.byDepartment).length}
+                  {stats.departments}
                 </p>
               </div>
               <div className="p-3 rounded-lg" style={{ backgroundColor: THEME.colors.success + '15' }}>
@@ -483,7 +506,7 @@ const AssignedTicketsPage: React.FC = () => {
             <div className="flex items-center gap-4">
               <span className="text-sm text-gray-500">
                 Showing <span className="font-semibold text-gray-900">{filteredTickets.length}</span> of{' '}
-                <span className="font-semibold text-gray-900">{assignedTickets.length}</span> tickets
+                <span className="font-semibold text-gray-900">{stats.total}</span> tickets
               </span>
             </div>
           </div>
@@ -519,6 +542,7 @@ const AssignedTicketsPage: React.FC = () => {
                 pageSize={10}
                 showSearch={false}
               />
+              <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={handleLoadMore} />
             </div>
           )}
         </CardContent>
@@ -17,8 +17,9 @@ import {
   AlertCircle
 } from 'lucide-react';
 import { THEME } from '../../../../lib/theme';
-import ticketService from '../../../../services/api/ticketService';
 import { Ticket } from '../../../../types';
+import { LoadMoreButton } from '../../../../components/common/LoadMoreButton';
+import { useTicketPages } from '../../../../hooks/useTicketPages';
 import Link from 'next/link';
 import { generateMockReassignableTickets } from '../../../../lib/mockData';
 
@@ -31,6 +32,7 @@ const ReassignPage: React.FC = () => {
   const [searchTerm, setSearchTerm] = useState('');
   const [filterStatus, setFilterStatus] = useState('all');
   const [filterDepartment, setFilterDepartment] = useState('all');
+  const { loadFirstPage, loadMore, hasMore, loadingMore } = useTicketPages({ status: ['assigned', 'in_progress', 'pending'] });
 
   useEffect(() => {
     let isMounted = true;
@@ -39,7 +41,7 @@ const ReassignPage: React.FC = () => {
       try {
         setLoading(true);
         // Fetch tickets that can be reassigned (assigned or in_progress tickets)
-        const response = await ticketService.getTickets();
+        const response = await loadFirstPage();
 
         if (!isMounted) return;
 
@@ -92,6 +94,15 @@ const ReassignPage: React.FC = () => {
     };
   }, []);
 
+  const handleLoadMore = async () => {
+    try {
+      const older = await loadMore();
+      setTickets(prev => [...prev, ...older]);
+    } catch (error) {
+      console.error('Failed to load more tickets:', error);
+    }
+  };
+
   const filteredTickets = tickets.filter(ticket => {
     const matchesSearch =
       ticket.subject.toLowerCase().includes(searchTerm.toLowerCase()) ||
@@ -289,6 +300,8 @@ const ReassignPage: React.FC = () => {
         </div>
       )}
 
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={handleLoadMore} />
+
       {/* Stats */}
       {filteredTickets.length > 0 && (
         <div className="mt-6 p-4 bg-gray-50 rounded-lg">
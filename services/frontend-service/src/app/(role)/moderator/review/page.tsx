@@ -7,6 +7,8 @@ import { Card, CardContent } from '../../../../components/ui/card';
 import { Button } from '../../../../components/ui/Button';
 import { PriorityBadge } from '../../../../components/common/PriorityBadge';
 import { StatusBadge } from '../../../../components/common/StatusBadge';
+import { LoadMoreButton } from '../../../../components/common/LoadMoreButton';
+import { useTicketPages } from '../../../../hooks/useTicketPages';
 import {
   CheckCircle,
   XCircle,
@@ -19,7 +21,6 @@ import {
   AlertCircle
 } from 'lucide-react';
 import { THEME } from '../../../../lib/theme';
-import ticketService from '../../../../services/api/ticketService';
 import { Ticket } from '../../../../types';
 import Link from 'next/link';
 
@@ -31,12 +32,14 @@ const ReviewPage: React.FC = () => {
   const [searchTerm, setSearchTerm] = useState('');
   const [filterStatus, setFilterStatus] = useState('all');
   const [useMockData, setUseMockData] = useState(false);
+  const { loadFirstPage, loadMore, hasMore, loadingMore } = useTicketPages({ status: ['completed', 'in_progress'] });
 
   useEffect(() => {
     const fetchTickets = async () => {
       try {
         // Fetch tickets that are completed and need review
-        const response = await ticketService.getTickets();
+        // Newest page only; older tickets load on demand
+        const response = await loadFirstPage();
 
         // Check if response exists and has results
         if (response && (Array.isArray(response) || response.results)) {
@@ -76,6 +79,15 @@ const ReviewPage: React.FC = () => {
     fetchTickets();
   }, []);
 
+  const handleLoadMore = async () => {
+    try {
+      const older = await loadMore();
+      setTickets(prev => [...prev, ...older]);
+    } catch (error) {
+      console.error('Failed to load more tickets:', error);
+    }
+  };
+
   const filteredTickets = tickets.filter(ticket => {
     const matchesSearch =
       ticket.subject.toLowerCase().includes(searchTerm.toLowerCase()) ||
@@ -261,6 +273,8 @@ const ReviewPage: React.FC = () => {
         </div>
       )}
 
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={handleLoadMore} />
+
       {/* Stats */}
       {filteredTickets.length > 0 && (
         <div className="mt-6 p-4 bg-gray-50 rounded-lg">
@@ -11,7 +11,9 @@ import { SkeletonLoader, SkeletonTable } from '../../../../components/ui/Skeleto
 import { THEME } from '../../../../lib/theme';
 import { Ticket } from '../../../../types';
 import { formatDate, formatRelativeTime, getInitials, getAvatarColor } from '../../../../lib/helpers';
-import ticketService from '../../../../services/api/ticketService';
+import ticketService, { TicketAggregates, sumTicketGroups } from '../../../../services/api/ticketService';
+import { LoadMoreButton } from '../../../../components/common/LoadMoreButton';
+import { useTicketPages } from '../../../../hooks/useTicketPages';
 import {
   Eye,
   UserPlus,
@@ -161,6 +163,9 @@ const DropdownMenu: React.FC<DropdownMenuProps> = ({ trigger, items }) => {
   );
 };
 
+// Statuses of tickets in the moderator pool
+const POOL_STATUSES = ['pending', 'submitted', 'assigned', 'in_progress', 'postponed'];
+
 export default function TicketPoolPage() {
   const router = useRouter();
   const searchParams = useSearchParams();
@@ -180,12 +185,19 @@ export default function TicketPoolPage() {
   const [slaFilter, setSlaFilter] = useState<'all' | 'breached' | 'approaching' | 'normal'>('all');
   const [showFilters, setShowFilters] = useState(false);
   const [useMockData, setUseMockData] = useState(false);
+  const [aggregates, setAggregates] = useState<TicketAggregates | null>(null);
+  const { loadFirstPage, loadMore, hasMore, loadingMore } = useTicketPages({ status: POOL_STATUSES });
 
   useEffect(() => {
     const fetchTickets = async () => {
       try {
-        const response = await ticketService.getTickets();
+        // Newest page of the pool; tab counts come from the server
+        const [response, counts] = await Promise.all([
+          loadFirstPage(),
+          ticketService.getTicketStats({ status: POOL_STATUSES }),
+        ]);
         const ticketsList = Array.isArray(response) ? response : (response?.results || []);
+        setAggregates(ticketsList.length > 0 ? counts : null);
 
         if (ticketsList.length > 0) {
           setTickets(ticketsList);
@@ -216,6 +228,21 @@ export default function TicketPoolPage() {
     fetchTickets();
   }, []);
 
+  const handleLoadMore = async () => {
+    try {
+      const older = await loadMore();
+      setTickets(prev => [...prev, ...older]);
+    } catch (error) {
+      console.error('Failed to load more tickets:', error);
+    }
+  };
+
+  // Tab counts: server totals, or the loaded list for mock data
+  const countByStatus = (statuses: string[]) => aggregates
+    ? sumTicketGroups(aggregates, g => statuses.includes(g.status))
+    : tickets.filter(t => statuses.includes(t.status)).length;
+  const totalCount = aggregates ? aggregates.total : tickets.length;
+
   // Filter options
   const statusOptions = [
     { value: 'all', label: 'All Statuses' },
@@ -455,21 +482,21 @@ export default function TicketPoolPage() {
             size="sm"
             onClick={() => setView('all')}
           >
-            All ({tickets.length})
+            All ({totalCount})
           </Button>
           <Button
             variant={view === 'pending' ? 'primary' : 'outline'}
             size="sm"
             onClick={() => setView('pending')}
           >
-            Pending ({tickets.filter(t => t.status === 'pending' || t.status === 'submitted').length})
+            Pending ({countByStatus(['pending', 'submitted'])})
           </Button>
           <Button
             variant={view === 'under_review' ? 'primary' : 'outline'}
             size="sm"
             onClick={() => setView('under_review')}
           >
-            Under Review ({tickets.filter(t => t.status === 'submitted').length})
+            Under Review ({countByStatus(['submitted'])})
           </Button>
         </div>
       </div>
@@ -804,7 +831,7 @@ export default function TicketPoolPage() {
             <div className="px-4 py-4 bg-gray-50 border-t border-gray-200 flex flex-col sm:flex-row items-center justify-between gap-4">
               <div className="text-sm text-gray-600">
                 Showing <span className="font-semibold">{filteredTickets.length}</span> of{' '}
-                <span className="font-semibold">{filteredTickets.length}</span> tickets
+                <span className="font-semibold">{totalCount}</span> tickets
               </div>
               <div className="flex items-center gap-2">
                 <Button
@@ -825,6 +852,7 @@ export default function TicketPoolPage() {
               </div>
             </div>
           )}
+          <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={handleLoadMore} />
         </CardContent>
       </Card>
     </div>
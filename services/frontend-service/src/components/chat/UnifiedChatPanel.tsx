@@ -4,6 +4,8 @@ import React, { useState, useEffect, useRef, useCallback } from 'react';
 import { useAuth } from '../../lib/auth';
 import { ticketService } from '../../services/api/ticketService';
 import { fileService } from '../../services/api/fileService';
+import { useCommentPages } from '../../hooks/useCommentPages';
+import { Comment } from '../../types';
 import chatSocket, { WebSocketMessage } from '../../services/socket/chatSocket';
 import {
     Send,
@@ -60,6 +62,9 @@ const UnifiedChatPanel: React.FC<UnifiedChatPanelProps> = ({ ticketId, className
     const inputRef = useRef<HTMLTextAreaElement>(null);
     const fileInputRef = useRef<HTMLInputElement>(null);
     const chatContainerRef = useRef<HTMLDivElement>(null);
+    // Set once the first page is in, so (re)connects know there is a position to catch up from
+    const hasLoadedRef = useRef(false);
+    const { loadLatest, loadOlder, loadNewer, hasOlder, loadingOlder } = useCommentPages(ticketId);
 
     // Load initial messages
     useEffect(() => {
@@ -73,7 +78,11 @@ const UnifiedChatPanel: React.FC<UnifiedChatPanelProps> = ({ ticketId, className
 
         chatSocket.connect(ticketId, token, {
             onMessage: handleWebSocketMessage,
-            onConnect: () => setIsConnected(true),
+            onConnect: () => {
+                setIsConnected(true);
+                // Messages broadcast while the socket was down are only in the API
+                if (hasLoadedRef.current) loadNewMessagesRef.current();
+            },
             onDisconnect: () => setIsConnected(false),
             onError: () => setIsConnected(false),
             onTyping: handleTypingIndicator
@@ -84,13 +93,13 @@ const UnifiedChatPanel: React.FC<UnifiedChatPanelProps> = ({ ticketId, className
         };
     }, [ticketId]);
 
-    // Auto-scroll to bottom on new messages ONLY (not on typing indicator)
+    // Auto-scroll to bottom on new messages ONLY (not on typing indicator or older pages)
+    const lastMessageId = messages[messages.length - 1]?.id;
     useEffect(() => {
-        const messagesLength = messages.length;
-        if (messagesLength > 0) {
+        if (lastMessageId) {
             scrollToBottom();
         }
-    }, [messages.length]); // Only trigger when message count changes
+    }, [lastMessageId]); // Only trigger when the newest message changes
 
     // Handle escape key to close expanded view
     useEffect(() => {
@@ -104,23 +113,26 @@ const UnifiedChatPanel: React.FC<UnifiedChatPanelProps> = ({ ticketId, className
         return () => document.removeEventListener('keydown', handleEscape);
     }, [isExpanded]);
 
+    const toChatMessage = (c: Comment): ChatMessage => ({
+        id: c.id,
+        ticketId: c.ticketId,
+        senderId: c.userId,
+        senderName: c.userName,
+        senderRole: c.userRole || 'user',
+        employeeCode: c.employeeCode,
+        content: c.content,
+        timestamp: c.timestamp,
+        isOwn: c.userId === user?.id,
+        status: 'delivered' as const
+    });
+
     const loadMessages = async () => {
         setIsLoading(true);
+        hasLoadedRef.current = false;
         try {
-            const comments = await ticketService.getComments(ticketId);
-            const mappedMessages: ChatMessage[] = comments.map(c => ({
-                id: c.id,
-                ticketId: c.ticketId,
-                senderId: c.userId,
-                senderName: c.userName,
-                senderRole: c.userRole || 'user',
-                employeeCode: c.employeeCode,
-                content: c.content,
-                timestamp: c.timestamp,
-                isOwn: c.userId === user?.id,
-                status: 'delivered' as const
-            }));
-            setMessages(mappedMessages);
+            const comments = await loadLatest();
+            setMessages(comments.map(toChatMessage));
+            hasLoadedRef.current = true;
         } catch (error) {
             console.error('Error loading messages:', error);
         } finally {
@@ -128,6 +140,51 @@ const UnifiedChatPanel: React.FC<UnifiedChatPanelProps> = ({ ticketId, className
         }
     };
 
+    // Catch up with messages sent since the newest one loaded (after a reconnect)
+    const loadNewMessages = async () => {
+        try {
+            const incoming = (await loadNewer()).map(toChatMessage);
+            if (incoming.length === 0) return;
+            setMessages(prev => {
+                const seen = new Set(prev.map(m => m.id));
+                const fresh = incoming.filter(m => !seen.has(m.id));
+                // Own messages sent just before the drop never had their broadcast replace the optimistic copy
+                const confirmed = (m: ChatMessage) =>
+                    m.isOwn && m.status !== 'delivered' &&
+                    fresh.some(f => f.isOwn && f.content.trim() === m.content.trim());
+                return [...prev.filter(m => !confirmed(m)), ...fresh];
+            });
+        } catch (error) {
+            console.error('Error loading new messages:', error);
+        }
+    };
+
+    // The socket callbacks are bound once per ticket; read the current catch-up through a ref
+    const loadNewMessagesRef = useRef(loadNewMessages);
+    loadNewMessagesRef.current = loadNewMessages;
+
+    // Prepend the previous page, keeping the messages in view where they were
+    const loadOlderMessages = async () => {
+        const container = chatContainerRef.current;
+        const previousHeight = container?.scrollHeight ?? 0;
+        try {
+            const older = (await loadOlder()).map(toChatMessage);
+            if (older.length === 0) return;
+            setMessages(prev => [...older, ...prev]);
+            requestAnimationFrame(() => {
+                if (container) container.scrollTop += container.scrollHeight - previousHeight;
+            });
+        } catch (error) {
+            console.error('Error loading older messages:', error);
+        }
+    };
+
+    const handleMessagesScroll = (e: React.UIEvent<HTMLDivElement>) => {
+        if (e.currentTarget.scrollTop < 40 && hasOlder && !loadingOlder) {
+            loadOlderMessages();
+        }
+    };
+
     const handleWebSocketMessage = useCallback((wsMessage: WebSocketMessage) => {
         if (wsMessage.type === 'message' && wsMessage.data) {
             const newMsg: ChatMessage = {
@@ -469,6 +526,7 @@ const UnifiedChatPanel: React.FC<UnifiedChatPanelProps> = ({ ticketId, className
             {/* Messages Area */}
             <div
                 ref={chatContainerRef}
+                onScroll={handleMessagesScroll}
                 className="flex-1 overflow-y-auto p-4 space-y-3"
                 style={{
                     backgroundColor: '#f0f2f5',
@@ -489,7 +547,13 @@ const UnifiedChatPanel: React.FC<UnifiedChatPanelProps> = ({ ticketId, className
                         <p className="text-xs text-gray-400 mt-1">Start the conversation!</p>
                     </div>
                 ) : (
-                    messages.map((msg, index) => {
+                    <>
+                    {loadingOlder && (
+                        <div className="flex justify-center py-2">
+                            <Loader2 className="w-4 h-4 animate-spin text-gray-400" />
+                        </div>
+                    )}
+                    {messages.map((msg, index) => {
                         const prevMsg = index > 0 ? messages[index - 1] : undefined;
                         const showDate = shouldShowDateSeparator(msg, prevMsg);
 
@@ -576,7 +640,8 @@ const UnifiedChatPanel: React.FC<UnifiedChatPanelProps> = ({ ticketId, className
                                 </div>
                             </React.Fragment>
                         );
-                    })
+                    })}
+                    </>
                 )}
                 <div ref={messagesEndRef} />
 
@@ -0,0 +1,20 @@
+import React from 'react';
+import { Button } from '../ui/Button';
+
+interface LoadMoreButtonProps {
+  hasMore: boolean;
+  loading: boolean;
+  onClick: () => void;
+}
+
+// "Load more" for page-at-a-time lists (see hooks/useTicketPages)
+export const LoadMoreButton: React.FC<LoadMoreButtonProps> = ({ hasMore, loading, onClick }) => {
+  if (!hasMore) return null;
+  return (
+    <div className="flex justify-center py-4">
+      <Button variant="outline" size="sm" loading={loading} disabled={loading} onClick={onClick}>
+        Load more
+      </Button>
+    </div>
+  );
+};
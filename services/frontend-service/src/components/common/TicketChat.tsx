@@ -3,6 +3,7 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { useAuth } from '../../lib/auth';
 import { ticketService } from '../../services/api/ticketService';
+import { useCommentPages } from '../../hooks/useCommentPages';
 import { Comment } from '../../types';
 import { Card, CardContent } from '../ui/card';
 import { THEME } from '../../lib/theme';
@@ -35,6 +36,25 @@ interface TicketChatProps {
   allowSubTicketRequest?: boolean;
 }
 
+const toMessage = (c: Comment): Message => ({
+  id: c.id,
+  ticketId: c.ticketId,
+  userId: c.userId,
+  userName: c.userName,
+  userRole: c.userRole || 'user',
+  employeeCode: c.employeeCode,
+  message: c.content,
+  timestamp: c.timestamp,
+  attachments: c.attachments?.map(att => ({
+    id: att.id,
+    name: att.name,
+    type: att.type,
+    size: att.size,
+    data: att.url, // URL mapping
+    thumbnail: att.thumbnailUrl
+  }))
+});
+
 const TicketChat: React.FC<TicketChatProps> = ({ ticketId }) => {
   const { user } = useAuth();
   const [messages, setMessages] = useState<Message[]>([]);
@@ -45,47 +65,52 @@ const TicketChat: React.FC<TicketChatProps> = ({ ticketId }) => {
   const [previewFile, setPreviewFile] = useState<FileAttachment | null>(null);
   const messagesEndRef = useRef<HTMLDivElement>(null);
   const fileInputRef = useRef<HTMLInputElement>(null);
+  const { loadLatest, loadOlder, loadNewer, hasOlder, loadingOlder } = useCommentPages(ticketId);
 
-  // Load messages from backend
+  // Load the newest page, then poll for messages sent since
   useEffect(() => {
     loadMessages();
-    // Poll for new messages every 10 seconds? Or just rely on reloads/actions for now
-    const interval = setInterval(loadMessages, 10000);
+    const interval = setInterval(loadNewMessages, 10000);
     return () => clearInterval(interval);
   }, [ticketId]);
 
-  // Auto-scroll to bottom when new messages arrive
+  // Auto-scroll to bottom when a new message arrives (not when older ones are prepended)
+  const lastMessageId = messages[messages.length - 1]?.id;
   useEffect(() => {
     scrollToBottom();
-  }, [messages]);
+  }, [lastMessageId]);
 
   const loadMessages = async () => {
     try {
-      const comments = await ticketService.getComments(ticketId);
-      const mappedMessages: Message[] = comments.map(c => ({
-        id: c.id,
-        ticketId: c.ticketId,
-        userId: c.userId,
-        userName: c.userName,
-        userRole: c.userRole || 'user',
-        employeeCode: c.employeeCode,
-        message: c.content,
-        timestamp: c.timestamp,
-        attachments: c.attachments?.map(att => ({
-          id: att.id,
-          name: att.name,
-          type: att.type,
-          size: att.size,
-          data: att.url, // URL mapping
-          thumbnail: att.thumbnailUrl
-        }))
-      }));
-      setMessages(mappedMessages);
+      const comments = await loadLatest();
+      setMessages(comments.map(toMessage));
     } catch (error) {
       console.error('Error loading messages:', error);
     }
   };
 
+  const loadNewMessages = async () => {
+    try {
+      const comments = await loadNewer();
+      if (comments.length === 0) return;
+      setMessages(prev => {
+        const seen = new Set(prev.map(m => m.id));
+        return [...prev, ...comments.filter(c => !seen.has(c.id)).map(toMessage)];
+      });
+    } catch (error) {
+      console.error('Error loading new messages:', error);
+    }
+  };
+
+  const loadOlderMessages = async () => {
+    try {
+      const comments = await loadOlder();
+      setMessages(prev => [...comments.map(toMessage), ...prev]);
+    } catch (error) {
+      console.error('Error loading older messages:', error);
+    }
+  };
+
   const scrollToBottom = () => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
   };
@@ -187,9 +212,8 @@ const TicketChat: React.FC<TicketChatProps> = ({ ticketId }) => {
       if (newMessage.trim()) {
         const comment = await ticketService.addComment(ticketId, newMessage.trim());
 
-        // Optimistic update or wait for reload?
-        // Let's reload to be safe and ensure consistent ID/timestamp
-        await loadMessages();
+        // Fetch what was sent since the last load, so the server's ID/timestamp are used
+        await loadNewMessages();
       }
 
       // TODO: Handle file attachments upload separately if needed
@@ -309,7 +333,20 @@ const TicketChat: React.FC<TicketChatProps> = ({ ticketId }) => {
               <p className="text-xs opacity-75 mt-1">Start the conversation!</p>
             </div>
           ) : (
-            messages.map((msg, index) => {
+            <>
+            {hasOlder && (
+              <div className="flex justify-center mb-3">
+                <button
+                  onClick={loadOlderMessages}
+                  disabled={loadingOlder}
+                  className="text-xs px-3 py-1 rounded-full bg-white/80 shadow-sm hover:bg-white disabled:opacity-60"
+                  style={{ color: THEME.colors.gray }}
+                >
+                  {loadingOlder ? 'Loading...' : 'Load earlier messages'}
+                </button>
+              </div>
+            )}
+            {messages.map((msg, index) => {
               const previousMsg = index > 0 ? messages[index - 1] : undefined;
               const showDate = shouldShowDate(msg, previousMsg);
               const isOwnMessage = msg.userId === user?.id;
@@ -466,7 +503,8 @@ const TicketChat: React.FC<TicketChatProps> = ({ ticketId }) => {
                   </div>
                 </React.Fragment>
               );
-            })
+            })}
+            </>
           )}
           <div ref={messagesEndRef} />
         </div>
@@ -15,28 +15,30 @@ import {
   UserPlus
 } from 'lucide-react';
 import ticketService from '../../services/api/ticketService';
-import { Ticket } from '../../types';
 
 const AdminDashboard: React.FC = () => {
   const { user } = useAuth();
-  const [tickets, setTickets] = useState<Ticket[]>([]);
+  const [ticketCounts, setTicketCounts] = useState({ total: 0, resolved: 0 });
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     const fetchTickets = async () => {
       try {
-        const response = await ticketService.getTickets();
-        const ticketsList = response.results || [];
-        setTickets(ticketsList);
+        // Totals come from the server's count, not from one page of results
+        const [total, resolved] = await Promise.all([
+          ticketService.countTickets(),
+          ticketService.countTickets({ status: 'resolved' }),
+        ]);
+        setTicketCounts({ total, resolved });
       } catch (error: any) {
         // Handle network errors gracefully - API might not be available
         const isNetworkError = error?.isNetworkError || !error?.response;
         if (isNetworkError) {
           console.warn('API not available, using empty tickets list');
-          setTickets([]);
+          setTicketCounts({ total: 0, resolved: 0 });
         } else {
           console.error('Error fetching tickets:', error?.message || error);
-          setTickets([]);
+          setTicketCounts({ total: 0, resolved: 0 });
         }
       } finally {
         setLoading(false);
@@ -48,8 +50,8 @@ const AdminDashboard: React.FC = () => {
   const systemStats = {
     totalUsers: 156,
     activeUsers: 142,
-    totalTickets: tickets.length,
-    resolvedTickets: tickets.filter(t => t.status === 'resolved').length,
+    totalTickets: ticketCounts.total,
+    resolvedTickets: ticketCounts.resolved,
     avgResolutionTime: '2.3 days',
     systemUptime: '99.8%',
     satisfactionRating: 4.7
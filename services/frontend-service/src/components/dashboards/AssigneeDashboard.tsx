@@ -27,7 +27,7 @@ import {
 import Link from 'next/link';
 import { THEME } from '../../lib/theme';
 import { AnalyticsCard } from '../common/AnalyticsCard';
-import ticketService from '../../services/api/ticketService';
+import ticketService, { TicketAggregates, sumTicketGroups } from '../../services/api/ticketService';
 import { Ticket } from '../../types';
 
 const AssigneeDashboard: React.FC = () => {
@@ -35,23 +35,30 @@ const AssigneeDashboard: React.FC = () => {
   const router = useRouter();
   const [searchTerm, setSearchTerm] = useState('');
   const [tickets, setTickets] = useState<Ticket[]>([]);
+  const [aggregates, setAggregates] = useState<TicketAggregates | null>(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     const fetchTickets = async () => {
       try {
-        const response = await ticketService.getTickets({ assigneeId: user?.id });
-        const ticketsList = response.results || [];
-        setTickets(ticketsList);
+        // Newest page for the task list; the stat cards use server-side counts
+        const [response, stats] = await Promise.all([
+          ticketService.getTickets({ assigneeId: user?.id }),
+          ticketService.getTicketStats({ assigneeId: user?.id }),
+        ]);
+        setTickets(response.results || []);
+        setAggregates(stats);
       } catch (error: any) {
         // Handle network errors gracefully - API might not be available
         const isNetworkError = error?.isNetworkError || !error?.response;
         if (isNetworkError) {
           console.warn('API not available, using empty tickets list');
           setTickets([]);
+          setAggregates(null);
         } else {
           console.error('Error fetching tickets:', error?.message || error);
           setTickets([]);
+          setAggregates(null);
         }
       } finally {
         setLoading(false);
@@ -86,8 +93,12 @@ const AssigneeDashboard: React.FC = () => {
     task.department?.toLowerCase().includes(searchTerm.toLowerCase())
   );
 
-  const completionRate = myTasks.length > 0 ? Math.round((myTasks.filter(t => t.status === 'resolved').length / myTasks.length) * 100) : 0;
-  const activeTasks = myTasks.filter(t => t.status === 'assigned' || t.status === 'in_progress').length;
+  const totalTasks = aggregates?.total ?? 0;
+  const assignedTasks = sumTicketGroups(aggregates, g => g.status === 'assigned');
+  const inProgressTasks = sumTicketGroups(aggregates, g => g.status === 'in_progress');
+  const resolvedTasks = sumTicketGroups(aggregates, g => g.status === 'resolved');
+  const completionRate = totalTasks > 0 ? Math.round((resolvedTasks / totalTasks) * 100) : 0;
+  const activeTasks = assignedTasks + inProgressTasks;
 
   if (loading) {
     return <div className="p-8">Loading...</div>;
@@ -109,7 +120,7 @@ const AssigneeDashboard: React.FC = () => {
       <div className="grid grid-cols-1 md:grid-cols-4 gap-4">
         <AnalyticsCard
           title="Total Tasks"
-          value={myTasks.length}
+          value={totalTasks}
           icon={FileText}
           color={THEME.colors.light}
           onClick={() => router.push('/assignee/tasks')}
@@ -117,7 +128,7 @@ const AssigneeDashboard: React.FC = () => {
         />
         <AnalyticsCard
           title="Assigned"
-          value={myTasks.filter(t => t.status === 'assigned').length}
+          value={assignedTasks}
           icon={Clock}
           color={THEME.colors.medium}
           onClick={() => router.push('/assignee/tasks')}
@@ -125,7 +136,7 @@ const AssigneeDashboard: React.FC = () => {
         />
         <AnalyticsCard
           title="In Progress"
-          value={myTasks.filter(t => t.status === 'in_progress').length}
+          value={inProgressTasks}
           icon={PlayCircle}
           color={THEME.colors.primary}
           onClick={() => router.push('/assignee/tasks')}
@@ -133,7 +144,7 @@ const AssigneeDashboard: React.FC = () => {
         />
         <AnalyticsCard
           title="Completed"
-          value={myTasks.filter(t => t.status === 'resolved').length}
+          value={resolvedTasks}
           icon={CheckCircle}
           color={THEME.colors.gray}
           onClick={() => router.push('/assignee/tasks')}
@@ -179,7 +190,7 @@ const AssigneeDashboard: React.FC = () => {
                   <div
                     className="h-4 rounded-full transition-all duration-1000 ease-out shadow-lg"
                     style={{
-                      width: `${myTasks.length > 0 ? (activeTasks / myTasks.length) * 100 : 0}%`,
+                      width: `${totalTasks > 0 ? (activeTasks / totalTasks) * 100 : 0}%`,
                       backgroundColor: THEME.colors.medium
                     }}
                   ></div>
@@ -190,7 +201,7 @@ const AssigneeDashboard: React.FC = () => {
               <div className="grid grid-cols-2 gap-6 pt-6 border-t" style={{ borderColor: THEME.colors.background }}>
                 <div className="text-center">
                   <div className="text-3xl font-bold mb-1" style={{ color: THEME.colors.primary }}>
-                    {myTasks.filter(t => t.status === 'resolved').length}
+                    {resolvedTasks}
                   </div>
                   <div className="text-sm font-medium" style={{ color: THEME.colors.gray }}>Completed</div>
                 </div>
@@ -7,7 +7,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '../ui/card';
 import { KpiCard } from '../common/KpiCard';
 import { DepartmentLoadChart } from '../charts/DepartmentLoadChart';
 import { DashboardHeader } from './DashboardHeader';
-import ticketService from '../../services/api/ticketService';
+import ticketService, { TicketAggregates, sumTicketGroups } from '../../services/api/ticketService';
 import { Ticket } from '../../types';
 import { THEME } from '../../lib/theme';
 import { formatRelativeTime, formatDate } from '../../lib/helpers';
@@ -52,10 +52,25 @@ interface SLATicket {
   isApproaching: boolean;
 }
 
+const CLOSED_STATUSES = ['resolved', 'closed', 'rejected'];
+const OPEN_STATUSES = [
+  'submitted', 'pending', 'under_review', 'assigned', 'in_progress',
+  'waiting_approval', 'approved', 'reopened', 'postponed',
+];
+const SLA_HOURS = 72; // 3 days default SLA
+
+// Server-side counts behind the KPI cards
+interface DashboardAggregates {
+  all: TicketAggregates;
+  pendingOverdue: TicketAggregates;
+  pastSla: TicketAggregates;
+}
+
 const ModeratorDashboard: React.FC = () => {
   const { user } = useAuth();
   const router = useRouter();
   const [tickets, setTickets] = useState<Ticket[]>([]);
+  const [aggregates, setAggregates] = useState<DashboardAggregates | null>(null);
   const [loading, setLoading] = useState(true);
   const [recentActivity, setRecentActivity] = useState<any[]>([]);
   const [useMockData, setUseMockData] = useState(false);
@@ -63,21 +78,32 @@ const ModeratorDashboard: React.FC = () => {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const response = await ticketService.getTickets();
-        const ticketsList = Array.isArray(response) ? response : (response?.results || []);
+        // Counts come from server aggregates; the lists only need the newest page
+        // and the newest page of tickets waiting more than a day
+        const [page, aging, all, pendingOverdue, pastSla] = await Promise.all([
+          ticketService.getTickets(),
+          ticketService.getTickets({ status: OPEN_STATUSES, olderThanHours: 24 }),
+          ticketService.getTicketStats(),
+          ticketService.getTicketStats({ status: ['pending', 'submitted'], olderThanHours: 24 }),
+          ticketService.getTicketStats({ status: OPEN_STATUSES, olderThanHours: SLA_HOURS }),
+        ]);
+        const seen = new Set(page.results.map(t => t.id));
+        const ticketsList = [...page.results, ...aging.results.filter(t => !seen.has(t.id))];
 
         if (ticketsList.length > 0) {
           setTickets(ticketsList);
+          setAggregates({ all, pendingOverdue, pastSla });
           setUseMockData(false);
         } else {
           // Use mock data if API returns empty
           const mockTickets = generateMockTickets();
           setTickets(mockTickets);
+          setAggregates(null);
           setUseMockData(true);
         }
 
         // Generate recent activity from tickets
-        const activity = generateRecentActivity(ticketsList.length > 0 ? ticketsList : generateMockTickets());
+        const activity = generateRecentActivity(ticketsList.length > 0 ? page.results : generateMockTickets());
         setRecentActivity(activity);
       } catch (error: any) {
         const isNetworkError = error?.isNetworkError || !error?.response;
@@ -85,6 +111,7 @@ const ModeratorDashboard: React.FC = () => {
           console.warn('API not available, using mock data');
           const mockTickets = generateMockTickets();
           setTickets(mockTickets);
+          setAggregates(null);
           setUseMockData(true);
 
           const activity = generateRecentActivity(mockTickets);
@@ -95,6 +122,7 @@ const ModeratorDashboard: React.FC = () => {
 
           const mockTickets = generateMockTickets();
           setTickets(mockTickets);
+          setAggregates(null);
           setUseMockData(true);
 
           const activity = generateRecentActivity(mockTickets);
@@ -111,7 +139,7 @@ const ModeratorDashboard: React.FC = () => {
   const stats: DashboardStats = useMemo(() => {
     const now = new Date();
     const today = new Date(now.getFullYear(), now.getMonth(), now.getDate());
-    const slaHours = 72; // 3 days default SLA
+    const slaHours = SLA_HOURS;
 
     // Pending Review - tickets pending > 24 hours
     const pendingReview = tickets.filter(t => {
@@ -153,22 +181,28 @@ const ModeratorDashboard: React.FC = () => {
     }).length;
 
     return {
-      pendingReview,
-      totalActiveTickets,
+      // Mock data has no aggregates, so its counts come from the list
+      pendingReview: aggregates ? aggregates.pendingOverdue.total : pendingReview,
+      totalActiveTickets: aggregates
+        ? sumTicketGroups(aggregates.all, g => !CLOSED_STATUSES.includes(g.status))
+        : totalActiveTickets,
       ticketsAssignedToday,
       averageResolutionTime: Math.round(avgResolutionTime),
-      slaBreaches
+      slaBreaches: aggregates ? aggregates.pastSla.total : slaBreaches
     };
-  }, [tickets]);
+  }, [tickets, aggregates]);
 
   // Department Workload
   const departmentWorkload: DepartmentWorkload[] = useMemo(() => {
     const deptMap = new Map<string, number>();
 
-    tickets.forEach(t => {
-      if (!['resolved', 'closed', 'rejected'].includes(t.status)) {
+    const rows: Array<{ status: string; department: string; count: number }> = aggregates
+      ? aggregates.all.groups
+      : tickets.map(t => ({ status: t.status, department: t.department, count: 1 }));
+    rows.forEach(t => {
+      if (!CLOSED_STATUSES.includes(t.status)) {
         const count = deptMap.get(t.department) || 0;
-        deptMap.set(t.department, count + 1);
+        deptMap.set(t.department, count + t.count);
       }
     });
 
@@ -181,7 +215,7 @@ const ModeratorDashboard: React.FC = () => {
     });
 
     return workload.sort((a, b) => b.activeTickets - a.activeTickets);
-  }, [tickets]);
+  }, [tickets, aggregates]);
 
   // Chart data for Department Workload
   const chartData = useMemo(() => {
@@ -201,7 +235,7 @@ const ModeratorDashboard: React.FC = () => {
     tickets.forEach(ticket => {
       const submitted = new Date(ticket.submittedDate);
       const hoursSinceSubmission = (now.getTime() - submitted.getTime()) / (1000 * 60 * 60);
-      const slaHours = 72;
+      const slaHours = SLA_HOURS;
 
       // Pending review > 24 hours
       if ((ticket.status === 'pending' || ticket.status === 'submitted') && hoursSinceSubmission > 24) {
@@ -236,7 +270,7 @@ const ModeratorDashboard: React.FC = () => {
   // SLA Alerts
   const slaAlerts: SLATicket[] = useMemo(() => {
     const now = new Date();
-    const slaHours = 72;
+    const slaHours = SLA_HOURS;
     const alerts: SLATicket[] = [];
 
     tickets.forEach(ticket => {
@@ -363,6 +397,16 @@ const ModeratorDashboard: React.FC = () => {
     router.push(`/moderator/review?id=${ticketId}`);
   };
 
+  const headerCounts = aggregates ? {
+    total: aggregates.all.total,
+    resolved: sumTicketGroups(aggregates.all, g => g.status === 'resolved'),
+    pending: sumTicketGroups(aggregates.all, g => ['pending', 'submitted'].includes(g.status)),
+  } : {
+    total: tickets.length,
+    resolved: tickets.filter(t => t.status === 'resolved').length,
+    pending: tickets.filter(t => ['pending', 'submitted'].includes(t.status)).length,
+  };
+
   if (loading) {
     return (
       <div className="min-h-screen p-4 md:p-6 lg:p-8">
@@ -396,9 +440,9 @@ const ModeratorDashboard: React.FC = () => {
         subtitle="System-wide statistics and performance metrics"
         lastUpdated={formatDate(new Date().toISOString(), 'time')}
         stats={[
-          { label: 'Total Tickets', value: tickets.length, color: THEME.colors.primary },
-          { label: 'Resolved', value: tickets.filter(t => t.status === 'resolved').length, color: THEME.colors.success },
-          { label: 'Pending', value: tickets.filter(t => ['pending', 'submitted'].includes(t.status)).length, color: THEME.colors.warning },
+          { label: 'Total Tickets', value: headerCounts.total, color: THEME.colors.primary },
+          { label: 'Resolved', value: headerCounts.resolved, color: THEME.colors.success },
+          { label: 'Pending', value: headerCounts.pending, color: THEME.colors.warning },
           { label: 'SLA Breaches', value: stats.slaBreaches, color: THEME.colors.error }
         ]}
       />
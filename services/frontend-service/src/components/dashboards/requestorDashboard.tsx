@@ -22,7 +22,7 @@ import {
   ArrowRight
 } from 'lucide-react';
 import { Ticket } from '../../types';
-import ticketService from '../../services/api/ticketService';
+import ticketService, { TicketAggregates, sumTicketGroups } from '../../services/api/ticketService';
 import {
   calculateTicketStats,
   getPriorityDistribution,
@@ -33,6 +33,7 @@ const requestorDashboard: React.FC = () => {
   const { user } = useAuth();
   const router = useRouter();
   const [tickets, setTickets] = useState<Ticket[]>([]);
+  const [aggregates, setAggregates] = useState<TicketAggregates | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [activeFilter, setActiveFilter] = useState<'all' | 'open' | 'resolved' | 'drafts'>('all');
@@ -43,8 +44,13 @@ const requestorDashboard: React.FC = () => {
       setLoading(true);
       setError(null);
       try {
-        const response = await ticketService.getTickets({ requestorId: user?.id });
+        // Newest page for the recent list; totals and distributions come from the server
+        const [response, counts] = await Promise.all([
+          ticketService.getTickets({ requestorId: user?.id }),
+          ticketService.getTicketStats({ requestorId: user?.id }),
+        ]);
         setTickets(response.results);
+        setAggregates(counts);
       } catch (error) {
         console.error('Error fetching tickets:', error);
         setError('Failed to load tickets. Please try again later.');
@@ -62,8 +68,18 @@ const requestorDashboard: React.FC = () => {
     }
   }, [user?.id]);
 
-  // Calculate statistics
-  const stats = useMemo(() => calculateTicketStats(tickets), [tickets]);
+  // Calculate statistics; resolution dates are only known for the loaded page
+  const stats = useMemo(() => {
+    const pageStats = calculateTicketStats(tickets);
+    if (!aggregates) return pageStats;
+    return {
+      ...pageStats,
+      totalRequests: aggregates.total,
+      openTickets: sumTicketGroups(aggregates, g =>
+        g.status === 'pending' || g.status === 'assigned' || g.status === 'in_progress'
+      ),
+    };
+  }, [tickets, aggregates]);
 
   // Get recent tickets (5-10 most recent)
   const recentTickets = useMemo(() => {
@@ -90,8 +106,14 @@ const requestorDashboard: React.FC = () => {
   }, [tickets, activeFilter]);
 
   // Get priority and status distributions
-  const priorityDistribution = useMemo(() => getPriorityDistribution(tickets), [tickets]);
-  const statusDistribution = useMemo(() => getStatusDistribution(tickets), [tickets]);
+  const priorityDistribution = useMemo(
+    () => getPriorityDistribution(aggregates ? aggregates.groups : tickets),
+    [tickets, aggregates]
+  );
+  const statusDistribution = useMemo(
+    () => getStatusDistribution(aggregates ? aggregates.groups : tickets),
+    [tickets, aggregates]
+  );
 
   // Format date helper
   const formatDate = (dateString: string): string => {
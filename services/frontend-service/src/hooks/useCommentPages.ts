@@ -0,0 +1,54 @@
+/**
+ * useCommentPages Hook
+ * Page-at-a-time ticket chat: load the newest page, older pages on scroll,
+ * and only the messages sent since then when polling or reconnecting
+ */
+
+import { useCallback, useRef, useState } from 'react';
+import { ticketService } from '../services/api/ticketService';
+import { Comment } from '../types';
+
+export const useCommentPages = (ticketId: string) => {
+  const [before, setBefore] = useState<string | null>(null);
+  const [loadingOlder, setLoadingOlder] = useState(false);
+  // Position just past the newest message loaded; a ref so polling timers and socket callbacks see it
+  const afterRef = useRef<string | null>(null);
+
+  /**
+   * Fetch the newest page; resolves to its comments, oldest first
+   */
+  const loadLatest = useCallback(async (): Promise<Comment[]> => {
+    const page = await ticketService.getComments(ticketId);
+    setBefore(page.before);
+    afterRef.current = page.after;
+    return page.comments;
+  }, [ticketId]);
+
+  /**
+   * Fetch the page before the oldest one loaded; resolves to its comments, oldest first
+   */
+  const loadOlder = useCallback(async (): Promise<Comment[]> => {
+    if (!before || loadingOlder) return [];
+    setLoadingOlder(true);
+    try {
+      const page = await ticketService.getOlderComments(ticketId, before);
+      setBefore(page.before);
+      return page.comments;
+    } finally {
+      setLoadingOlder(false);
+    }
+  }, [ticketId, before, loadingOlder]);
+
+  /**
+   * Fetch the comments sent since the newest one loaded; callers merge them by id
+   */
+  const loadNewer = useCallback(async (): Promise<Comment[]> => {
+    // Nothing loaded yet (empty chat or a failed first load): the newest page is the catch-up
+    if (!afterRef.current) return loadLatest();
+    const page = await ticketService.getNewerComments(ticketId, afterRef.current);
+    afterRef.current = page.after;
+    return page.comments;
+  }, [ticketId, loadLatest]);
+
+  return { loadLatest, loadOlder, loadNewer, hasOlder: before !== null, loadingOlder };
+};
@@ -0,0 +1,44 @@
+/**
+ * useTicketPages Hook
+ * Page-at-a-time ticket lists: load the newest page, then older pages on demand
+ */
+
+import { useCallback, useRef, useState } from 'react';
+import { ticketService, TicketFilters, TicketListResponse } from '../services/api/ticketService';
+import { Ticket } from '../types';
+
+const PAGE_SIZE = 50;
+
+export const useTicketPages = (filters: TicketFilters = {}, pageSize: number = PAGE_SIZE) => {
+  const [next, setNext] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  // Latest filters, so callbacks stay stable while callers pass object literals
+  const filtersRef = useRef(filters);
+  filtersRef.current = filters;
+
+  /**
+   * Fetch the newest page; callers keep their own loading and fallback handling
+   */
+  const loadFirstPage = useCallback(async (): Promise<TicketListResponse> => {
+    const page = await ticketService.getTickets({ ...filtersRef.current, pageSize });
+    setNext(page.next);
+    return page;
+  }, [pageSize]);
+
+  /**
+   * Fetch the page after the last one loaded; resolves to its tickets
+   */
+  const loadMore = useCallback(async (): Promise<Ticket[]> => {
+    if (!next) return [];
+    setLoadingMore(true);
+    try {
+      const page = await ticketService.getTickets({ ...filtersRef.current, pageSize, cursor: next });
+      setNext(page.next);
+      return page.results;
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [next, pageSize]);
+
+  return { loadFirstPage, loadMore, hasMore: next !== null, loadingMore };
+};
@@ -218,11 +218,14 @@ export const calculateTicketStats = (tickets: Ticket[]) => {
 };
 
 // Get priority distribution
-export const getPriorityDistribution = (tickets: Ticket[]) => {
+// Accepts tickets or server-side count groups (each weighted by its count)
+export const getPriorityDistribution = (tickets: Array<{ priority: string; count?: number }>) => {
+  const countPriority = (priority: string) =>
+    tickets.filter(t => t.priority === priority).reduce((sum, t) => sum + (t.count ?? 1), 0);
   const distribution = {
-    high: tickets.filter(t => t.priority === 'high').length,
-    medium: tickets.filter(t => t.priority === 'medium').length,
-    low: tickets.filter(t => t.priority === 'low').length,
+    high: countPriority('high'),
+    medium: countPriority('medium'),
+    low: countPriority('low'),
   };
 
   return [
@@ -233,12 +236,12 @@ export const getPriorityDistribution = (tickets: Ticket[]) => {
 };
 
 // Get status distribution
-export const getStatusDistribution = (tickets: Ticket[]) => {
+export const getStatusDistribution = (tickets: Array<{ status: string; count?: number }>) => {
   const statusCounts: Record<string, number> = {};
 
   tickets.forEach(ticket => {
     const status = ticket.status;
-    statusCounts[status] = (statusCounts[status] || 0) + 1;
+    statusCounts[status] = (statusCounts[status] || 0) + (ticket.count ?? 1);
   });
 
   const STATUS_COLORS: Record<string, string> = {
@@ -47,7 +47,7 @@ export interface UpdateTicketData {
 }
 
 export interface TicketFilters {
-  status?: string;
+  status?: string | string[]; // several statuses are sent comma-separated
   priority?: string;
   department?: string;
   assigneeId?: string;
@@ -55,8 +55,33 @@ export interface TicketFilters {
   search?: string;
   page?: number;
   pageSize?: number;
+  cursor?: string;
+  olderThanHours?: number; // only tickets created more than this many hours ago
+  createdFrom?: string; // YYYY-MM-DD, inclusive
+  createdTo?: string; // YYYY-MM-DD, inclusive
+}
+
+// Ticket count for one status/priority/department combination (GET /tickets/stats)
+export interface TicketStatsGroup {
+  status: string;
+  priority: string;
+  department: string; // display name, as on Ticket
+  departmentId: string | null;
+  count: number;
+}
+
+export interface TicketAggregates {
+  total: number;
+  groups: TicketStatsGroup[];
+  createdByDay: { date: string; count: number }[]; // oldest first, only when `days` was given
 }
 
+// Sum the aggregate groups matching `predicate`
+export const sumTicketGroups = (
+  stats: TicketAggregates | null,
+  predicate: (group: TicketStatsGroup) => boolean = () => true
+): number => (stats ? stats.groups.filter(predicate).reduce((sum, g) => sum + g.count, 0) : 0);
+
 export interface TicketListResponse {
   results: Ticket[];
   count: number;
@@ -64,15 +89,25 @@ export interface TicketListResponse {
   previous: string | null;
 }
 
+export interface CommentPage {
+  comments: Comment[];
+  before: string | null; // Cursor for older comments; null at the start of the history
+  after: string | null; // Cursor for comments sent after this page
+}
+
+// Largest page the ticket list and chat endpoints serve (KeysetPaginator.max_page_size)
+const MAX_PAGE_SIZE = 200;
+
+// Chat messages loaded per page when opening or scrolling back through a ticket's chat
+const COMMENT_PAGE_SIZE = 50;
+
 class TicketService {
   private departmentCache: Map<string, string> = new Map();
   private employeeCache: Map<string, { name: string; code: string }> = new Map();
 
-  // Helper: Map Backend API Response to Frontend Ticket
-  private async mapToTicket(data: any): Promise<Ticket> {
-    // Get department name if not cached
-    let deptDisplay = data.department_id || 'Unknown';
-    if (data.department_id && !this.departmentCache.has(data.department_id)) {
+  // Helper: "CODE | Name" for a department id, loading the department list once
+  private async departmentLabel(departmentId: string | null): Promise<string> {
+    if (departmentId && !this.departmentCache.has(departmentId)) {
       try {
         const deptService = (await import('./departmentService')).default;
         const depts = await deptService.getDepartments();
@@ -83,7 +118,12 @@ class TicketService {
         console.warn('Failed to fetch departments', error);
       }
     }
-    deptDisplay = this.departmentCache.get(data.department_id) || deptDisplay;
+    return (departmentId && this.departmentCache.get(departmentId)) || departmentId || 'Unknown';
+  }
+
+  // Helper: Map Backend API Response to Frontend Ticket
+  private async mapToTicket(data: any): Promise<Ticket> {
+    const deptDisplay = await this.departmentLabel(data.department_id);
 
     // Get requestor name + employee code if not cached
     let requestorName = 'Unknown User';
@@ -158,31 +198,82 @@ class TicketService {
   async getTickets(filters?: TicketFilters): Promise<TicketListResponse> {
     const params = new URLSearchParams();
     if (filters) {
-      if (filters.status) params.append('status', filters.status);
+      if (filters.status && filters.status.length) {
+        params.append('status', Array.isArray(filters.status) ? filters.status.join(',') : filters.status);
+      }
       if (filters.priority) params.append('priority', filters.priority);
       // Map requestorId to requestor_id (snake_case for Python)
       if (filters.requestorId) params.append('requestor_id', filters.requestorId);
       if (filters.assigneeId) params.append('assignee_id', filters.assigneeId);
       if (filters.search) params.append('search', filters.search);
       // Pass other filters if needed
+      if (filters.pageSize) params.append('page_size', String(filters.pageSize));
+      if (filters.cursor) params.append('cursor', filters.cursor);
+      if (filters.olderThanHours !== undefined) params.append('older_than_hours', String(filters.olderThanHours));
+      if (filters.createdFrom) params.append('created_from', filters.createdFrom);
+      if (filters.createdTo) params.append('created_to', filters.createdTo);
     }
 
-    // Use specific Ticket Service URL
-    const response = await apiClient.get<any[]>(`${ENV.TICKET_SERVICE_URL}/api/v1/tickets/`, {
+    // Use specific Ticket Service URL (keyset-paginated: { results, count, next, previous })
+    const response = await apiClient.get<any>(`${ENV.TICKET_SERVICE_URL}/api/v1/tickets/`, {
       params: Object.fromEntries(params.entries())
     });
 
     // Map API response to Ticket type
-    const tickets = await Promise.all(response.map(data => this.mapToTicket(data)));
+    const tickets = await Promise.all(response.results.map((data: any) => this.mapToTicket(data)));
 
     return {
       results: tickets,
-      count: tickets.length,
-      next: null,
-      previous: null
+      count: response.count,
+      next: response.next,
+      previous: response.previous
     };
   }
 
+  // Ticket counts aggregated by the server (per status, priority and department).
+  // Dashboards use this instead of loading tickets; `days` adds created-per-day counts.
+  async getTicketStats(filters?: TicketFilters, days?: number): Promise<TicketAggregates> {
+    const params: Record<string, string> = {};
+    if (filters?.status && filters.status.length) {
+      params.status = Array.isArray(filters.status) ? filters.status.join(',') : filters.status;
+    }
+    if (filters?.requestorId) params.requestor_id = filters.requestorId;
+    if (filters?.assigneeId) params.assignee_id = filters.assigneeId;
+    if (filters?.olderThanHours !== undefined) params.older_than_hours = String(filters.olderThanHours);
+    if (filters?.createdFrom) params.created_from = filters.createdFrom;
+    if (filters?.createdTo) params.created_to = filters.createdTo;
+    if (days) params.days = String(days);
+
+    const response = await apiClient.get<any>(`${ENV.TICKET_SERVICE_URL}/api/v1/tickets/stats`, { params });
+    const groups = await Promise.all(response.groups.map(async (g: any) => ({
+      status: g.status,
+      priority: g.priority,
+      department: await this.departmentLabel(g.department_id),
+      departmentId: g.department_id,
+      count: g.count,
+    })));
+    return { total: response.total, groups, createdByDay: response.created_by_day || [] };
+  }
+
+  // Every ticket matching the filters, following `next` cursors. Only for
+  // user-triggered exports; dashboards and lists use getTicketStats/getTickets.
+  async exportTickets(filters?: TicketFilters): Promise<Ticket[]> {
+    const tickets: Ticket[] = [];
+    let cursor: string | undefined;
+    do {
+      const page = await this.getTickets({ ...filters, pageSize: MAX_PAGE_SIZE, cursor });
+      tickets.push(...page.results);
+      cursor = page.next || undefined;
+    } while (cursor);
+    return tickets;
+  }
+
+  // Total number of tickets matching the filters (server-side count)
+  async countTickets(filters?: TicketFilters): Promise<number> {
+    const page = await this.getTickets({ ...filters, pageSize: 1, cursor: undefined });
+    return page.count;
+  }
+
   // Get single ticket by ID
   async getTicketById(id: string): Promise<Ticket> {
     const response = await apiClient.get<any>(`${ENV.TICKET_SERVICE_URL}/api/v1/tickets/${id}`);
@@ -367,28 +458,65 @@ class TicketService {
     }
   }
 
-  // Get comments / chat messages
-  async getComments(ticketId: string): Promise<Comment[]> {
+  // Helper: one page of a ticket's chat, oldest message first
+  private async getCommentPage(ticketId: string, params: URLSearchParams): Promise<CommentPage> {
+    const response: any = await apiClient.get<any>(
+      `${ENV.COMMUNICATION_SERVICE_URL}/api/v1/chat/messages/ticket/${ticketId}?${params.toString()}`
+    );
+
+    // Map response to Comment[] - API now includes sender_name, sender_role, employee_code
+    const comments = response.results.map((msg: any) => ({
+      id: msg.id,
+      ticketId: msg.ticket_id,
+      userId: msg.sender_id,
+      userName: msg.sender_name || 'Unknown',
+      userRole: msg.sender_role || 'user',
+      employeeCode: msg.employee_code,
+      content: msg.message,
+      timestamp: msg.created_at,
+      type: 'comment' as const,
+    }));
+
+    return { comments, before: response.before, after: response.after };
+  }
+
+  // Get the newest page of comments / chat messages; older pages load on demand
+  async getComments(ticketId: string, limit: number = COMMENT_PAGE_SIZE): Promise<CommentPage> {
     try {
-      const response = await apiClient.get<any[]>(`${ENV.COMMUNICATION_SERVICE_URL}/api/v1/chat/messages/ticket/${ticketId}`);
-
-      // Map response to Comment[] - API now includes sender_name, sender_role, employee_code
-      const comments = response.map((msg) => ({
-        id: msg.id,
-        ticketId: msg.ticket_id,
-        userId: msg.sender_id,
-        userName: msg.sender_name || 'Unknown',
-        userRole: msg.sender_role || 'user',
-        employeeCode: msg.employee_code,
-        content: msg.message,
-        timestamp: msg.created_at,
-        type: 'comment' as const,
-      }));
-
-      return comments;
+      return await this.getCommentPage(ticketId, new URLSearchParams({ limit: String(limit) }));
     } catch (error) {
       console.warn('Get comments failed, falling back to empty:', error);
-      return [];
+      return { comments: [], before: null, after: null };
+    }
+  }
+
+  // Get the page of comments sent before a page's `before` cursor (scrolling back)
+  async getOlderComments(ticketId: string, before: string, limit: number = COMMENT_PAGE_SIZE): Promise<CommentPage> {
+    try {
+      return await this.getCommentPage(ticketId, new URLSearchParams({ before, limit: String(limit) }));
+    } catch (error) {
+      console.error('Get older comments failed:', error);
+      throw error;
+    }
+  }
+
+  // Get every comment sent since a page's `after` cursor (polling, WebSocket reconnect catch-up)
+  async getNewerComments(ticketId: string, after: string): Promise<CommentPage> {
+    try {
+      const comments: Comment[] = [];
+      let cursor = after;
+      let page: CommentPage;
+      // A full page may have more behind it; walk forward until caught up
+      do {
+        page = await this.getCommentPage(ticketId, new URLSearchParams({ after: cursor, limit: String(MAX_PAGE_SIZE) }));
+        comments.push(...page.comments);
+        cursor = page.after ?? cursor;
+      } while (page.comments.length === MAX_PAGE_SIZE);
+
+      return { comments, before: null, after: cursor };
+    } catch (error) {
+      console.error('Get newer comments failed:', error);
+      throw error;
     }
   }
 
@@ -66,6 +66,7 @@ export interface TicketFilters {
   search?: string;
   page?: number;
   pageSize?: number;
+  cursor?: string;
 }
 
 export interface TicketListResponse {
@@ -2,10 +2,12 @@
 User Service API endpoints.
 """
 from ninja import Router
-from typing import List
+from ninja.errors import HttpError
+from typing import List, Optional
 from django.contrib.auth import authenticate
+from django.core.exceptions import ValidationError
 from rest_framework_simplejwt.tokens import RefreshToken
-from apps.users.schemas import UserOut, UserIn, LoginIn, LoginOut, UserImportIn
+from .schemas import UserOut, UserIn, LoginIn, LoginOut, UserImportIn, UserImportJobOut
 
 router = Router(tags=["users"])
 
@@ -24,28 +26,55 @@ def login(request, payload: LoginIn):
     return {"error": "Invalid credentials"}, 401
 
 
+MAX_BULK_IDS = 200
+
+
 @router.get("/users", response=List[UserOut])
-def list_users(request):
-    """List all users."""
-    from apps.users.models import User
+def list_users(request, ids: Optional[str] = None):
+    """List all users, or only those in `ids` (comma-separated UUIDs)."""
+    from .models import User
     users = User.objects.all()
+    if ids is not None:
+        id_list = list(dict.fromkeys(i.strip() for i in ids.split(',') if i.strip()))
+        if len(id_list) > MAX_BULK_IDS:
+            raise HttpError(400, f"At most {MAX_BULK_IDS} ids per request")
+        try:
+            users = list(users.filter(id__in=id_list, is_deleted=False))
+        except ValidationError:
+            raise HttpError(400, "Invalid user id")
     return [UserOut.from_orm(user) for user in users]
 
 
 @router.get("/users/{user_id}", response=UserOut)
 def get_user(request, user_id: str):
     """Get user by ID."""
-    from apps.users.models import User
-    user = User.objects.get(id=user_id, is_deleted=False)
+    from .models import User
+    # A real 404 (not a 500) lets UserClient cache the miss instead of retrying
+    try:
+        user = User.objects.get(id=user_id, is_deleted=False)
+    except (User.DoesNotExist, ValidationError):
+        raise HttpError(404, "User not found")
     return UserOut.from_orm(user)
 
 
-@router.post("/users/import")
+@router.post("/users/import", response={202: UserImportJobOut})
 def import_users(request, payload: UserImportIn):
-    """Import users from CSV/Excel."""
-    from apps.users.services.import_service import ImportService
-    service = ImportService()
-    result = service.import_users(payload.file_data)
-    return result
+    """Queue a CSV/Excel user import; poll GET /users/import/{job_id} for progress."""
+    from .services.import_service import ImportJobService
+    user = getattr(request, 'user', None)
+    requested_by_id = user.id if user is not None and user.is_authenticated else None
+    try:
+        job = ImportJobService.start(payload.file_data, requested_by_id=requested_by_id)
+    except ValueError as e:
+        raise HttpError(400, str(e))
+    return 202, job
 
 
+@router.get("/users/import/{job_id}", response=UserImportJobOut)
+def get_import_job(request, job_id: str):
+    """Get the status and progress of a user import job."""
+    from .selectors import UserImportJobSelector
+    job = UserImportJobSelector.get_job(job_id)
+    if job is None:
+        raise HttpError(404, "Import job not found")
+    return job
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class UsersConfig(AppConfig):
+    # Installed as 'users' (shared/apps on the path) or as 'apps.users'
+    name = __name__.rpartition('.')[0]
+    label = 'users'
+
+    def ready(self):
+        # UserClient cache invalidation on user save/delete
+        from . import signals  # noqa: F401
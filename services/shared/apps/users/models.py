@@ -147,3 +147,49 @@ class User(AbstractBaseUser, PermissionsMixin):
         self.is_deleted = False
         self.deleted_at = None
         self.save(update_fields=['is_deleted', 'deleted_at'])
+
+
+class ImportJobStatus(models.TextChoices):
+    """User import job status."""
+    PENDING = 'pending', 'Pending'
+    RUNNING = 'running', 'Running'
+    COMPLETED = 'completed', 'Completed'
+    FAILED = 'failed', 'Failed'
+
+
+class UserImportJob(models.Model):
+    """
+    Background user import (see services.import_service.ImportJobService).
+    The uploaded file is kept until the job finishes so a retried or
+    re-delivered task can resume from `checkpoint_row`.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=20, choices=ImportJobStatus.choices, default=ImportJobStatus.PENDING, db_index=True)
+    file_data = models.BinaryField()  # Decoded CSV/XLSX, cleared when the job finishes
+    requested_by_id = models.UUIDField(null=True, blank=True)
+    
+    # Progress
+    total_rows = models.PositiveIntegerField(null=True, blank=True)  # Estimate taken at upload
+    processed_rows = models.PositiveIntegerField(default=0)
+    success_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    checkpoint_row = models.PositiveIntegerField(default=1)  # Last committed spreadsheet row (1 = header)
+    errors = models.JSONField(default=list, blank=True)
+    error_message = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'user_import_jobs'
+        verbose_name = 'User Import Job'
+        verbose_name_plural = 'User Import Jobs'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"Import {self.id} ({self.status})"
@@ -2,7 +2,8 @@
 Pydantic schemas for User Service.
 """
 from ninja import Schema
-from typing import Optional
+from typing import List, Optional
+from uuid import UUID
 from datetime import datetime
 
 
@@ -48,3 +49,18 @@ class UserImportIn(Schema):
     file_data: str  # Base64 encoded CSV/Excel
 
 
+class UserImportJobOut(Schema):
+    """Background user import job status."""
+    id: UUID
+    status: str
+    total_rows: Optional[int]  # Estimate taken at upload
+    processed_rows: int
+    success_count: int
+    failed_count: int
+    created_count: int
+    updated_count: int
+    errors: List[str]
+    error_message: str
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
@@ -2,6 +2,7 @@
 Optimized query selectors for User app.
 """
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
 from django.db.models import Q
 
 User = get_user_model()
@@ -41,3 +42,14 @@ class UserSelector:
         )
 
 
+class UserImportJobSelector:
+    """Queries for background user import jobs."""
+    
+    @staticmethod
+    def get_job(job_id: str):
+        """Get an import job without its stored file, or None."""
+        from .models import UserImportJob
+        try:
+            return UserImportJob.objects.defer('file_data').get(id=job_id)
+        except (UserImportJob.DoesNotExist, ValidationError):
+            return None
@@ -1,81 +1,457 @@
 """
 User import service for bulk user creation.
+
+Files are streamed row by row (csv for CSV, openpyxl read-only mode for
+XLSX) and processed in chunks, so memory stays flat for 20k+ employee
+imports:
+
+1. Each chunk is validated as a DataFrame with column-wise checks.
+2. Passwords of new users are hashed in a process pool.
+3. Valid rows are upserted on employee_code with one bulk_create per set
+   of filled columns, in one transaction per chunk. Existing users keep
+   their password, and any column that is missing from the file or blank
+   in their row; defaults (role 'requestor') only apply to new users.
+
+A bad row is reported and skipped, never the whole import. If a chunk's
+bulk write fails (e.g. a concurrent insert), that chunk is retried row by
+row to pin the error on the offending rows.
+
+Settings (all optional):
+    USER_IMPORT_CHUNK_SIZE: Rows validated and written per batch (1000)
+    USER_IMPORT_HASH_WORKERS: Password hashing processes (CPU count)
+    USER_IMPORT_MAX_ERRORS: Row errors kept in the result (100)
 """
-import pandas as pd
 import base64
-from io import BytesIO
-from django.db import transaction
-from apps.users.models import User
+import csv
+import io
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import django
+import pandas as pd
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from django.utils import timezone
+
+from ..models import ImportJobStatus, Role, User, UserImportJob
+from hdms_core.clients.user_client import UserClient
+
+DEFAULT_PASSWORD = 'defaultpassword123'  # Should be changed on first login
+
+COLUMNS = ['employee_code', 'email', 'first_name', 'last_name', 'password', 'role', 'department_id']
+UPDATABLE_COLUMNS = ['email', 'first_name', 'last_name', 'role', 'department_id']
+
+EMAIL_PATTERN = r'[^@\s]+@[^@\s]+\.[^@\s]+'
+UUID_PATTERN = r'[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}'
+
+# base64 is decoded in slices of whole 4-character groups
+DECODE_SLICE = 4 * 64 * 1024
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def _cell(value: Any) -> Optional[str]:
+    """Normalize a CSV/XLSX cell to a stripped string or None."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        # Excel stores numeric employee codes as floats
+        value = int(value)
+    value = str(value).strip()
+    return value or None
+
+
+def iter_rows(stream) -> Iterator[Tuple[int, Dict[str, Optional[str]]]]:
+    """
+    Yield (row_number, {column: value}) for each data row of a CSV or XLSX
+    file. Row numbers match the spreadsheet (the header is row 1).
+    """
+    head = stream.read(4)
+    stream.seek(0)
+    if head == b'PK\x03\x04':
+        rows, close = _xlsx_rows(stream)
+    else:
+        rows, close = _csv_rows(stream)
+    try:
+        header = next(rows, None)
+        if header is None:
+            return
+        names = [str(name).strip().lower() if name is not None else '' for name in header]
+        for row_number, values in enumerate(rows, start=2):
+            row = {name: _cell(value) for name, value in zip(names, values) if name}
+            if any(value is not None for value in row.values()):
+                yield row_number, row
+    finally:
+        close()
+
+
+def _xlsx_rows(stream):
+    from openpyxl import load_workbook
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    return workbook.active.iter_rows(values_only=True), workbook.close
+
+
+def _csv_rows(stream):
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    # Leave the underlying stream open for the caller
+    return csv.reader(text), text.detach
+
+
+def estimate_rows(data: bytes) -> Optional[int]:
+    """Approximate number of data rows, for progress reporting."""
+    if data[:4] == b'PK\x03\x04':
+        from openpyxl import load_workbook
+        workbook = load_workbook(io.BytesIO(data), read_only=True)
+        try:
+            # Taken from the sheet's dimension record, without reading rows
+            max_row = workbook.active.max_row
+        finally:
+            workbook.close()
+        return max(max_row - 1, 0) if max_row else None
+    lines = data.count(b'\n') + (0 if data.endswith(b'\n') else 1)
+    return max(lines - 1, 0)
+
+
+def _hash_pool(workers: int) -> Executor:
+    """
+    Process pool for password hashing. Daemonic processes (Celery prefork
+    workers) may not fork children, so they fall back to threads; the
+    PBKDF2 hasher releases the GIL, which still gives real parallelism.
+    """
+    if multiprocessing.current_process().daemon:
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        # Only Django's settings are needed to hash; importing this module
+        # in the child would load models before the app registry is ready
+        initializer=django.setup,
+    )
 
 
 class ImportService:
     """Service for importing users from CSV/Excel."""
-    
-    def import_users(self, file_data: str) -> dict:
+
+    def __init__(self, chunk_size: Optional[int] = None, hash_workers: Optional[int] = None):
+        self.chunk_size = chunk_size or getattr(settings, 'USER_IMPORT_CHUNK_SIZE', 1000)
+        self.hash_workers = hash_workers or getattr(settings, 'USER_IMPORT_HASH_WORKERS', os.cpu_count() or 1)
+        self.max_errors = getattr(settings, 'USER_IMPORT_MAX_ERRORS', 100)
+
+    def import_users(self, file_data: str, progress: Optional[ProgressCallback] = None) -> dict:
         """
         Import users from base64 encoded CSV/Excel file.
-        
+
         Returns:
             dict: {
                 'success': int,
                 'failed': int,
+                'created': int,
+                'updated': int,
                 'errors': List[str]
             }
         """
         try:
-            # Decode base64 file data
-            file_bytes = base64.b64decode(file_data)
-            file_io = BytesIO(file_bytes)
-            
-            # Read file (supports both CSV and Excel)
-            try:
-                df = pd.read_excel(file_io)
-            except:
-                file_io.seek(0)
-                df = pd.read_csv(file_io)
-            
-            success_count = 0
-            failed_count = 0
-            errors = []
-            
-            with transaction.atomic():
-                for index, row in df.iterrows():
-                    try:
-                        # Validate required fields
-                        if pd.isna(row.get('employee_code')):
-                            errors.append(f"Row {index + 2}: Missing employee_code")
-                            failed_count += 1
-                            continue
-                        
-                        # Create user
-                        user = User.objects.create_user(
-                            employee_code=str(row['employee_code']),
-                            email=row.get('email') if not pd.isna(row.get('email')) else None,
-                            first_name=row.get('first_name', ''),
-                            last_name=row.get('last_name', ''),
-                            password=row.get('password', 'defaultpassword123'),  # Should be changed on first login
-                            role=row.get('role', 'requestor'),
-                        )
-                        
-                        if not pd.isna(row.get('department_id')):
-                            user.department_id = str(row['department_id'])
-                            user.save()
-                        
-                        success_count += 1
-                    except Exception as e:
-                        errors.append(f"Row {index + 2}: {str(e)}")
-                        failed_count += 1
-            
-            return {
-                'success': success_count,
-                'failed': failed_count,
-                'errors': errors[:10]  # Limit errors to first 10
-            }
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as stream:
+                data = ''.join(file_data.split())
+                for start in range(0, len(data), DECODE_SLICE):
+                    stream.write(base64.b64decode(data[start:start + DECODE_SLICE]))
+                stream.seek(0)
+                return self.import_stream(stream, progress=progress)
         except Exception as e:
             return {
                 'success': 0,
                 'failed': 0,
+                'created': 0,
+                'updated': 0,
                 'errors': [f"Import failed: {str(e)}"]
             }
 
+    def import_stream(
+        self,
+        stream,
+        progress: Optional[ProgressCallback] = None,
+        start_row: int = 1,
+    ) -> dict:
+        """
+        Import users from a binary file object holding CSV or XLSX data.
+
+        Each chunk is committed in its own transaction. `progress`, if
+        given, is called inside that transaction with the running totals
+        ({'processed', 'success', 'failed', 'created', 'updated', 'errors'})
+        and 'last_row', the last spreadsheet row the chunk covered, so a
+        checkpoint saved by the callback commits together with the rows.
+
+        Rows up to `start_row` are skipped (resuming from a checkpoint);
+        they are still read to catch duplicates against later rows.
+        """
+        result = {'processed': 0, 'success': 0, 'failed': 0, 'created': 0, 'updated': 0}
+        errors: List[str] = []
+        seen = {'employee_code': set(), 'email': set()}
+        pool = None
+        try:
+            for chunk in self._chunks(self._resume(iter_rows(stream), start_row, seen)):
+                if pool is None:
+                    pool = _hash_pool(self.hash_workers)
+                with transaction.atomic():
+                    frame, chunk_errors = self._validate(chunk, seen)
+                    created, updated, write_errors = self._write(frame, pool)
+                    chunk_errors.extend(write_errors)
+
+                    result['processed'] += len(chunk)
+                    result['created'] += created
+                    result['updated'] += updated
+                    result['success'] += created + updated
+                    result['failed'] += len(chunk_errors)
+                    chunk_errors.sort()
+                    errors.extend(
+                        f"Row {row_number}: {message}"
+                        for row_number, message in chunk_errors[:max(self.max_errors - len(errors), 0)]
+                    )
+                    if progress is not None:
+                        progress(dict(result, errors=list(errors), last_row=chunk[-1][0]))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        del result['processed']
+        result['errors'] = errors
+        return result
+
+    @staticmethod
+    def _resume(rows, start_row: int, seen: Dict[str, set]):
+        for row_number, row in rows:
+            if row_number > start_row:
+                yield row_number, row
+                continue
+            for name in seen:
+                if row.get(name) is not None:
+                    seen[name].add(row[name])
+
+    def _chunks(self, rows: Iterable[Tuple[int, Dict[str, Any]]]) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _validate(self, chunk, seen: Dict[str, set]) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Validate one chunk column-wise.
+
+        Returns the valid rows (indexed by row number) and one
+        (row_number, message) error per rejected row. `seen` carries
+        employee codes and emails from earlier chunks to catch duplicates
+        across the whole file.
+        """
+        frame = pd.DataFrame.from_records(
+            [row for _, row in chunk],
+            index=[row_number for row_number, _ in chunk],
+            columns=COLUMNS,
+        ).astype('string')
+        # Blank roles stay blank here: new users get the default in _write, existing ones keep theirs
+        frame['role'] = frame['role'].str.lower()
+        code = frame['employee_code']
+        email = frame['email']
+        has_email = email.notna()
+
+        checks = [
+            (code.isna(), "Missing employee_code"),
+            (code.str.len() > 50, "employee_code longer than 50 characters"),
+            (code.duplicated() | code.isin(seen['employee_code']), "Duplicate employee_code in file"),
+            (frame['role'].notna() & ~frame['role'].isin(Role.values), "Invalid role"),
+            (has_email & ~email.str.fullmatch(EMAIL_PATTERN, na=False), "Invalid email"),
+            (has_email & (email.duplicated() | email.isin(seen['email'])), "Duplicate email in file"),
+            (frame['department_id'].notna() & ~frame['department_id'].str.fullmatch(UUID_PATTERN, na=False),
+             "Invalid department_id"),
+        ]
+        seen['employee_code'].update(code.dropna())
+        seen['email'].update(email.dropna())
+
+        rejected = pd.Series(False, index=frame.index)
+        errors = []
+        for mask, message in checks:
+            new = mask.fillna(False).astype(bool) & ~rejected
+            errors.extend((row_number, message) for row_number in frame.index[new])
+            rejected |= new
+
+        valid = frame[~rejected]
+        # Emails already held by a different employee would break the upsert
+        emails = valid['email'].dropna().tolist()
+        if emails:
+            owners = dict(User.all_objects.filter(email__in=emails).values_list('email', 'employee_code'))
+            taken = valid['email'].map(owners).notna() & (valid['email'].map(owners) != valid['employee_code'])
+            errors.extend((row_number, "Email already in use") for row_number in valid.index[taken])
+            valid = valid[~taken]
+        return valid, errors
+
+    def _write(self, frame: pd.DataFrame, pool: Executor) -> Tuple[int, int, List[str]]:
+        """Upsert the valid rows of one chunk; returns (created, updated, errors)."""
+        if frame.empty:
+            return 0, 0, []
+        existing = dict(
+            User.all_objects.filter(employee_code__in=frame['employee_code'].tolist())
+            .values_list('employee_code', 'id')
+        )
+        is_new = ~frame['employee_code'].isin(existing)
+        passwords = frame.loc[is_new, 'password'].fillna(DEFAULT_PASSWORD).tolist()
+        hashes = iter(pool.map(make_password, passwords, chunksize=max(len(passwords) // self.hash_workers, 1)))
+
+        records = frame.astype(object).where(frame.notna(), None)
+        filled = frame[UPDATABLE_COLUMNS].notna()
+        users = []
+        for row_number, row, new in zip(frame.index, records.itertuples(index=False), is_new):
+            user = User(
+                employee_code=row.employee_code,
+                email=row.email,
+                first_name=row.first_name or '',
+                last_name=row.last_name or '',
+                # The default only takes effect for new users: 'role' is in update_fields only when filled
+                role=row.role or Role.requestor,
+                department_id=row.department_id,
+                # Existing users keep their password (not in update_fields)
+                password=next(hashes) if new else make_password(None),
+            )
+            # Existing users keep every column the row leaves blank (or the file lacks)
+            update_fields = [name for name in UPDATABLE_COLUMNS if filled.at[row_number, name]] + ['updated_at']
+            users.append((row_number, user, update_fields))
+
+        groups: Dict[Tuple[str, ...], List[User]] = {}
+        for _, user, update_fields in users:
+            groups.setdefault(tuple(update_fields), []).append(user)
+        errors = []
+        try:
+            with transaction.atomic():
+                for update_fields, group in groups.items():
+                    self._upsert(group, list(update_fields))
+            written = frame.index
+        except IntegrityError:
+            written, errors = self._write_rows(users)
+
+        written_new = is_new[written]
+        updated_ids = [existing[code] for code in frame.loc[written, 'employee_code'] if code in existing]
+        if updated_ids:
+            transaction.on_commit(lambda: UserClient.invalidate_users(updated_ids))
+        return int(written_new.sum()), len(updated_ids), errors
+
+    def _write_rows(self, users):
+        """Fallback for a failed chunk: write row by row, keeping the good ones."""
+        written = []
+        errors = []
+        for row_number, user, update_fields in users:
+            try:
+                with transaction.atomic():
+                    self._upsert([user], update_fields)
+                written.append(row_number)
+            except IntegrityError as e:
+                errors.append((row_number, str(e).splitlines()[0]))
+        return written, errors
+
+    @staticmethod
+    def _upsert(users: List[User], update_fields: List[str]) -> None:
+        User.all_objects.bulk_create(
+            users,
+            update_conflicts=True,
+            unique_fields=['employee_code'],
+            update_fields=update_fields,
+        )
+
+
+class ImportJobService:
+    """
+    Runs user imports as background jobs.
+
+    start() stores the upload on a UserImportJob and queues
+    users.tasks.import_users_task; the API returns the job id at once and
+    clients poll the job for progress. Progress counters and the
+    checkpoint are saved in the same transaction as each chunk, so a
+    retried or re-delivered task resumes after the last committed row.
+    """
+
+    @staticmethod
+    def start(file_data: str, requested_by_id: Optional[str] = None) -> UserImportJob:
+        """
+        Create a job for a base64 encoded CSV/Excel file and queue it.
+
+        Raises:
+            ValueError: If `file_data` is not valid base64
+        """
+        try:
+            data = base64.b64decode(''.join(file_data.split()), validate=True)
+        except ValueError:
+            raise ValueError("file_data is not valid base64")
+        try:
+            total_rows = estimate_rows(data)
+        except Exception:
+            # The worker reports unreadable files on the job
+            total_rows = None
+
+        job = UserImportJob.objects.create(
+            file_data=data,
+            total_rows=total_rows,
+            requested_by_id=requested_by_id,
+        )
+        from ..tasks import import_users_task
+        job_id = str(job.id)
+        transaction.on_commit(lambda: import_users_task.delay(job_id))
+        return job
+
+    @staticmethod
+    def run(job_id: str) -> None:
+        """Run (or resume) an import job; called by the Celery task."""
+        job = UserImportJob.objects.get(id=job_id)
+        if job.status in (ImportJobStatus.COMPLETED, ImportJobStatus.FAILED):
+            return
+
+        UserImportJob.objects.filter(id=job.id).update(
+            status=ImportJobStatus.RUNNING,
+            attempts=F('attempts') + 1,
+            started_at=job.started_at or timezone.now(),
+        )
+        service = ImportService()
+        baseline = {
+            'processed': job.processed_rows,
+            'success': job.success_count,
+            'failed': job.failed_count,
+            'created': job.created_count,
+            'updated': job.updated_count,
+        }
+        baseline_errors = list(job.errors)
+
+        def save_progress(totals: Dict[str, Any]) -> None:
+            UserImportJob.objects.filter(id=job.id).update(
+                processed_rows=baseline['processed'] + totals['processed'],
+                success_count=baseline['success'] + totals['success'],
+                failed_count=baseline['failed'] + totals['failed'],
+                created_count=baseline['created'] + totals['created'],
+                updated_count=baseline['updated'] + totals['updated'],
+                errors=(baseline_errors + totals['errors'])[:service.max_errors],
+                checkpoint_row=totals['last_row'],
+                updated_at=timezone.now(),
+            )
+
+        service.import_stream(io.BytesIO(job.file_data), progress=save_progress, start_row=job.checkpoint_row)
+        UserImportJob.objects.filter(id=job.id).update(
+            status=ImportJobStatus.COMPLETED,
+            file_data=b'',
+            finished_at=timezone.now(),
+        )
 
+    @staticmethod
+    def fail(job_id: str, error: Exception) -> None:
+        """Mark a job failed once its task has given up."""
+        UserImportJob.objects.filter(id=job_id).update(
+            status=ImportJobStatus.FAILED,
+            error_message=str(error),
+            file_data=b'',
+            finished_at=timezone.now(),
+        )
@@ -1,9 +1,11 @@
 """
 Signals for User app.
 """
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from hdms_core.clients.user_client import UserClient
 
 User = get_user_model()
 
@@ -12,13 +14,15 @@ User = get_user_model()
 def user_saved(sender, instance, created, **kwargs):
     """Handle user save signal."""
     # Add audit logging or other side effects here
-    pass
+    user_id = instance.pk
+    transaction.on_commit(lambda: UserClient.invalidate_user(user_id))
 
 
 @receiver(post_delete, sender=User)
 def user_deleted(sender, instance, **kwargs):
     """Handle user delete signal."""
     # Add audit logging or other side effects here
-    pass
+    user_id = instance.pk
+    transaction.on_commit(lambda: UserClient.invalidate_user(user_id))
 
 
@@ -0,0 +1,30 @@
+"""
+Celery tasks for the users app.
+
+The File Service's Celery app discovers these through the installed
+`users` app; its `celery-worker-users` container (docker-compose) consumes
+the `user_imports` queue. Services without Celery install this app for
+the shared User model only, so the service modules are imported inside
+the tasks.
+"""
+from celery import shared_task
+
+
+@shared_task(
+    bind=True,
+    name='users.import_users',
+    queue='user_imports',
+    acks_late=True,
+    reject_on_worker_lost=True,
+    max_retries=3,
+    default_retry_delay=30,
+)
+def import_users_task(self, job_id: str):
+    """Run a background user import; retries resume from the job's checkpoint."""
+    from .services.import_service import ImportJobService
+    try:
+        ImportJobService.run(job_id)
+    except Exception as e:
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e)
+        ImportJobService.fail(job_id, e)
@@ -4,7 +4,11 @@ Shared core components for HDMS microservices.
 This package provides:
 - BaseModel: Abstract Django model with UUID primary key, soft delete, and timestamps
 - HTTPClient: Generic HTTP client for inter-service communication
+- AsyncHTTPClient: httpx-based async variant for ASGI/Channels code
 - Logging configuration: Standardized logging setup for all services
+- Pagination: Keyset (cursor) paginator and cached list counts
+- Metrics: In-process counters/gauges exposed at /metrics/
+- JITUserCache: Claims-hash cache that skips redundant JIT user syncs
 """
 
 __version__ = '1.0.0'
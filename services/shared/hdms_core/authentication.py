@@ -5,6 +5,8 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
 from django.db import transaction
 
+from hdms_core.user_cache import jit_user_cache
+
 logger = logging.getLogger(__name__)
 
 class RemoteJWTAuthentication(JWTAuthentication):
@@ -12,7 +14,8 @@ class RemoteJWTAuthentication(JWTAuthentication):
     Custom JWT Authentication that:
     1. Validates the token signature (using shared secret)
     2. Extracts user data from the token payload
-    3. JIT (Just-In-Time) syncs the user to the local database
+    3. JIT (Just-In-Time) syncs the user to the local database, skipping
+       the write while the token claims match the cached sync (see user_cache)
     """
 
     def get_user(self, validated_token):
@@ -70,7 +73,13 @@ class RemoteJWTAuthentication(JWTAuthentication):
         if 'role' in payload:
             defaults['role'] = payload['role']
 
-        # 3. JIT Sync (Get or Create/Update)
+        # 3. Serve from cache while the claims are unchanged
+        claims_hash = jit_user_cache.claims_hash(user_id, defaults)
+        cached_user = jit_user_cache.get(user_id, claims_hash)
+        if cached_user is not None:
+            return cached_user
+
+        # 4. JIT Sync (Get or Create/Update)
         try:
             user, created = User.objects.update_or_create(
                 id=user_id,
@@ -80,6 +89,7 @@ class RemoteJWTAuthentication(JWTAuthentication):
             if created:
                 logger.info(f"JIT Created User: {user.employee_code} ({user.id})")
             
+            jit_user_cache.set(user, claims_hash)
             return user
 
         except Exception as e:
@@ -94,6 +104,7 @@ class RemoteJWTAuthentication(JWTAuthentication):
                         id=user_id,
                         defaults=defaults
                     )
+                    jit_user_cache.set(user, claims_hash)
                     return user
                 except Exception as retry_e:
                     logger.error(f"JIT Retry Failed for {user_id}: {str(retry_e)}")
@@ -5,40 +5,24 @@ Provides a generic HTTP client with authentication, timeout, retry logic,
 and error handling for consistent inter-service communication.
 """
 import json
-from typing import Optional, Dict, Any, Union
+import threading
+from typing import Optional, Dict, Any, Tuple, Union
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 import requests
 
+from hdms_core import metrics
+from .resilience import guard_for
 
-class HTTPClient:
-    """
-    Generic HTTP client for inter-service communication.
-    
-    Features:
-    - Default timeout: 5 seconds
-    - Default retry attempts: 3 with exponential backoff
-    - Automatic token retrieval from settings
-    - Consistent error handling
-    """
+
+class BaseHTTPClient:
+    """Defaults and auth handling shared by HTTPClient and AsyncHTTPClient."""
     
     default_timeout = 5
     default_retry_attempts = 3
     default_backoff_factor = 0.5
-    
-    def __init__(self):
-        """Initialize HTTP client with retry adapter."""
-        self.session = requests.Session()
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.default_retry_attempts,
-            backoff_factor=self.default_backoff_factor,
-            status_forcelist=[500, 502, 503, 504],  # Retry on server errors
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+    retry_status_codes = (500, 502, 503, 504)
     
     def _get_token(self, token: Optional[str] = None) -> Optional[str]:
         """
@@ -80,6 +64,135 @@ class HTTPClient:
             headers['Authorization'] = f'Bearer {auth_token}'
         
         return headers
+
+
+class _CountingPoolMixin:
+    """Counts new TCP/TLS connections so keep-alive reuse can be measured."""
+    
+    target = 'default'
+    
+    def _new_conn(self):
+        metrics.incr(f'http_client.{self.target}.connections_opened')
+        return super()._new_conn()
+
+
+class SessionRegistry:
+    """
+    Process-wide pool of requests.Session objects, one per
+    (target service, retry policy).
+    
+    Every HTTPClient for a target shares its keep-alive connections, and a
+    call that overrides retry_attempts gets a long-lived session for that
+    policy instead of a fresh one per call. Pool sizes come from settings:
+        HTTP_POOL_CONNECTIONS: Hosts kept in each session's pool manager (10)
+        HTTP_POOL_MAXSIZE: Connections kept per host (10)
+        HTTP_POOL_SIZES: Per-target overrides, e.g.
+            {'user': {'pool_connections': 4, 'pool_maxsize': 32}}
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple[str, int, float], requests.Session] = {}
+        self._pool_classes: Dict[str, Dict[str, type]] = {}
+    
+    @staticmethod
+    def pool_sizes(target: str) -> Dict[str, int]:
+        try:
+            from django.conf import settings
+            sizes = {
+                'pool_connections': getattr(settings, 'HTTP_POOL_CONNECTIONS', 10),
+                'pool_maxsize': getattr(settings, 'HTTP_POOL_MAXSIZE', 10),
+            }
+            sizes.update(getattr(settings, 'HTTP_POOL_SIZES', {}).get(target, {}))
+            return sizes
+        except Exception:
+            # Django not configured yet
+            return {'pool_connections': 10, 'pool_maxsize': 10}
+    
+    def _counting_pools(self, target: str) -> Dict[str, type]:
+        classes = self._pool_classes.get(target)
+        if classes is None:
+            classes = {
+                'http': type('CountingHTTPConnectionPool', (_CountingPoolMixin, HTTPConnectionPool), {'target': target}),
+                'https': type('CountingHTTPSConnectionPool', (_CountingPoolMixin, HTTPSConnectionPool), {'target': target}),
+            }
+            self._pool_classes[target] = classes
+        return classes
+    
+    def get(self, target: str, retry_attempts: int, backoff_factor: float) -> requests.Session:
+        """Return the shared session for `target` with this retry policy."""
+        key = (target, retry_attempts, backoff_factor)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._build(target, retry_attempts, backoff_factor)
+                self._sessions[key] = session
+                metrics.set_gauge('http_client.sessions', len(self._sessions))
+            return session
+    
+    def _build(self, target: str, retry_attempts: int, backoff_factor: float) -> requests.Session:
+        retry_strategy = Retry(
+            total=retry_attempts,
+            backoff_factor=backoff_factor,
+            status_forcelist=BaseHTTPClient.retry_status_codes,  # Retry on server errors
+            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+        )
+        adapter = HTTPAdapter(max_retries=retry_strategy, **self.pool_sizes(target))
+        adapter.poolmanager.pool_classes_by_scheme = self._counting_pools(target)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    @staticmethod
+    def record_reuse(target: str) -> None:
+        """Update the share of requests served on an already-open connection."""
+        sent = metrics.get(f'http_client.{target}.requests')
+        if sent:
+            opened = metrics.get(f'http_client.{target}.connections_opened')
+            metrics.set_gauge(f'http_client.{target}.connection_reuse', round(max(0, 1 - opened / sent), 4))
+    
+    def close(self) -> None:
+        """Close every pooled session (tests, shutdown)."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            metrics.set_gauge('http_client.sessions', 0)
+
+
+session_registry = SessionRegistry()
+
+
+class HTTPClient(BaseHTTPClient):
+    """
+    Generic HTTP client for inter-service communication.
+    
+    Features:
+    - Default timeout: 5 seconds
+    - Default retry attempts: 3 with exponential backoff
+    - Automatic token retrieval from settings
+    - Consistent error handling
+    - Per-target circuit breaker and bulkhead (see clients.resilience)
+    """
+    
+    def __init__(self, target: str = 'default'):
+        """
+        Initialize HTTP client.
+        
+        Args:
+            target: Downstream service name; selects its pool sizes,
+                circuit breaker and bulkhead, and labels its metrics
+        """
+        self.target = target
+    
+    @property
+    def session(self) -> requests.Session:
+        """Pooled session for the default retry policy."""
+        return session_registry.get(self.target, self.default_retry_attempts, self.default_backoff_factor)
     
     def _make_request(
         self,
@@ -105,38 +218,35 @@ class HTTPClient:
             requests.Response object
             
         Raises:
-            requests.RequestException: On request failure after retries
+            requests.RequestException: On request failure after retries, or
+                CircuitOpenError / BulkheadFullError when the target is shedding load
         """
         # Use provided timeout or default
         request_timeout = timeout if timeout is not None else self.default_timeout
         
-        # Override retry attempts if provided
-        if retry_attempts is not None:
-            retry_strategy = Retry(
-                total=retry_attempts,
-                backoff_factor=self.default_backoff_factor,
-                status_forcelist=[500, 502, 503, 504],
-                allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            temp_session = requests.Session()
-            temp_session.mount("http://", adapter)
-            temp_session.mount("https://", adapter)
-            session = temp_session
-        else:
-            session = self.session
+        # Sessions are pooled per retry policy, so overriding retries still reuses connections
+        session = session_registry.get(
+            self.target,
+            retry_attempts if retry_attempts is not None else self.default_retry_attempts,
+            self.default_backoff_factor,
+        )
         
         # Build headers with authentication
         headers = self._get_headers(token, **kwargs)
         kwargs['headers'] = headers
         
-        # Make request
-        response = session.request(
-            method=method.upper(),
-            url=url,
-            timeout=request_timeout,
-            **kwargs
-        )
+        # Make request (fails fast with CircuitOpenError / BulkheadFullError)
+        with guard_for(self.target).protect() as outcome:
+            response = session.request(
+                method=method.upper(),
+                url=url,
+                timeout=request_timeout,
+                **kwargs
+            )
+            outcome.failed = response.status_code >= 500
+        
+        metrics.incr(f'http_client.{self.target}.requests')
+        session_registry.record_reuse(self.target)
         
         # Raise exception for HTTP errors
         response.raise_for_status()
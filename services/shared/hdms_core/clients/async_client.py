@@ -0,0 +1,163 @@
+"""
+Async HTTP client for inter-service calls from ASGI views and Channels consumers.
+
+Mirrors HTTPClient (5s timeout, 3 retries with exponential backoff on
+connection errors and 5xx, bearer token from the argument or settings)
+but runs on httpx so callers never block the event loop. One
+httpx.AsyncClient, and with it one keep-alive connection pool, is shared
+by every AsyncHTTPClient on the same event loop.
+"""
+import asyncio
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import httpx
+
+from . import BaseHTTPClient
+
+
+class AsyncHTTPClient(BaseHTTPClient):
+    """
+    Async counterpart of HTTPClient.
+
+    Example:
+        client = AsyncHTTPClient()
+        ticket, user = await asyncio.gather(
+            client.get_json(ticket_url),
+            client.get_json(user_url),
+        )
+    """
+
+    max_connections = 100
+    max_keepalive_connections = 20
+
+    _pools: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]' = weakref.WeakKeyDictionary()
+
+    def _pool(self) -> httpx.AsyncClient:
+        """Return the shared httpx client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._pools.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ))
+            self._pools[loop] = client
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the pool for the running event loop (ASGI shutdown)."""
+        client = cls._pools.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _backoff(self, retry_number: int) -> float:
+        # Same schedule as urllib3's Retry: no wait before the first retry
+        if retry_number <= 1:
+            return 0
+        return self.default_backoff_factor * (2 ** (retry_number - 1))
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        token: Optional[str] = None,
+        timeout: Optional[Union[int, float]] = None,
+        retry_attempts: Optional[int] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Make HTTP request with retry logic and error handling.
+
+        Args:
+            method: HTTP method (get, post, put, delete, patch)
+            url: Target URL
+            token: Optional authentication token
+            timeout: Request timeout in seconds
+            retry_attempts: Number of retry attempts (overrides default)
+            **kwargs: Additional arguments for httpx (params, json, data, ...)
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            httpx.HTTPError: On request failure after retries
+        """
+        request_timeout = timeout if timeout is not None else self.default_timeout
+        attempts = retry_attempts if retry_attempts is not None else self.default_retry_attempts
+        kwargs['headers'] = self._get_headers(token, **kwargs)
+        client = self._pool()
+
+        retries = 0
+        while True:
+            try:
+                response = await client.request(method.upper(), url, timeout=request_timeout, **kwargs)
+            except httpx.TransportError:
+                if retries >= attempts:
+                    raise
+            else:
+                if response.status_code not in self.retry_status_codes or retries >= attempts:
+                    response.raise_for_status()
+                    return response
+            retries += 1
+            await asyncio.sleep(self._backoff(retries))
+
+    async def get(self, url: str, token: Optional[str] = None, timeout: Optional[Union[int, float]] = None,
+                  retry_attempts: Optional[int] = None, **kwargs) -> httpx.Response:
+        """Perform GET request."""
+        return await self._make_request('GET', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def post(self, url: str, json: Optional[Dict[str, Any]] = None, token: Optional[str] = None,
+                   timeout: Optional[Union[int, float]] = None, retry_attempts: Optional[int] = None,
+                   **kwargs) -> httpx.Response:
+        """Perform POST request."""
+        if json is not None:
+            kwargs['json'] = json
+        return await self._make_request('POST', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def put(self, url: str, json: Optional[Dict[str, Any]] = None, token: Optional[str] = None,
+                  timeout: Optional[Union[int, float]] = None, retry_attempts: Optional[int] = None,
+                  **kwargs) -> httpx.Response:
+        """Perform PUT request."""
+        if json is not None:
+            kwargs['json'] = json
+        return await self._make_request('PUT', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def patch(self, url: str, json: Optional[Dict[str, Any]] = None, token: Optional[str] = None,
+                    timeout: Optional[Union[int, float]] = None, retry_attempts: Optional[int] = None,
+                    **kwargs) -> httpx.Response:
+        """Perform PATCH request."""
+        if json is not None:
+            kwargs['json'] = json
+        return await self._make_request('PATCH', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def delete(self, url: str, token: Optional[str] = None, timeout: Optional[Union[int, float]] = None,
+                     retry_attempts: Optional[int] = None, **kwargs) -> httpx.Response:
+        """Perform DELETE request."""
+        return await self._make_request('DELETE', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def get_json(self, url: str, token: Optional[str] = None, timeout: Optional[Union[int, float]] = None,
+                       retry_attempts: Optional[int] = None, **kwargs) -> Union[Dict[str, Any], list]:
+        """Perform GET request and return parsed JSON response."""
+        response = await self.get(url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+        return response.json()
+
+    async def post_json(self, url: str, json: Optional[Dict[str, Any]] = None, token: Optional[str] = None,
+                        timeout: Optional[Union[int, float]] = None, retry_attempts: Optional[int] = None,
+                        **kwargs) -> Union[Dict[str, Any], list]:
+        """Perform POST request with JSON data and return parsed JSON response."""
+        response = await self.post(url, json=json, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+        return response.json()
+
+    async def get_json_many(self, urls: Iterable[str], token: Optional[str] = None, **kwargs) -> List[Any]:
+        """
+        GET several URLs concurrently over the shared pool.
+
+        Returns results in the order of `urls`; a failed request yields its
+        exception in place of the parsed JSON.
+        """
+        return await asyncio.gather(
+            *(self.get_json(url, token=token, **kwargs) for url in urls),
+            return_exceptions=True,
+        )
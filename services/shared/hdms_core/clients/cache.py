@@ -0,0 +1,356 @@
+"""
+Response cache for inter-service entity lookups.
+
+UserClient and TicketClient look entities up by id on hot paths (every
+chat message, notification and file upload). Results are cached in the
+Django cache, which all services share, so an invalidation issued by the
+owning service is seen by every consumer.
+
+- Found entities are kept for a per-resource TTL.
+- 404s are cached as "missing" for a shorter negative TTL.
+- Concurrent misses for the same id in one process share a single request.
+- Bulk lookups read the cache with one get_many and fetch only the misses.
+- Other failures (timeouts, 5xx) are never cached.
+- Ids are UUIDs; bulk lookups drop malformed ids before fetching, since
+  one bad id in a chunk would make the owning service reject all of it.
+
+Entries are keyed by id alone and shared by every caller, so they must
+only hold what the service's own credentials see. Clients pass
+`cacheable=False` for lookups made with a caller's token: those go
+straight to the owning service and are never read from or written to
+the cache, as that caller may be allowed to see less (or more).
+
+Settings (all optional):
+    USER_CLIENT_CACHE_TTL: Seconds a fetched user is reused (60)
+    TICKET_CLIENT_CACHE_TTL: Seconds a fetched ticket is reused (30)
+    CLIENT_NEGATIVE_CACHE_TTL: Seconds a 404 is remembered (10)
+"""
+import asyncio
+import logging
+import threading
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from hdms_core import metrics
+
+logger = logging.getLogger(__name__)
+
+_MISSING = {'found': False}
+
+
+class _Flight:
+    """One in-progress fetch that concurrent callers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Any] = None
+
+
+class ResponseCache:
+    """Cache of entity lookups for one resource type."""
+
+    def __init__(self, resource: str, ttl_setting: str, default_ttl: int):
+        self.resource = resource
+        self.ttl_setting = ttl_setting
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, _Flight] = {}
+        self._atasks: Dict[Tuple[int, str], 'asyncio.Task'] = {}
+
+    @property
+    def ttl(self) -> int:
+        return getattr(settings, self.ttl_setting, self.default_ttl)
+
+    @property
+    def negative_ttl(self) -> int:
+        return getattr(settings, 'CLIENT_NEGATIVE_CACHE_TTL', 10)
+
+    def key(self, resource_id: Any) -> str:
+        return f'hdms:client:{self.resource}:{resource_id}'
+
+    def _metric(self, outcome: str, amount: int = 1) -> None:
+        if amount:
+            metrics.incr(f'client_cache.{self.resource}.{outcome}', amount)
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return cache.get(key)
+        except Exception as e:
+            logger.warning(f"Client cache read failed for {key}: {e}")
+            return None
+
+    async def _aread(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return await cache.aget(key)
+        except Exception as e:
+            logger.warning(f"Client cache read failed for {key}: {e}")
+            return None
+
+    def _hit(self, entry: Dict[str, Any]) -> Optional[Any]:
+        self._metric('hits' if entry['found'] else 'negative_hits')
+        return entry.get('data')
+
+    def _outcome(self, key: str, data: Any = None, error: Optional[Exception] = None):
+        """Return (result, entry to cache, ttl) for a finished fetch."""
+        if error is None:
+            return data, {'found': True, 'data': data}, self.ttl
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+        if status == 404:
+            return None, _MISSING, self.negative_ttl
+        if status is None:
+            logger.warning(f"Client fetch for {key} failed: {error}")
+        self._metric('errors')
+        return None, None, None
+
+    def get_or_fetch(self, resource_id: Any, fetch: Callable[[], Any], cacheable: bool = True) -> Optional[Any]:
+        """
+        Return the cached entity for `resource_id`, calling `fetch` on a miss.
+
+        `fetch` should raise on error responses (requests.HTTPError or
+        httpx.HTTPStatusError). Returns None when the entity does not exist
+        or could not be fetched. With `cacheable=False` the cache is skipped.
+        """
+        key = self.key(resource_id)
+        if not cacheable:
+            self._metric('bypassed')
+            try:
+                return self._outcome(key, data=fetch())[0]
+            except Exception as e:
+                return self._outcome(key, error=e)[0]
+
+        entry = self._read(key)
+        if entry is not None:
+            return self._hit(entry)
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+
+        if not leader:
+            self._metric('coalesced')
+            flight.done.wait()
+            return flight.result
+
+        self._metric('misses')
+        try:
+            try:
+                result, entry, ttl = self._outcome(key, data=fetch())
+            except Exception as e:
+                result, entry, ttl = self._outcome(key, error=e)
+            if entry is not None:
+                self._store(key, entry, ttl)
+            flight.result = result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+        return flight.result
+
+    async def aget_or_fetch(
+        self, resource_id: Any, fetch: Callable[[], Awaitable[Any]], cacheable: bool = True,
+    ) -> Optional[Any]:
+        """
+        Async variant of get_or_fetch(); `fetch` is a coroutine function.
+
+        Concurrent misses on the same event loop await one shared task.
+        """
+        key = self.key(resource_id)
+        if not cacheable:
+            self._metric('bypassed')
+            try:
+                return self._outcome(key, data=await fetch())[0]
+            except Exception as e:
+                return self._outcome(key, error=e)[0]
+
+        entry = await self._aread(key)
+        if entry is not None:
+            return self._hit(entry)
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        task = self._atasks.get(flight_key)
+        if task is None:
+            self._metric('misses')
+            task = loop.create_task(self._afetch(key, fetch))
+            self._atasks[flight_key] = task
+            task.add_done_callback(lambda _: self._atasks.pop(flight_key, None))
+        else:
+            self._metric('coalesced')
+        # Shielded so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _afetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Optional[Any]:
+        try:
+            result, entry, ttl = self._outcome(key, data=await fetch())
+        except Exception as e:
+            result, entry, ttl = self._outcome(key, error=e)
+        if entry is not None:
+            try:
+                await cache.aset(key, entry, ttl)
+            except Exception as e:
+                logger.warning(f"Client cache write failed for {key}: {e}")
+        return result
+
+    def _split_cached(self, cached: Dict[str, Any], keys: Dict[str, str]):
+        """Return ({id: entity} served from cache, [ids still to fetch])."""
+        found: Dict[str, Any] = {}
+        for key, entry in cached.items():
+            data = self._hit(entry)
+            if entry['found']:
+                found[keys[key]] = data
+        missing = [resource_id for key, resource_id in keys.items() if key not in cached]
+        return found, missing
+
+    def _absorb_chunk(self, chunk: List[str], fetched: Dict[str, Any], found: Dict[str, Any]):
+        """Record a fetched chunk; returns (positive, negative) cache entries."""
+        positive = {}
+        negative = {}
+        for resource_id in chunk:
+            if resource_id in fetched:
+                found[resource_id] = fetched[resource_id]
+                positive[self.key(resource_id)] = {'found': True, 'data': fetched[resource_id]}
+            else:
+                negative[self.key(resource_id)] = _MISSING
+        return positive, negative
+
+    def _keys(self, resource_ids: Iterable[Any]) -> Dict[str, str]:
+        ids = dict.fromkeys(str(resource_id) for resource_id in resource_ids)
+        invalid = []
+        for resource_id in ids:
+            try:
+                uuid.UUID(resource_id)
+            except ValueError:
+                invalid.append(resource_id)
+        if invalid:
+            logger.warning(f"Skipping {len(invalid)} malformed {self.resource} ids: {invalid[:5]}")
+            self._metric('invalid_ids', len(invalid))
+        return {self.key(resource_id): resource_id for resource_id in ids if resource_id not in invalid}
+
+    def get_many_or_fetch(
+        self,
+        resource_ids: Iterable[Any],
+        fetch_chunk: Callable[[List[str]], Dict[str, Any]],
+        chunk_size: int = 100,
+        cacheable: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Look up many ids at once: cached ones from one get_many, the rest via
+        `fetch_chunk` in chunks of at most `chunk_size` ids.
+
+        `fetch_chunk` returns {id: entity} for the ids that exist; ids it
+        leaves out are cached as missing. A chunk that fails is skipped and
+        not cached. Malformed ids are dropped up front. Returns {id: entity}
+        for every id that was found. With `cacheable=False` every id is
+        fetched and nothing is cached.
+        """
+        keys = self._keys(resource_ids)
+        if not keys:
+            return {}
+        cached = {}
+        if cacheable:
+            try:
+                cached = cache.get_many(list(keys))
+            except Exception as e:
+                logger.warning(f"Client cache read failed for {len(keys)} {self.resource} ids: {e}")
+        else:
+            self._metric('bypassed')
+
+        found, missing = self._split_cached(cached, keys)
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start:start + chunk_size]
+            self._metric('misses')
+            try:
+                fetched = fetch_chunk(chunk)
+            except Exception as e:
+                logger.warning(f"Bulk {self.resource} fetch of {len(chunk)} ids failed: {e}")
+                self._metric('errors')
+                continue
+            positive, negative = self._absorb_chunk(chunk, fetched, found)
+            if cacheable:
+                self._store_many(positive, self.ttl)
+                self._store_many(negative, self.negative_ttl)
+        return found
+
+    async def aget_many_or_fetch(
+        self,
+        resource_ids: Iterable[Any],
+        fetch_chunk: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        chunk_size: int = 100,
+        cacheable: bool = True,
+    ) -> Dict[str, Any]:
+        """Async variant of get_many_or_fetch(); chunks are fetched concurrently."""
+        keys = self._keys(resource_ids)
+        if not keys:
+            return {}
+        cached = {}
+        if cacheable:
+            try:
+                cached = await cache.aget_many(list(keys))
+            except Exception as e:
+                logger.warning(f"Client cache read failed for {len(keys)} {self.resource} ids: {e}")
+        else:
+            self._metric('bypassed')
+
+        found, missing = self._split_cached(cached, keys)
+        chunks = [missing[start:start + chunk_size] for start in range(0, len(missing), chunk_size)]
+        self._metric('misses', len(chunks))
+        results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True)
+
+        positive, negative = {}, {}
+        for chunk, fetched in zip(chunks, results):
+            if isinstance(fetched, Exception):
+                logger.warning(f"Bulk {self.resource} fetch of {len(chunk)} ids failed: {fetched}")
+                self._metric('errors')
+                continue
+            chunk_positive, chunk_negative = self._absorb_chunk(chunk, fetched, found)
+            positive.update(chunk_positive)
+            negative.update(chunk_negative)
+        if not cacheable:
+            return found
+        try:
+            if positive:
+                await cache.aset_many(positive, self.ttl)
+            if negative:
+                await cache.aset_many(negative, self.negative_ttl)
+        except Exception as e:
+            logger.warning(f"Client cache write failed for {self.resource} ids: {e}")
+        return found
+
+    def _store_many(self, entries: Dict[str, Dict[str, Any]], ttl: int) -> None:
+        if not entries:
+            return
+        try:
+            cache.set_many(entries, ttl)
+        except Exception as e:
+            logger.warning(f"Client cache write failed for {len(entries)} {self.resource} ids: {e}")
+
+    def _store(self, key: str, entry: Dict[str, Any], ttl: int) -> None:
+        try:
+            cache.set(key, entry, ttl)
+        except Exception as e:
+            logger.warning(f"Client cache write failed for {key}: {e}")
+
+    def invalidate(self, resource_id: Any) -> None:
+        """Forget `resource_id` so the next lookup goes to the owning service."""
+        key = self.key(resource_id)
+        try:
+            cache.delete(key)
+        except Exception as e:
+            logger.warning(f"Client cache delete failed for {key}: {e}")
+        self._metric('invalidations')
+
+    def invalidate_many(self, resource_ids: Iterable[Any]) -> None:
+        """Forget several ids with one cache round trip (bulk writes)."""
+        keys = [self.key(resource_id) for resource_id in resource_ids]
+        if not keys:
+            return
+        try:
+            cache.delete_many(keys)
+        except Exception as e:
+            logger.warning(f"Client cache delete failed for {len(keys)} {self.resource} ids: {e}")
+        self._metric('invalidations', len(keys))
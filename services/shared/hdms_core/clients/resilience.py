@@ -0,0 +1,230 @@
+"""
+Circuit breaker and bulkhead for inter-service calls.
+
+Each downstream target (see HTTPClient(target=...)) gets one guard per
+process:
+
+- The bulkhead caps in-flight calls to the target. A caller waits at most
+  `bulkhead_timeout` seconds for a slot and is then rejected, so a slow
+  dependency holds a bounded number of worker threads.
+- The circuit breaker tracks the outcome of the last `window` calls. When
+  at least `min_calls` were made and the failure rate reaches
+  `error_rate`, the circuit opens and calls fail fast for
+  `reset_timeout` seconds. It then goes half-open and lets a single probe
+  through: success closes the circuit, failure opens it again.
+
+Connection errors, timeouts and 5xx responses count as failures; 4xx
+responses do not. Rejected calls raise CircuitOpenError or
+BulkheadFullError, both requests.RequestException subclasses, so existing
+`except` clauses around client calls handle them.
+
+Settings (all optional):
+    HTTP_BREAKER_ERROR_RATE: Failure ratio that opens the circuit (0.5)
+    HTTP_BREAKER_MIN_CALLS: Calls in the window before it can open (10)
+    HTTP_BREAKER_WINDOW: Recent calls the failure ratio is taken over (20)
+    HTTP_BREAKER_RESET_TIMEOUT: Seconds open before a probe is allowed (30)
+    HTTP_BULKHEAD_SIZE: Max in-flight calls per target (10)
+    HTTP_BULKHEAD_TIMEOUT: Seconds to wait for a bulkhead slot (0.1)
+    HTTP_RESILIENCE: Per-target overrides, e.g.
+        {'user': {'bulkhead_size': 20, 'reset_timeout': 10}}
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict
+
+import requests
+
+from hdms_core import metrics
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+_STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+DEFAULTS = {
+    'error_rate': 0.5,
+    'min_calls': 10,
+    'window': 20,
+    'reset_timeout': 30,
+    'bulkhead_size': 10,
+    'bulkhead_timeout': 0.1,
+}
+
+SETTING_NAMES = {
+    'error_rate': 'HTTP_BREAKER_ERROR_RATE',
+    'min_calls': 'HTTP_BREAKER_MIN_CALLS',
+    'window': 'HTTP_BREAKER_WINDOW',
+    'reset_timeout': 'HTTP_BREAKER_RESET_TIMEOUT',
+    'bulkhead_size': 'HTTP_BULKHEAD_SIZE',
+    'bulkhead_timeout': 'HTTP_BULKHEAD_TIMEOUT',
+}
+
+
+class CircuitOpenError(requests.RequestException):
+    """The target's circuit is open; the call was not attempted."""
+
+
+class BulkheadFullError(requests.RequestException):
+    """The target already has the maximum number of calls in flight."""
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker over a window of recent calls."""
+
+    def __init__(self, target: str, error_rate: float, min_calls: int, window: int, reset_timeout: float):
+        self.target = target
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._outcomes = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        metrics.set_gauge(f'http_client.{target}.circuit_state', _STATE_GAUGE[CLOSED])
+
+    def _transition(self, state: str) -> None:
+        self.state = state
+        metrics.incr(f'http_client.{self.target}.circuit.{state}')
+        metrics.set_gauge(f'http_client.{self.target}.circuit_state', _STATE_GAUGE[state])
+
+    def allow(self) -> None:
+        """Raise CircuitOpenError unless a call may go through now."""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._transition(HALF_OPEN)
+            if self.state == CLOSED:
+                return
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+        metrics.incr(f'http_client.{self.target}.circuit.rejected')
+        raise CircuitOpenError(f"Circuit open for {self.target}")
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot that was never used."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of an allowed call."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                self._outcomes.clear()
+                if success:
+                    self._transition(CLOSED)
+                else:
+                    self._opened_at = time.monotonic()
+                    self._transition(OPEN)
+                return
+
+            self._outcomes.append(success)
+            if self.state == CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.error_rate:
+                    self._opened_at = time.monotonic()
+                    self._transition(OPEN)
+
+
+class Bulkhead:
+    """Caps concurrent calls to one target."""
+
+    def __init__(self, target: str, size: int, timeout: float):
+        self.target = target
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self._slots.acquire(timeout=self.timeout):
+            metrics.incr(f'http_client.{self.target}.bulkhead.rejected')
+            raise BulkheadFullError(f"Too many in-flight calls to {self.target}")
+        self._update(1)
+
+    def release(self) -> None:
+        self._update(-1)
+        self._slots.release()
+
+    def _update(self, delta: int) -> None:
+        with self._lock:
+            self._in_flight += delta
+            metrics.set_gauge(f'http_client.{self.target}.bulkhead.in_flight', self._in_flight)
+
+
+class _Outcome:
+    failed = False
+
+
+class TargetGuard:
+    """Bulkhead plus circuit breaker for one downstream target."""
+
+    def __init__(self, target: str, options: Dict[str, Any]):
+        self.target = target
+        self.breaker = CircuitBreaker(
+            target,
+            error_rate=options['error_rate'],
+            min_calls=options['min_calls'],
+            window=options['window'],
+            reset_timeout=options['reset_timeout'],
+        )
+        self.bulkhead = Bulkhead(target, options['bulkhead_size'], options['bulkhead_timeout'])
+
+    @contextmanager
+    def protect(self):
+        """
+        Guard one call. The body may set `outcome.failed` (e.g. on a 5xx);
+        an exception from the body also counts as a failure.
+        """
+        self.breaker.allow()
+        try:
+            self.bulkhead.acquire()
+        except BulkheadFullError:
+            # A rejected call says nothing about the target's health
+            self.breaker.release_probe()
+            raise
+        outcome = _Outcome()
+        try:
+            yield outcome
+        except Exception:
+            outcome.failed = True
+            raise
+        finally:
+            self.bulkhead.release()
+            self.breaker.record(not outcome.failed)
+
+
+def _options(target: str) -> Dict[str, Any]:
+    try:
+        from django.conf import settings
+        options = {name: getattr(settings, SETTING_NAMES[name], default) for name, default in DEFAULTS.items()}
+        options.update(getattr(settings, 'HTTP_RESILIENCE', {}).get(target, {}))
+        return options
+    except Exception:
+        # Django not configured yet
+        return dict(DEFAULTS)
+
+
+_guards: Dict[str, TargetGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def guard_for(target: str) -> TargetGuard:
+    """Return the process-wide guard for `target`."""
+    guard = _guards.get(target)
+    if guard is None:
+        with _guards_lock:
+            guard = _guards.get(target)
+            if guard is None:
+                guard = _guards[target] = TargetGuard(target, _options(target))
+    return guard
+
+
+def reset() -> None:
+    """Forget all guards (tests, benchmarks)."""
+    with _guards_lock:
+        _guards.clear()
@@ -1,8 +1,11 @@
 """
 Ticket Service client for File Service.
 """
+from typing import Dict, Iterable, List
 from django.conf import settings
 from . import HTTPClient
+from .async_client import AsyncHTTPClient
+from .cache import ResponseCache
 
 
 class TicketClient:
@@ -13,21 +16,85 @@ class TicketClient:
     def BASE_URL(self):
         return settings.TICKET_SERVICE_URL
     
-    _client = HTTPClient()
+    _client = HTTPClient(target='ticket')
+    _cache = ResponseCache('ticket', 'TICKET_CLIENT_CACHE_TTL', 30)
+    bulk_chunk_size = 100
     
     @classmethod
     def get_ticket(cls, ticket_id: str, token: str = None):
-        """Get ticket details from Ticket Service."""
-        try:
-            base_url = settings.TICKET_SERVICE_URL
-            return cls._client.get_json(
-                f'{base_url}/api/v1/tickets/{ticket_id}',
-                token=token
+        """Get ticket details from Ticket Service (cached for service calls, see clients.cache)."""
+        base_url = settings.TICKET_SERVICE_URL
+        return cls._cache.get_or_fetch(
+            ticket_id,
+            lambda: cls._client.get_json(f'{base_url}/api/v1/tickets/{ticket_id}', token=token),
+            cacheable=token is None,
+        )
+    
+    @classmethod
+    def get_tickets_many(cls, ticket_ids: Iterable[str], token: str = None) -> Dict[str, dict]:
+        """
+        Get many tickets at once, keyed by id; unknown ids are left out.
+        
+        Ids are deduplicated, served from the cache where possible and the
+        rest fetched from GET /api/v1/tickets/?ids=... in chunks of
+        `bulk_chunk_size`.
+        """
+        base_url = settings.TICKET_SERVICE_URL
+        
+        def fetch_chunk(ids: List[str]) -> Dict[str, dict]:
+            page = cls._client.get_json(
+                f'{base_url}/api/v1/tickets/',
+                params={'ids': ','.join(ids)},
+                token=token,
             )
-        except Exception:
-            return None
+            return {str(ticket['id']): ticket for ticket in page['results']}
+        
+        return cls._cache.get_many_or_fetch(ticket_ids, fetch_chunk, cls.bulk_chunk_size, cacheable=token is None)
+    
+    @classmethod
+    def invalidate_ticket(cls, ticket_id: str) -> None:
+        """Drop the cached lookup for `ticket_id` after it changes."""
+        cls._cache.invalidate(ticket_id)
     
     @classmethod
     def validate_ticket(cls, ticket_id: str, token: str = None) -> bool:
         """Validate if ticket exists in Ticket Service."""
         return cls.get_ticket(ticket_id, token) is not None
+
+
+class AsyncTicketClient:
+    """Async client to communicate with Ticket Service; shares TicketClient's cache."""
+    
+    _client = AsyncHTTPClient()
+    _cache = TicketClient._cache
+    bulk_chunk_size = TicketClient.bulk_chunk_size
+    
+    @classmethod
+    async def get_ticket(cls, ticket_id: str, token: str = None):
+        """Get ticket details from Ticket Service (cached for service calls, see clients.cache)."""
+        base_url = settings.TICKET_SERVICE_URL
+        return await cls._cache.aget_or_fetch(
+            ticket_id,
+            lambda: cls._client.get_json(f'{base_url}/api/v1/tickets/{ticket_id}', token=token),
+            cacheable=token is None,
+        )
+    
+    @classmethod
+    async def get_tickets_many(cls, ticket_ids: Iterable[str], token: str = None) -> Dict[str, dict]:
+        """Async variant of TicketClient.get_tickets_many; chunks are fetched concurrently."""
+        base_url = settings.TICKET_SERVICE_URL
+        
+        async def fetch_chunk(ids: List[str]) -> Dict[str, dict]:
+            page = await cls._client.get_json(
+                f'{base_url}/api/v1/tickets/',
+                params={'ids': ','.join(ids)},
+                token=token,
+            )
+            return {str(ticket['id']): ticket for ticket in page['results']}
+        
+        return await cls._cache.aget_many_or_fetch(ticket_ids, fetch_chunk, cls.bulk_chunk_size, cacheable=token is None)
+    
+    @classmethod
+    async def validate_ticket(cls, ticket_id: str, token: str = None) -> bool:
+        """Validate if ticket exists in Ticket Service."""
+        return await cls.get_ticket(ticket_id, token) is not None
@@ -1,8 +1,11 @@
 """
 User Service client for Ticket Service.
 """
+from typing import Dict, Iterable, List
 from django.conf import settings
 from . import HTTPClient
+from .async_client import AsyncHTTPClient
+from .cache import ResponseCache
 
 
 class UserClient:
@@ -13,21 +16,50 @@ class UserClient:
     def BASE_URL(self):
         return settings.USER_SERVICE_URL
     
-    _client = HTTPClient()
+    _client = HTTPClient(target='user')
+    _cache = ResponseCache('user', 'USER_CLIENT_CACHE_TTL', 60)
+    bulk_chunk_size = 100
     
     @classmethod
     def get_user(cls, user_id: str, token: str = None):
-        """Get user details from User Service."""
-        try:
-            # Access settings lazily if needed, but here we can't use 'self' 
-            # easily in classmethod unless we instantiate or inspect settings directly
-            base_url = settings.USER_SERVICE_URL
-            return cls._client.get_json(
-                f'{base_url}/api/v1/users/{user_id}',
-                token=token
+        """Get user details from User Service (cached for service calls, see clients.cache)."""
+        base_url = settings.USER_SERVICE_URL
+        return cls._cache.get_or_fetch(
+            user_id,
+            lambda: cls._client.get_json(f'{base_url}/api/v1/users/{user_id}', token=token),
+            cacheable=token is None,
+        )
+    
+    @classmethod
+    def get_users_many(cls, user_ids: Iterable[str], token: str = None) -> Dict[str, dict]:
+        """
+        Get many users at once, keyed by id; unknown ids are left out.
+        
+        Ids are deduplicated, served from the cache where possible and the
+        rest fetched from GET /api/v1/users?ids=... in chunks of
+        `bulk_chunk_size`.
+        """
+        base_url = settings.USER_SERVICE_URL
+        
+        def fetch_chunk(ids: List[str]) -> Dict[str, dict]:
+            users = cls._client.get_json(
+                f'{base_url}/api/v1/users',
+                params={'ids': ','.join(ids)},
+                token=token,
             )
-        except Exception:
-            return None
+            return {str(user['id']): user for user in users}
+        
+        return cls._cache.get_many_or_fetch(user_ids, fetch_chunk, cls.bulk_chunk_size, cacheable=token is None)
+    
+    @classmethod
+    def invalidate_user(cls, user_id: str) -> None:
+        """Drop the cached lookup for `user_id` after it changes."""
+        cls._cache.invalidate(user_id)
+    
+    @classmethod
+    def invalidate_users(cls, user_ids) -> None:
+        """Drop the cached lookups for many users after a bulk write."""
+        cls._cache.invalidate_many(user_ids)
     
     @classmethod
     def validate_user(cls, user_id: str, token: str = None) -> bool:
@@ -38,3 +70,41 @@ class UserClient:
     def validate_user_exists(cls, user_id: str, token: str = None) -> bool:
         """Alias for validate_user."""
         return cls.validate_user(user_id, token)
+
+
+class AsyncUserClient:
+    """Async client to communicate with User Service; shares UserClient's cache."""
+    
+    _client = AsyncHTTPClient()
+    _cache = UserClient._cache
+    bulk_chunk_size = UserClient.bulk_chunk_size
+    
+    @classmethod
+    async def get_user(cls, user_id: str, token: str = None):
+        """Get user details from User Service (cached for service calls, see clients.cache)."""
+        base_url = settings.USER_SERVICE_URL
+        return await cls._cache.aget_or_fetch(
+            user_id,
+            lambda: cls._client.get_json(f'{base_url}/api/v1/users/{user_id}', token=token),
+            cacheable=token is None,
+        )
+    
+    @classmethod
+    async def get_users_many(cls, user_ids: Iterable[str], token: str = None) -> Dict[str, dict]:
+        """Async variant of UserClient.get_users_many; chunks are fetched concurrently."""
+        base_url = settings.USER_SERVICE_URL
+        
+        async def fetch_chunk(ids: List[str]) -> Dict[str, dict]:
+            users = await cls._client.get_json(
+                f'{base_url}/api/v1/users',
+                params={'ids': ','.join(ids)},
+                token=token,
+            )
+            return {str(user['id']): user for user in users}
+        
+        return await cls._cache.aget_many_or_fetch(user_ids, fetch_chunk, cls.bulk_chunk_size, cacheable=token is None)
+    
+    @classmethod
+    async def validate_user(cls, user_id: str, token: str = None) -> bool:
+        """Validate if user exists in User Service."""
+        return await cls.get_user(user_id, token) is not None
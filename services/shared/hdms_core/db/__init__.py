@@ -0,0 +1,71 @@
+"""
+Database connection profiles for HDMS services.
+
+Each service builds DATABASES['default'] with `database_settings()` and
+picks a profile with the DB_POOL_PROFILE environment variable:
+
+    none        New connection per request (CONN_MAX_AGE=0)
+    persistent  Keep connections for DB_CONN_MAX_AGE seconds and check
+                them before reuse; for direct PostgreSQL connections from
+                WSGI services
+    pgbouncer   Persistent connections to PgBouncer in transaction pooling
+                mode: no server-side cursors, no prepared statements, no
+                session state (keep the database TimeZone at UTC)
+    pool        psycopg 3 connection pool per process, for the ASGI
+                communication service, where Django does not support
+                persistent connections; also PgBouncer-safe
+
+Example:
+    DATABASES = {
+        'default': database_settings(
+            config('DB_POOL_PROFILE', default='pgbouncer'),
+            NAME=..., USER=..., PASSWORD=..., HOST=..., PORT=...,
+            OPTIONS={'connect_timeout': 20},
+        )
+    }
+"""
+from typing import Any, Dict, Optional
+
+PROFILES = ('none', 'persistent', 'pgbouncer', 'pool')
+
+
+def database_settings(
+    profile: str,
+    conn_max_age: int = 600,
+    pool_options: Optional[Dict[str, Any]] = None,
+    **settings_dict,
+) -> Dict[str, Any]:
+    """
+    Return a DATABASES entry for `profile`.
+
+    Args:
+        profile: One of PROFILES
+        conn_max_age: Seconds a persistent connection is kept
+            (persistent and pgbouncer profiles)
+        pool_options: psycopg_pool.ConnectionPool arguments such as
+            min_size, max_size and timeout (pool profile)
+        **settings_dict: NAME, USER, PASSWORD, HOST, PORT, OPTIONS, ...
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown DB_POOL_PROFILE {profile!r}; expected one of {', '.join(PROFILES)}")
+
+    database = {'ENGINE': 'django.db.backends.postgresql', **settings_dict}
+    database['OPTIONS'] = dict(settings_dict.get('OPTIONS', {}))
+
+    if profile == 'none':
+        database['CONN_MAX_AGE'] = 0
+    elif profile == 'persistent':
+        database['CONN_MAX_AGE'] = conn_max_age
+        database['CONN_HEALTH_CHECKS'] = True
+    elif profile == 'pgbouncer':
+        database['CONN_MAX_AGE'] = conn_max_age
+        database['CONN_HEALTH_CHECKS'] = True
+        # Named cursors (.iterator()) do not survive transaction pooling
+        database['DISABLE_SERVER_SIDE_CURSORS'] = True
+    else:
+        # Connections go back to the pool at the end of each request
+        database['ENGINE'] = 'hdms_core.db.pooled_postgresql'
+        database['CONN_MAX_AGE'] = 0
+        database['DISABLE_SERVER_SIDE_CURSORS'] = True
+        database['OPTIONS']['pool'] = dict(pool_options or {})
+    return database
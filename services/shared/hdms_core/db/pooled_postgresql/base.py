@@ -0,0 +1,68 @@
+"""
+PostgreSQL backend that borrows connections from a psycopg_pool pool.
+
+Django 5.0 has no built-in pooling, so this wraps the stock backend:
+opening a connection takes one from a per-process ConnectionPool and
+closing it (end of request, close_old_connections) returns it. Needs
+psycopg 3 with the pool extra: psycopg[binary,pool].
+
+OPTIONS['pool'] is passed to ConnectionPool (min_size, max_size,
+timeout, max_idle, ...). Use with CONN_MAX_AGE=0.
+"""
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base as postgresql
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError as e:
+    raise ImproperlyConfigured("The pool profile requires psycopg[pool]") from e
+
+if not postgresql.is_psycopg3:
+    raise ImproperlyConfigured("The pool profile requires psycopg 3, not psycopg2")
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop('pool', None)
+        return conn_params
+
+    @property
+    def pool(self) -> ConnectionPool:
+        # One pool per alias and process, shared by every thread's wrapper
+        pool = _pools.get(self.alias)
+        if pool is None:
+            with _pools_lock:
+                pool = _pools.get(self.alias)
+                if pool is None:
+                    pool = ConnectionPool(
+                        kwargs=self.get_connection_params(),
+                        check=ConnectionPool.check_connection,
+                        open=True,
+                        name=f'hdms-{self.alias}',
+                        **self.settings_dict['OPTIONS'].get('pool', {}),
+                    )
+                    _pools[self.alias] = pool
+        return pool
+
+    def get_new_connection(self, conn_params):
+        options = self.settings_dict['OPTIONS']
+        self.isolation_level = postgresql.IsolationLevel(
+            options.get('isolation_level', postgresql.IsolationLevel.READ_COMMITTED)
+        )
+        connection = self.pool.getconn()
+        if 'isolation_level' in options:
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self.pool.putconn(self.connection)
+                self.connection = None
@@ -46,6 +46,10 @@ def get_logging_config():
                 'level': 'DEBUG',  # Override in dev.py (DEBUG) or prod.py (INFO)
                 'propagate': False,
             },
+            'httpx': {
+                # httpx logs every request at INFO; AsyncHTTPClient makes many
+                'level': 'WARNING',
+            },
         },
     }
 
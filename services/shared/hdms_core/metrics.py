@@ -0,0 +1,91 @@
+"""
+Lightweight in-process metrics for HDMS services.
+
+Counters and gauges live in process memory and are exposed as JSON by
+`metrics_view`, which each service mounts at /metrics/ (not routed through
+the public gateway). Under gunicorn every worker reports its own numbers.
+
+Values kept outside the process (queue depths in the broker, numbers
+written by other processes) are added by collectors: functions returning
+{gauge: value}, called on every /metrics/ request.
+
+Example:
+    from hdms_core import metrics
+    metrics.incr('jit_user_cache.hits.local')
+    metrics.set_gauge('jit_user_cache.hit_rate', 0.97)
+    metrics.register_collector(lambda: {'queue.depth': broker_depth()})
+"""
+import logging
+import threading
+from typing import Callable, Dict, List, Union
+
+Number = Union[int, float]
+
+_lock = threading.Lock()
+_counters: Dict[str, Number] = {}
+_gauges: Dict[str, Number] = {}
+_collectors: List[Callable[[], Dict[str, Number]]] = []
+
+logger = logging.getLogger(__name__)
+
+
+def incr(name: str, amount: Number = 1) -> None:
+    """Increment counter `name` by `amount`."""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def set_gauge(name: str, value: Number) -> None:
+    """Set gauge `name` to `value`."""
+    with _lock:
+        _gauges[name] = value
+
+
+def get(name: str, default: Number = 0) -> Number:
+    """Return the current value of a counter or gauge."""
+    with _lock:
+        if name in _counters:
+            return _counters[name]
+        return _gauges.get(name, default)
+
+
+def snapshot() -> Dict[str, Dict[str, Number]]:
+    """Return a copy of all counters and gauges."""
+    with _lock:
+        return {'counters': dict(_counters), 'gauges': dict(_gauges)}
+
+
+def register_collector(func: Callable[[], Dict[str, Number]]) -> None:
+    """Add `func` to the collectors run by `collect`."""
+    with _lock:
+        if func not in _collectors:
+            _collectors.append(func)
+
+
+def collect() -> Dict[str, Number]:
+    """Run all collectors and merge their gauges; a failing collector is skipped."""
+    with _lock:
+        collectors = list(_collectors)
+    gauges = {}
+    for func in collectors:
+        try:
+            gauges.update(func())
+        except Exception as e:
+            logger.warning(f"Metrics collector {getattr(func, '__name__', func)} failed: {e}")
+    return gauges
+
+
+def reset() -> None:
+    """Clear all metrics (used by benchmarks between runs)."""
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+
+
+def metrics_view(request):
+    """Django view returning the metrics snapshot as JSON."""
+    import os
+    from django.http import JsonResponse
+    data = snapshot()
+    data['gauges'].update(collect())
+    return JsonResponse({'pid': os.getpid(), **data})
@@ -0,0 +1,175 @@
+"""
+Keyset (cursor) pagination helpers shared by HDMS services.
+
+Cursors are opaque, URL-safe tokens encoding the (timestamp, id) position of
+the row a page starts after, so fetching a deep page costs the same index
+seek as fetching the first one.
+"""
+import base64
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from django.core.cache import cache
+from django.db.models import Q, QuerySet
+
+logger = logging.getLogger(__name__)
+
+NEXT = 'next'
+PREVIOUS = 'prev'
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client supplies a malformed cursor."""
+
+
+def encode_cursor(timestamp: datetime, pk: Any, direction: str = NEXT) -> str:
+    """
+    Encode a keyset position into an opaque cursor string.
+
+    Args:
+        timestamp: Value of the ordering timestamp of the boundary row
+        pk: Primary key of the boundary row (tie-breaker)
+        direction: NEXT to read older rows, PREVIOUS to read newer rows
+
+    Returns:
+        URL-safe base64 cursor
+    """
+    raw = json.dumps({'t': timestamp.isoformat(), 'i': str(pk), 'd': direction})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        Dictionary with 'timestamp', 'pk' and 'direction' keys
+
+    Raises:
+        InvalidCursor: If the cursor cannot be decoded
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        direction = data.get('d', NEXT)
+        if direction not in (NEXT, PREVIOUS):
+            raise ValueError(f"unknown direction {direction}")
+        return {
+            'timestamp': datetime.fromisoformat(data['t']),
+            'pk': data['i'],
+            'direction': direction,
+        }
+    except Exception as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+
+def cached_count(queryset: QuerySet, prefix: str, ttl: int = 30) -> int:
+    """
+    Return queryset.count(), memoised in the cache for `ttl` seconds.
+
+    The cache key is derived from the compiled SQL so every distinct filter
+    combination gets its own entry. Totals may therefore lag writes by up
+    to `ttl` seconds, which is acceptable for list headers and dashboards.
+    Cache outages fall back to a live COUNT.
+    """
+    digest = hashlib.sha1(str(queryset.query).encode()).hexdigest()
+    key = f'{prefix}:count:{digest}'
+    try:
+        count = cache.get(key)
+        if count is not None:
+            return count
+    except Exception as e:
+        logger.warning(f"Count cache read failed for {prefix}: {e}")
+
+    count = queryset.count()
+    try:
+        cache.set(key, count, ttl)
+    except Exception as e:
+        logger.warning(f"Count cache write failed for {prefix}: {e}")
+    return count
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset newest-first on a (timestamp, id) key.
+
+    Rows are ordered by `-time_field, -id_field`, which matches the
+    `ordering = ['-created_at']` convention used by HDMS models while adding
+    a unique tie-breaker so pages never skip or repeat rows.
+    """
+
+    default_page_size = 50
+    max_page_size = 200
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        page_size: Optional[int] = None,
+        time_field: str = 'created_at',
+        id_field: str = 'id',
+    ):
+        self.queryset = queryset
+        self.time_field = time_field
+        self.id_field = id_field
+        size = page_size or self.default_page_size
+        self.page_size = max(1, min(size, self.max_page_size))
+
+    def _cursor_for(self, row, direction: str) -> str:
+        return encode_cursor(getattr(row, self.time_field), getattr(row, self.id_field), direction)
+
+    def paginate(self, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetch one page.
+
+        Args:
+            cursor: Cursor returned as `next`/`previous` by an earlier page
+
+        Returns:
+            Dictionary with 'results' (list of rows), 'next' and 'previous'
+
+        Raises:
+            InvalidCursor: If the cursor cannot be decoded
+        """
+        t, i = self.time_field, self.id_field
+        desc = (f'-{t}', f'-{i}')
+        asc = (t, i)
+
+        if not cursor:
+            rows = list(self.queryset.order_by(*desc)[:self.page_size + 1])
+            has_more = len(rows) > self.page_size
+            rows = rows[:self.page_size]
+            return {
+                'results': rows,
+                'next': self._cursor_for(rows[-1], NEXT) if has_more else None,
+                'previous': None,
+            }
+
+        position = decode_cursor(cursor)
+        ts, pk = position['timestamp'], position['pk']
+
+        if position['direction'] == NEXT:
+            # Older rows: strictly after the boundary in descending order
+            older = Q(**{f'{t}__lt': ts}) | Q(**{t: ts, f'{i}__lt': pk})
+            rows = list(self.queryset.filter(older).order_by(*desc)[:self.page_size + 1])
+            has_more = len(rows) > self.page_size
+            rows = rows[:self.page_size]
+            return {
+                'results': rows,
+                'next': self._cursor_for(rows[-1], NEXT) if has_more else None,
+                'previous': self._cursor_for(rows[0], PREVIOUS) if rows else None,
+            }
+
+        # Newer rows: walk ascending from the boundary, then flip back
+        newer = Q(**{f'{t}__gt': ts}) | Q(**{t: ts, f'{i}__gt': pk})
+        rows = list(self.queryset.filter(newer).order_by(*asc)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        rows.reverse()
+        return {
+            'results': rows,
+            'next': self._cursor_for(rows[-1], NEXT) if rows else None,
+            'previous': self._cursor_for(rows[0], PREVIOUS) if has_more else None,
+        }
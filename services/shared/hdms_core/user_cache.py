@@ -0,0 +1,196 @@
+"""
+Two-tier cache for JIT-synced users.
+
+Authentication used to run `update_or_create` on the users table for every
+request. Entries here record the hash of the token claims a user was last
+synced with; while the claims are unchanged and the entry is fresh, the
+cached User is returned without touching the database.
+
+Lookups go to a per-process LRU first and then to the Django cache
+(Redis in all services). Settings (all optional):
+    JIT_USER_CACHE_TTL: Seconds before a user is re-synced even if unchanged (300)
+    JIT_USER_CACHE_SIZE: Entries kept in the per-process LRU (1024)
+"""
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from hdms_core import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class JITUserCache:
+    """Per-process LRU in front of the shared Django cache."""
+
+    def __init__(self, key_prefix: str = 'hdms:jit_user', metric_prefix: str = 'jit_user_cache'):
+        self.key_prefix = key_prefix
+        self.metric_prefix = metric_prefix
+        self._lock = threading.Lock()
+        self._local: 'OrderedDict[str, tuple]' = OrderedDict()
+
+    @property
+    def ttl(self) -> int:
+        return getattr(settings, 'JIT_USER_CACHE_TTL', 300)
+
+    @property
+    def max_size(self) -> int:
+        return getattr(settings, 'JIT_USER_CACHE_SIZE', 1024)
+
+    @staticmethod
+    def claims_hash(user_id: Any, claims: Dict[str, Any]) -> str:
+        """Stable hash of the synced user fields derived from a token."""
+        raw = json.dumps({'id': str(user_id), **claims}, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def _key(self, user_id: Any) -> str:
+        return f'{self.key_prefix}:{user_id}'
+
+    def _record(self, outcome: str) -> None:
+        metrics.incr(f'{self.metric_prefix}.{outcome}')
+        hits = (metrics.get(f'{self.metric_prefix}.hits.local')
+                + metrics.get(f'{self.metric_prefix}.hits.shared'))
+        total = hits + metrics.get(f'{self.metric_prefix}.misses')
+        metrics.set_gauge(f'{self.metric_prefix}.hit_rate', round(hits / total, 4) if total else 0)
+
+    def _get_local(self, key: str, claims_hash: str):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            cached_hash, user, expires_at = entry
+            if cached_hash != claims_hash or expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return user
+
+    def _set_local(self, key: str, claims_hash: str, user, ttl: float) -> None:
+        with self._lock:
+            self._local[key] = (claims_hash, user, time.monotonic() + ttl)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_size:
+                self._local.popitem(last=False)
+
+    def _from_shared(self, key: str, claims_hash: str, entry):
+        """Validate a shared-tier entry and promote it to the local tier."""
+        if not entry or entry.get('hash') != claims_hash:
+            return None
+        # Keep the local copy no longer than the shared entry has left
+        remaining = entry.get('expires_at', 0) - time.time()
+        if remaining <= 0:
+            return None
+        self._set_local(key, claims_hash, entry['user'], remaining)
+        return entry['user']
+
+    def _shared_entry(self, user, claims_hash: str) -> Dict[str, Any]:
+        return {'hash': claims_hash, 'user': user, 'expires_at': time.time() + self.ttl}
+
+    def get(self, user_id: Any, claims_hash: str):
+        """
+        Return the cached User for `user_id` if it was synced with `claims_hash`.
+
+        Returns a copy so callers may mutate it freely; None on miss.
+        """
+        key = self._key(user_id)
+
+        user = self._get_local(key, claims_hash)
+        if user is not None:
+            self._record('hits.local')
+            return copy.copy(user)
+
+        try:
+            entry = cache.get(key)
+        except Exception as e:
+            logger.warning(f"JIT user cache read failed for {user_id}: {e}")
+            entry = None
+
+        user = self._from_shared(key, claims_hash, entry)
+        if user is not None:
+            self._record('hits.shared')
+            return copy.copy(user)
+
+        self._record('misses')
+        return None
+
+    async def aget(self, user_id: Any, claims_hash: str):
+        """
+        Async variant of get() for ASGI/Channels code.
+
+        Local hits are served on the event loop without a thread hop; the
+        shared tier goes through Django's async cache API.
+        """
+        key = self._key(user_id)
+
+        user = self._get_local(key, claims_hash)
+        if user is not None:
+            self._record('hits.local')
+            return copy.copy(user)
+
+        try:
+            entry = await cache.aget(key)
+        except Exception as e:
+            logger.warning(f"JIT user cache read failed for {user_id}: {e}")
+            entry = None
+
+        user = self._from_shared(key, claims_hash, entry)
+        if user is not None:
+            self._record('hits.shared')
+            return copy.copy(user)
+
+        self._record('misses')
+        return None
+
+    def set(self, user, claims_hash: str) -> None:
+        """Remember that `user` is in sync with `claims_hash`."""
+        key = self._key(user.pk)
+        self._set_local(key, claims_hash, user, self.ttl)
+        try:
+            cache.set(key, self._shared_entry(user, claims_hash), self.ttl)
+        except Exception as e:
+            logger.warning(f"JIT user cache write failed for {user.pk}: {e}")
+
+    async def aset(self, user, claims_hash: str) -> None:
+        """Async variant of set()."""
+        key = self._key(user.pk)
+        self._set_local(key, claims_hash, user, self.ttl)
+        try:
+            await cache.aset(key, self._shared_entry(user, claims_hash), self.ttl)
+        except Exception as e:
+            logger.warning(f"JIT user cache write failed for {user.pk}: {e}")
+
+    def invalidate(self, user_id: Any) -> None:
+        """Drop `user_id` from both tiers so the next request re-syncs."""
+        key = self._key(user_id)
+        with self._lock:
+            self._local.pop(key, None)
+        try:
+            cache.delete(key)
+        except Exception as e:
+            logger.warning(f"JIT user cache delete failed for {user_id}: {e}")
+
+    def clear_local(self) -> None:
+        """Empty the per-process tier."""
+        with self._lock:
+            self._local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit rate for this process."""
+        p = self.metric_prefix
+        return {
+            'hits_local': metrics.get(f'{p}.hits.local'),
+            'hits_shared': metrics.get(f'{p}.hits.shared'),
+            'misses': metrics.get(f'{p}.misses'),
+            'hit_rate': metrics.get(f'{p}.hit_rate'),
+        }
+
+
+jit_user_cache = JITUserCache()
@@ -3,13 +3,11 @@ Data migration to generate ticket_id for existing non-draft tickets.
 
 Run this manually: python manage.py shell < scripts/fix_ticket_ids.py
 """
-from django.utils import timezone
 from apps.tickets.models.ticket import Ticket
+from apps.tickets.services.ticket_number_service import TicketNumberAllocator
 
 def fix_ticket_ids():
     """Generate ticket_id for all non-draft tickets that don't have one."""
-    year = timezone.now().year
-    
     # Get tickets without ticket_id that are not drafts
     tickets = Ticket.objects.filter(ticket_id__isnull=True).exclude(status='draft').order_by('created_at')
     
@@ -17,23 +15,12 @@ def fix_ticket_ids():
         print("No tickets need fixing.")
         return
     
-    # Get the last used number
-    last_ticket = Ticket.objects.filter(
-        ticket_id__startswith=f'HD-{year}-'
-    ).order_by('-ticket_id').first()
-    
-    if last_ticket and last_ticket.ticket_id:
-        next_num = int(last_ticket.ticket_id.split('-')[-1]) + 1
-    else:
-        next_num = 1
-    
-    # Update each ticket
+    # Update each ticket, drawing numbers from the shared per-year sequence
     count = 0
     for ticket in tickets:
-        ticket.ticket_id = f'HD-{year}-{str(next_num).zfill(4)}'
+        ticket.ticket_id = TicketNumberAllocator.next_ticket_id()
         ticket.save(update_fields=['ticket_id'])
         print(f"Updated: {ticket.id} -> {ticket.ticket_id}")
-        next_num += 1
         count += 1
     
     print(f"\nFixed {count} tickets.")
@@ -0,0 +1,84 @@
+"""
+Load test for ticket_id allocation under concurrent submissions.
+
+Submits TOTAL tickets from WORKERS threads, first with the legacy
+read-max-then-write allocation and then with TicketNumberAllocator, and
+reports throughput and unique-constraint collisions for each.
+
+Numbers are drawn for BENCH_YEAR so real HD-YYYY counters are untouched;
+all rows created here are removed at the end.
+
+Run this manually: python manage.py shell < scripts/load_test_ticket_ids.py
+"""
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from django.db import connection, IntegrityError
+from apps.tickets.models import Ticket, TicketSequence
+from apps.tickets.services.ticket_number_service import TicketNumberAllocator
+
+BENCH_YEAR = 9999
+TOTAL = 2000
+WORKERS = 16
+PREFIX = f'HD-{BENCH_YEAR}-'
+
+
+def legacy_ticket_id():
+    """The previous allocation: read the highest ID, add one."""
+    last_ticket = Ticket.objects.filter(ticket_id__startswith=PREFIX).order_by('-ticket_id').first()
+    new_num = int(last_ticket.ticket_id.split('-')[-1]) + 1 if last_ticket else 1
+    return f'{PREFIX}{str(new_num).zfill(4)}'
+
+
+def sequence_ticket_id():
+    return TicketNumberAllocator.format_ticket_id(BENCH_YEAR, TicketNumberAllocator.next_number(BENCH_YEAR))
+
+
+def submit_batch(allocate, count, requestor_id):
+    """Create `count` submitted tickets; returns the number of collisions."""
+    collisions = 0
+    try:
+        for _ in range(count):
+            try:
+                Ticket.objects.create(
+                    title='load test',
+                    description='load test',
+                    requestor_id=requestor_id,
+                    status='submitted',
+                    ticket_id=allocate(),
+                )
+            except IntegrityError:
+                collisions += 1
+    finally:
+        connection.close()
+    return collisions
+
+
+def cleanup():
+    Ticket.objects.with_deleted().filter(ticket_id__startswith=PREFIX).delete()
+    TicketSequence.objects.filter(year=BENCH_YEAR).delete()
+
+
+def run(name, allocate):
+    cleanup()
+    requestor_id = uuid.uuid4()
+    per_worker = TOTAL // WORKERS
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        collisions = sum(pool.map(
+            lambda _: submit_batch(allocate, per_worker, requestor_id),
+            range(WORKERS),
+        ))
+    elapsed = time.perf_counter() - started
+    created = Ticket.objects.filter(ticket_id__startswith=PREFIX).count()
+    print(f"{name:>10}: {created}/{per_worker * WORKERS} created, "
+          f"{collisions} collisions, {created / elapsed:.0f} tickets/s")
+    return created / elapsed
+
+
+try:
+    legacy_rate = run('legacy', legacy_ticket_id)
+    sequence_rate = run('sequence', sequence_ticket_id)
+    print(f"Throughput gain: {sequence_rate / legacy_rate:.2f}x")
+finally:
+    cleanup()
@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def _ensure_audit_partitions(sender, **kwargs):
+    # Every container start runs `migrate`, which keeps upcoming months created
+    from .partitions import ensure_partitions
+    ensure_partitions()
+
+
+class AuditConfig(AppConfig):
+    name = 'apps.audit'
+    label = 'audit'
+
+    def ready(self):
+        post_migrate.connect(_ensure_audit_partitions, sender=self)
@@ -0,0 +1,84 @@
+"""
+Convert audit_logs into a table partitioned by month on "timestamp".
+
+PostgreSQL requires the partition key in every unique constraint, so the
+primary key becomes (id, timestamp); ids are UUID4 and stay unique. The
+Django model is unchanged. Existing rows are copied into monthly
+partitions and anything outside them lands in audit_logs_default.
+
+Other databases (local sqlite) keep the plain table.
+"""
+from datetime import date
+
+from django.db import migrations
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_audit_logs(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = 'audit_logs' AND pg_table_is_visible(c.oid)"
+        )
+        if cursor.fetchone():
+            return
+
+        # Free the index names so they can be recreated on the new parent
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = 'audit_logs' "
+            "AND indexname <> 'audit_logs_pkey'"
+        )
+        indexes = cursor.fetchall()
+        cursor.execute('ALTER TABLE audit_logs RENAME TO audit_logs_legacy')
+        cursor.execute('ALTER INDEX audit_logs_pkey RENAME TO audit_logs_legacy_pkey')
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX "{name}"')
+
+        cursor.execute(
+            'CREATE TABLE audit_logs (LIKE audit_logs_legacy INCLUDING DEFAULTS) '
+            'PARTITION BY RANGE ("timestamp")'
+        )
+        cursor.execute('ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id, "timestamp")')
+        for _, definition in indexes:
+            cursor.execute(definition)
+
+        cursor.execute('SELECT min("timestamp") FROM audit_logs_legacy')
+        oldest = cursor.fetchone()[0]
+        current = date.today().replace(day=1)
+        month = date(oldest.year, oldest.month, 1) if oldest else current
+        last = _add_months(current, MONTHS_AHEAD)
+        while month <= last:
+            upper = _add_months(month, 1)
+            cursor.execute(
+                f'CREATE TABLE "audit_logs_p{month:%Y_%m}" PARTITION OF audit_logs '
+                f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{upper.isoformat()} 00:00:00+00')"
+            )
+            month = upper
+        cursor.execute('CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT')
+
+        cursor.execute('INSERT INTO audit_logs SELECT * FROM audit_logs_legacy')
+        cursor.execute('DROP TABLE audit_logs_legacy')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0001_initial'),
+    ]
+
+    operations = [
+        # Not reversible in place; a partitioned audit_logs works with the
+        # 0001 model as-is, so rolling back leaves it partitioned.
+        migrations.RunPython(partition_audit_logs, migrations.RunPython.noop),
+    ]
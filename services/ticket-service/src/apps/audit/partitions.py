@@ -0,0 +1,179 @@
+"""
+Monthly range partitioning for the audit_logs table (PostgreSQL only).
+
+audit_logs is partitioned by RANGE ("timestamp") with one partition per
+calendar month (audit_logs_pYYYY_MM) plus a DEFAULT partition that catches
+rows outside any month partition. This lets history reads prune to the
+months they touch and turns archival into detaching whole partitions
+instead of updating millions of rows.
+
+All helpers are no-ops on other databases or before migration
+audit.0002 has converted the table.
+"""
+import logging
+import re
+from datetime import date, datetime
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+PARENT = AuditLog._meta.db_table
+DEFAULT_PARTITION = f'{PARENT}_default'
+ARCHIVE_SCHEMA = 'audit_archive'
+_PARTITION_RE = re.compile(rf'^{PARENT}_p(\d{{4}})_(\d{{2}})$')
+
+
+def month_start(value) -> date:
+    """First day of the month containing `value`."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Shift a first-of-month date by `count` months."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f'{PARENT}_p{month:%Y_%m}'
+
+
+def _bound(month: date) -> str:
+    # Partition bounds are UTC midnights (TIME_ZONE is UTC)
+    return f'{month.isoformat()} 00:00:00+00'
+
+
+def is_partitioned() -> bool:
+    """True if audit_logs is a partitioned table on this database."""
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [PARENT],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions() -> List[date]:
+    """Months that currently have an attached partition, oldest first."""
+    if not is_partitioned():
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = %s AND pg_table_is_visible(p.oid)",
+            [PARENT],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    months = []
+    for name in names:
+        match = _PARTITION_RE.match(name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def create_partition(month: date) -> None:
+    """
+    Create the partition for `month`.
+
+    If rows for that month already landed in the DEFAULT partition they
+    are moved into the new partition in the same transaction.
+    """
+    qn = connection.ops.quote_name
+    name, lower, upper = partition_name(month), _bound(month), _bound(add_months(month, 1))
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM {qn(DEFAULT_PARTITION)} '
+            f'WHERE "timestamp" >= %s AND "timestamp" < %s)',
+            [lower, upper],
+        )
+        stray_rows = cursor.fetchone()[0]
+
+        if stray_rows:
+            cursor.execute(f'ALTER TABLE {qn(PARENT)} DETACH PARTITION {qn(DEFAULT_PARTITION)}')
+
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {qn(name)} PARTITION OF {qn(PARENT)} '
+            f'FOR VALUES FROM (%s) TO (%s)',
+            [lower, upper],
+        )
+
+        if stray_rows:
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {qn(DEFAULT_PARTITION)} '
+                f'WHERE "timestamp" >= %s AND "timestamp" < %s RETURNING *) '
+                f'INSERT INTO {qn(name)} SELECT * FROM moved',
+                [lower, upper],
+            )
+            cursor.execute(f'ALTER TABLE {qn(PARENT)} ATTACH PARTITION {qn(DEFAULT_PARTITION)} DEFAULT')
+
+    logger.info(f"Created audit partition {name}")
+
+
+def ensure_partitions(months_ahead: Optional[int] = None) -> List[str]:
+    """
+    Make sure partitions exist from the current month up to `months_ahead`
+    months in the future (AUDIT_PARTITION_MONTHS_AHEAD, default 3).
+
+    Returns:
+        Names of the partitions that were created
+    """
+    if not is_partitioned():
+        return []
+    if months_ahead is None:
+        months_ahead = getattr(settings, 'AUDIT_PARTITION_MONTHS_AHEAD', 3)
+
+    existing = set(list_partitions())
+    current = month_start(timezone.now())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            create_partition(month)
+            created.append(partition_name(month))
+    return created
+
+
+def archive_partitions(before: datetime) -> List[str]:
+    """
+    Detach every month partition that ends on or before `before` and move
+    it to the audit_archive schema.
+
+    Detaching is a catalog change, so archiving a month costs the same no
+    matter how many rows it holds. Archived months stay queryable as
+    audit_archive.audit_logs_pYYYY_MM.
+
+    Returns:
+        Names of the partitions that were archived
+    """
+    if not is_partitioned():
+        return []
+
+    qn = connection.ops.quote_name
+    cutoff = month_start(before)
+    archived = []
+    for month in list_partitions():
+        if add_months(month, 1) > cutoff:
+            continue
+        name = partition_name(month)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'CREATE SCHEMA IF NOT EXISTS {qn(ARCHIVE_SCHEMA)}')
+            cursor.execute(f'ALTER TABLE {qn(PARENT)} DETACH PARTITION {qn(name)}')
+            cursor.execute(f'ALTER TABLE {qn(name)} SET SCHEMA {qn(ARCHIVE_SCHEMA)}')
+        logger.info(f"Archived audit partition {name} to {ARCHIVE_SCHEMA}")
+        archived.append(name)
+    return archived
@@ -0,0 +1,28 @@
+"""
+Optimized query selectors for Audit app.
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from .models import AuditLog
+
+# Monthly partitions make a day of slack free; it absorbs clock skew between
+# an object's created_at and its first audit entry.
+HISTORY_SLACK = timedelta(days=1)
+
+
+class AuditSelector:
+    """Optimized queries for AuditLog model."""
+
+    @staticmethod
+    def get_object_history(model_name: str, object_id, since: Optional[datetime] = None):
+        """
+        Get the audit trail for one object, newest first.
+
+        Pass `since` (usually the object's created_at) so PostgreSQL only
+        scans the monthly partitions the object can appear in.
+        """
+        queryset = AuditLog.objects.filter(model_name=model_name, object_id=object_id)
+        if since is not None:
+            queryset = queryset.filter(timestamp__gte=since - HISTORY_SLACK)
+        return queryset.order_by('-timestamp')
@@ -0,0 +1,252 @@
+"""
+Business logic services for Audit app.
+
+Audit entries are written through a pluggable sink chosen by the
+AUDIT_SINK setting:
+    sync        Insert each entry immediately (tests, debugging)
+    on_commit   Buffer entries for the current transaction and insert them
+                with one bulk_create when it commits (default)
+    background  Hand entries to a per-process flusher thread that inserts
+                them in batches with bulk_create
+
+Entries are built (and timestamped) when they are logged, and every sink
+writes them in the order they were logged, so history for an object_id
+always reads back in order.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from hdms_core import metrics
+from .models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+def _bulk_write(entries: List[AuditLog]) -> None:
+    """Insert entries in one statement, falling back to row-by-row on error."""
+    try:
+        AuditLog.objects.bulk_create(entries)
+        metrics.incr('audit.sink.written', len(entries))
+        metrics.incr('audit.sink.batches')
+    except Exception as e:
+        logger.error(f"Audit batch of {len(entries)} failed, retrying individually: {e}")
+        for entry in entries:
+            try:
+                entry.save(force_insert=True)
+                metrics.incr('audit.sink.written')
+            except Exception as row_error:
+                metrics.incr('audit.sink.failed')
+                logger.error(f"Audit entry for {entry.model_name} #{entry.object_id} lost: {row_error}")
+
+
+class SyncAuditSink:
+    """Write every entry immediately in the caller's thread."""
+
+    def write(self, entry: AuditLog) -> None:
+        entry.save(force_insert=True)
+        metrics.incr('audit.sink.written')
+
+    def flush(self) -> None:
+        pass
+
+
+class _PendingBatch:
+    """Entries buffered for one transaction."""
+
+    def __init__(self):
+        self.entries: List[AuditLog] = []
+
+    def flush(self) -> None:
+        entries, self.entries = self.entries, []
+        if entries:
+            _bulk_write(entries)
+
+
+class OnCommitAuditSink:
+    """
+    Buffer entries until the surrounding transaction commits.
+
+    Outside a transaction (autocommit) entries are written immediately.
+    Entries logged inside a transaction that rolls back are discarded
+    along with it.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def write(self, entry: AuditLog) -> None:
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            SyncAuditSink().write(entry)
+            return
+
+        batch: Optional[_PendingBatch] = getattr(self._local, 'batch', None)
+        # A batch whose callback is no longer queued belongs to a finished
+        # or rolled-back transaction; start a new one.
+        if batch is None or not any(func == batch.flush for _, func, _ in connection.run_on_commit):
+            batch = _PendingBatch()
+            self._local.batch = batch
+            transaction.on_commit(batch.flush)
+        batch.entries.append(entry)
+
+    def flush(self) -> None:
+        pass
+
+
+class BackgroundAuditSink:
+    """
+    Queue entries for a flusher thread that writes them with bulk_create.
+
+    A batch is written as soon as it reaches `batch_size` entries or
+    `flush_interval` seconds after its first entry, whichever comes first,
+    so bursts are absorbed in large inserts while quiet periods still
+    flush promptly. A single flusher per process keeps entries in FIFO
+    order. When the queue is full the caller waits for room rather than
+    dropping the entry or writing it ahead of those already queued.
+    """
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 0.5, max_queue: int = 10000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: 'queue.Queue[AuditLog]' = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def _ensure_started(self) -> None:
+        # Started lazily so gunicorn workers each get their own thread after fork
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                atexit.register(self.flush)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='audit-flusher', daemon=True)
+            self._thread.start()
+
+    def write(self, entry: AuditLog) -> None:
+        # Enqueue only once the caller's transaction (if any) has committed
+        transaction.on_commit(lambda: self._enqueue(entry))
+
+    def _enqueue(self, entry: AuditLog) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            metrics.incr('audit.sink.overflow')
+            while True:
+                try:
+                    self._queue.put(entry, timeout=1)
+                    break
+                except queue.Full:
+                    # Still full: make sure there is a flusher to make room
+                    self._ensure_started()
+        metrics.incr('audit.sink.enqueued')
+        metrics.set_gauge('audit.sink.queue_depth', self._queue.qsize())
+
+    def _next_batch(self) -> List[AuditLog]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        from django.db import close_old_connections
+        while True:
+            batch = self._next_batch()
+            close_old_connections()
+            _bulk_write(batch)
+            for _ in batch:
+                self._queue.task_done()
+            metrics.set_gauge('audit.sink.queue_depth', self._queue.qsize())
+
+    def flush(self, timeout: float = 10.0) -> None:
+        """
+        Wait until everything queued, including the batch the flusher is
+        writing, has been written (shutdown, tests).
+        """
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            # No flusher in this process: write what is queued here
+            while True:
+                batch = []
+                try:
+                    while len(batch) < self.batch_size:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    pass
+                if not batch:
+                    return
+                _bulk_write(batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error(f"Audit flush timed out with {self._queue.unfinished_tasks} entries unwritten")
+                    return
+                self._queue.all_tasks_done.wait(remaining)
+
+
+_sinks = {}
+_sinks_lock = threading.Lock()
+
+
+def get_audit_sink():
+    """Return the process-wide sink configured by AUDIT_SINK."""
+    mode = getattr(settings, 'AUDIT_SINK', 'on_commit')
+    sink = _sinks.get(mode)
+    if sink is None:
+        with _sinks_lock:
+            sink = _sinks.get(mode)
+            if sink is None:
+                if mode == 'sync':
+                    sink = SyncAuditSink()
+                elif mode == 'on_commit':
+                    sink = OnCommitAuditSink()
+                elif mode == 'background':
+                    sink = BackgroundAuditSink(
+                        batch_size=getattr(settings, 'AUDIT_BATCH_SIZE', 100),
+                        flush_interval=getattr(settings, 'AUDIT_FLUSH_INTERVAL', 0.5),
+                        max_queue=getattr(settings, 'AUDIT_QUEUE_SIZE', 10000),
+                    )
+                else:
+                    raise ValueError(f"Unknown AUDIT_SINK: {mode}")
+                _sinks[mode] = sink
+    return sink
+
+
+class AuditService:
+    """Service for writing audit log entries."""
+
+    @staticmethod
+    def log(**fields) -> AuditLog:
+        """
+        Record an audit entry through the configured sink.
+
+        Accepts the same fields as AuditLog; the entry is timestamped now,
+        even if the sink persists it later.
+        """
+        entry = AuditLog(**fields)
+        get_audit_sink().write(entry)
+        return entry
@@ -1,30 +1,48 @@
 """
 Ticket Service API endpoints.
 """
+import logging
+from datetime import date
 from ninja import Router, File, UploadedFile
 from ninja.security import HttpBearer
 from ninja.errors import HttpError
 from typing import List, Optional
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
+from django.core.exceptions import ValidationError
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from apps.tickets.schemas import (
     TicketOut, TicketIn, TicketUpdateIn, StatusUpdateIn, 
     AttachmentOut, AttachmentCreateIn, TicketConfirmReviewIn,
     AssignTicketIn, RejectTicketIn, PostponeTicketIn,
-    AuditLogOut, TicketProgressIn, TicketAcknowledgeIn, SLAUpdateIn
+    AuditLogOut, TicketProgressIn, TicketAcknowledgeIn, SLAUpdateIn,
+    TicketPageOut, TicketStatsOut
 )
 from apps.tickets.models.ticket import Ticket
 from apps.tickets.models.sub_ticket import SubTicket
 from apps.tickets.models.attachment import Attachment
-from apps.audit.models import AuditLog, ActionType, AuditCategory
+from apps.tickets.selectors import TicketSelector
+from apps.audit.models import ActionType, AuditCategory
+from apps.audit.services import AuditService
+from apps.audit.selectors import AuditSelector
 from hdms_core.clients.user_client import UserClient
+from hdms_core.pagination import KeysetPaginator, InvalidCursor, cached_count
 
 from hdms_core.authentication import RemoteJWTAuthentication
 
+logger = logging.getLogger(__name__)
+
 router = Router(tags=["tickets"], auth=RemoteJWTAuthentication())
 
 
+def _split_statuses(status: Optional[str]) -> List[str]:
+    """Statuses from a comma-separated `status` parameter."""
+    return [s.strip() for s in status.split(',') if s.strip()] if status else []
+
+
 @router.post("/", response=TicketOut)
 def create_ticket(request, payload: TicketIn):
     """Create a new ticket."""
@@ -45,37 +63,136 @@ def create_ticket(request, payload: TicketIn):
     return ticket
 
 
-@router.get("/", response=List[TicketOut])
-def list_tickets(request, status: Optional[str] = None, requestor_id: Optional[str] = None, assignee_id: Optional[str] = None, exclude_drafts: bool = True):
-    """List tickets with optional filters.
+@router.get("/", response=TicketPageOut)
+def list_tickets(
+    request,
+    status: Optional[str] = None,
+    requestor_id: Optional[str] = None,
+    assignee_id: Optional[str] = None,
+    exclude_drafts: bool = True,
+    older_than_hours: Optional[int] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+    cursor: Optional[str] = None,
+    page_size: int = KeysetPaginator.default_page_size,
+    ids: Optional[str] = None,
+):
+    """List tickets with optional filters, newest first, keyset-paginated.
+    
+    With `ids` (comma-separated, at most KeysetPaginator.max_page_size) this
+    is a bulk lookup: exactly those tickets, drafts included, in one page.
     
     Args:
-        status: Filter by specific status
+        status: Filter by status; comma-separated for several (e.g. "assigned,in_progress")
         requestor_id: Filter by requestor (if provided, shows drafts)
         assignee_id: Filter by assignee
         exclude_drafts: Exclude draft tickets (default True for moderator view)
+        older_than_hours: Only tickets created more than this many hours ago
+        created_from: Only tickets created on or after this day
+        created_to: Only tickets created on or before this day
+        cursor: Opaque `next`/`previous` cursor from an earlier page
+        page_size: Rows per page (capped at KeysetPaginator.max_page_size)
+        ids: Comma-separated ticket UUIDs to fetch
     """
-    queryset = Ticket.objects.all()
+    queryset = TicketSelector.with_attachments(Ticket.objects.all())
     
-    # Exclude drafts unless viewing own tickets (requestor or assignee)
-    if exclude_drafts and not requestor_id and not assignee_id:
-        queryset = queryset.exclude(status='draft')
+    if ids is not None:
+        id_list = list(dict.fromkeys(i.strip() for i in ids.split(',') if i.strip()))
+        if len(id_list) > KeysetPaginator.max_page_size:
+            raise HttpError(400, f"At most {KeysetPaginator.max_page_size} ids per request")
+        try:
+            tickets = list(queryset.filter(id__in=id_list).order_by('-created_at', '-id'))
+        except ValidationError:
+            raise HttpError(400, "Invalid ticket id")
+        return {'results': tickets, 'count': len(tickets), 'next': None, 'previous': None}
     
-    if status:
-        queryset = queryset.filter(status=status)
-    if requestor_id:
-        queryset = queryset.filter(requestor_id=requestor_id)
-    if assignee_id:
-        queryset = queryset.filter(assignee_id=assignee_id)
+    queryset = TicketSelector.filter_listing(
+        queryset,
+        statuses=_split_statuses(status),
+        requestor_id=requestor_id,
+        assignee_id=assignee_id,
+        exclude_drafts=exclude_drafts,
+        older_than_hours=older_than_hours,
+        created_from=created_from,
+        created_to=created_to,
+    )
     
-    return [TicketOut.from_orm(ticket) for ticket in queryset]
+    try:
+        page = KeysetPaginator(queryset, page_size=page_size).paginate(cursor)
+    except InvalidCursor as e:
+        raise HttpError(400, str(e))
+    
+    page['count'] = cached_count(
+        queryset,
+        prefix='tickets:list',
+        ttl=getattr(settings, 'TICKET_LIST_COUNT_TTL', 30),
+    )
+    return page
 
 
+@router.get("/stats", response=TicketStatsOut)
+def ticket_stats(
+    request,
+    status: Optional[str] = None,
+    requestor_id: Optional[str] = None,
+    assignee_id: Optional[str] = None,
+    exclude_drafts: bool = True,
+    older_than_hours: Optional[int] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+    days: Optional[int] = None,
+):
+    """Ticket counts for dashboards, aggregated in the database.
+    
+    Takes the same filters as the ticket list. Results are cached for
+    TICKET_LIST_COUNT_TTL seconds per filter combination.
+    
+    Args:
+        days: Also count tickets created per day over this many days (at most 366)
+    """
+    if days is not None and not 0 < days <= 366:
+        raise HttpError(400, "days must be between 1 and 366")
+    key = 'tickets:stats:' + ':'.join(
+        str(v) for v in (
+            status, requestor_id, assignee_id, exclude_drafts, older_than_hours, created_from, created_to, days,
+        )
+    )
+    try:
+        stats = cache.get(key)
+        if stats is not None:
+            return stats
+    except Exception as e:
+        logger.warning(f"Stats cache read failed: {e}")
+    
+    queryset = TicketSelector.filter_listing(
+        Ticket.objects.all(),
+        statuses=_split_statuses(status),
+        requestor_id=requestor_id,
+        assignee_id=assignee_id,
+        exclude_drafts=exclude_drafts,
+        older_than_hours=older_than_hours,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    try:
+        stats = TicketSelector.get_stats(queryset, days=days)
+    except ValidationError:
+        raise HttpError(400, "Invalid filter id")
+    try:
+        cache.set(key, stats, getattr(settings, 'TICKET_LIST_COUNT_TTL', 30))
+    except Exception as e:
+        logger.warning(f"Stats cache write failed: {e}")
+    return stats
+
 
 @router.get("/{ticket_id}", response=TicketOut)
 def get_ticket(request, ticket_id: str):
     """Get ticket by ID."""
-    ticket = Ticket.objects.get(id=ticket_id, is_deleted=False)
+    # A real 404 (not a 500) lets TicketClient cache the miss instead of retrying
+    try:
+        ticket = Ticket.objects.get(id=ticket_id, is_deleted=False)
+    except (Ticket.DoesNotExist, ValidationError):
+        raise HttpError(404, "Ticket not found")
     return TicketOut.from_orm(ticket)
 
 
@@ -91,48 +208,51 @@ def update_ticket(request, ticket_id: str, payload: TicketUpdateIn):
     return TicketOut.from_orm(ticket)
 
 
+# Actions that succeed without a transition when the ticket already has their target status
+IDEMPOTENT_ACTIONS = {'submit': 'submitted', 'postpone': 'postponed', 'reject': 'rejected'}
+
+
 @router.post("/{ticket_id}/status", response=TicketOut)
+@transaction.atomic
 def update_status(request, ticket_id: str, payload: StatusUpdateIn):
     """Update ticket status using FSM."""
-    ticket = Ticket.objects.get(id=ticket_id, is_deleted=False)
+    # Row lock, so concurrent status changes of one ticket see each other's result
+    ticket = Ticket.objects.select_for_update().get(id=ticket_id, is_deleted=False)
     
     # Get transition method
     transition_method = getattr(ticket, payload.action, None)
     if not transition_method:
         raise HttpError(400, f"Invalid action: {payload.action}")
     
-    # Execute transition
+    # Idempotency check against the stored state: a repeated action is a success
+    if IDEMPOTENT_ACTIONS.get(payload.action) == ticket.status:
+        return TicketOut.from_orm(ticket)
+    
+    # Execute transition in a savepoint: a failed save or audit write rolls
+    # back to here and leaves the request transaction usable
+    old_status = ticket.status
     try:
-        old_status = ticket.status
-        # Only reject and postpone accept a reason parameter
-        if payload.action in ['reject', 'postpone'] and payload.reason:
-            transition_method(payload.reason)
-        else:
-            transition_method()
-        ticket.save()
-        
-        # Log action
-        AuditLog.objects.create(
-            action_type=ActionType.UPDATE,
-            category=AuditCategory.TICKET,
-            model_name='Ticket',
-            object_id=ticket.id,
-            performed_by_id=request.user.id if hasattr(request, 'user') else ticket.requestor_id,
-            old_state={'status': old_status},
-            new_state={'status': ticket.status},
-            changes={'status': {'old': old_status, 'new': ticket.status}},
-            reason=f"Status change: {payload.action.upper()} - {payload.reason or ''}"
-        )
-        
-    except Exception as e:
-        # Idempotency check: if action matches current state, consider it a success
-        if payload.action == 'submit' and ticket.status == 'submitted':
-            return TicketOut.from_orm(ticket)
-        if payload.action == 'postpone' and ticket.status == 'postponed':
-            return TicketOut.from_orm(ticket)
-        if payload.action == 'reject' and ticket.status == 'rejected':
-            return TicketOut.from_orm(ticket)
+        with transaction.atomic():
+            # Only reject and postpone accept a reason parameter
+            if payload.action in ['reject', 'postpone'] and payload.reason:
+                transition_method(payload.reason)
+            else:
+                transition_method()
+            ticket.save()
             
+            # Log action
+            AuditService.log(
+                action_type=ActionType.UPDATE,
+                category=AuditCategory.TICKET,
+                model_name='Ticket',
+                object_id=ticket.id,
+                performed_by_id=request.user.id if hasattr(request, 'user') else ticket.requestor_id,
+                old_state={'status': old_status},
+                new_state={'status': ticket.status},
+                changes={'status': {'old': old_status, 'new': ticket.status}},
+                reason=f"Status change: {payload.action.upper()} - {payload.reason or ''}"
+            )
+    except Exception as e:
         raise HttpError(400, str(e))
     
     return TicketOut.from_orm(ticket)
@@ -162,6 +282,7 @@ def add_attachment(request, ticket_id: str, payload: AttachmentCreateIn):
     return attachment
 
 @router.post("/{ticket_id}/assign", response=TicketOut)
+@transaction.atomic
 def assign_ticket(request, ticket_id: str, payload: AssignTicketIn):
     """Assign ticket to an assignee."""
     try:
@@ -192,7 +313,7 @@ def assign_ticket(request, ticket_id: str, payload: AssignTicketIn):
     ticket.save()
     
     # Log assignment
-    AuditLog.objects.create(
+    AuditService.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
@@ -225,6 +346,7 @@ def reject_ticket(request, ticket_id: str, payload: RejectTicketIn):
 
 
 @router.post("/{ticket_id}/postpone", response=TicketOut)
+@transaction.atomic
 def postpone_ticket(request, ticket_id: str, payload: PostponeTicketIn):
     """Postpone a ticket with reason."""
     try:
@@ -236,7 +358,7 @@ def postpone_ticket(request, ticket_id: str, payload: PostponeTicketIn):
     ticket.save()
     
     # Log postponement
-    AuditLog.objects.create(
+    AuditService.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
@@ -249,6 +371,7 @@ def postpone_ticket(request, ticket_id: str, payload: PostponeTicketIn):
     return ticket
 
 @router.patch("/{ticket_id}/acknowledge", response=TicketOut)
+@transaction.atomic
 def acknowledge_ticket(request, ticket_id: str, payload: TicketAcknowledgeIn):
     """Acknowledge ticket assignment."""
     try:
@@ -276,7 +399,7 @@ def acknowledge_ticket(request, ticket_id: str, payload: TicketAcknowledgeIn):
             'status': ticket.status
         }
         
-        AuditLog.objects.create(
+        AuditService.log(
             action_type=ActionType.UPDATE,
             category=AuditCategory.TICKET,
             model_name='Ticket',
@@ -293,6 +416,7 @@ def acknowledge_ticket(request, ticket_id: str, payload: TicketAcknowledgeIn):
     return ticket
 
 @router.patch("/{ticket_id}/progress", response=TicketOut)
+@transaction.atomic
 def update_progress(request, ticket_id: str, payload: TicketProgressIn):
     """Update ticket progress."""
     try:
@@ -304,7 +428,7 @@ def update_progress(request, ticket_id: str, payload: TicketProgressIn):
     ticket.progress_percent = payload.progress_percent
     ticket.save()
     
-    AuditLog.objects.create(
+    AuditService.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
@@ -318,6 +442,7 @@ def update_progress(request, ticket_id: str, payload: TicketProgressIn):
     return ticket
 
 @router.patch("/{ticket_id}/sla", response=TicketOut)
+@transaction.atomic
 def update_sla(request, ticket_id: str, payload: SLAUpdateIn):
     """Update ticket SLA (Due Date)."""
     try:
@@ -329,7 +454,7 @@ def update_sla(request, ticket_id: str, payload: SLAUpdateIn):
     ticket.due_at = payload.due_at
     ticket.save()
     
-    AuditLog.objects.create(
+    AuditService.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
@@ -345,12 +470,12 @@ def update_sla(request, ticket_id: str, payload: SLAUpdateIn):
 @router.get("/{ticket_id}/history", response=List[AuditLogOut])
 def get_ticket_history(request, ticket_id: str):
     """Get ticket audit log history."""
-    return AuditLog.objects.filter(
-        model_name='Ticket', 
-        object_id=ticket_id
-    ).order_by('-timestamp')
+    # Bounding by created_at lets Postgres skip partitions older than the ticket
+    created_at = Ticket.objects.with_deleted().filter(id=ticket_id).values_list('created_at', flat=True).first()
+    return AuditSelector.get_object_history('Ticket', ticket_id, since=created_at)
 
 @router.post("/{ticket_id}/confirm-review", response=TicketOut)
+@transaction.atomic
 def confirm_review_ticket(request, ticket_id: str, payload: TicketConfirmReviewIn):
     """Initial moderator review: update fields and assign."""
     from datetime import timedelta
@@ -411,7 +536,7 @@ def confirm_review_ticket(request, ticket_id: str, payload: TicketConfirmReviewI
     if ticket.status != old_status:
         changes['status'] = {'old': old_status, 'new': ticket.status}
 
-    AuditLog.objects.create(
+    AuditService.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
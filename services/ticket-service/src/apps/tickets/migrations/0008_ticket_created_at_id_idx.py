@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-17 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0007_alter_subticket_priority_alter_ticket_priority'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['created_at', 'id'], name='tickets_created_6039f7_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.0.1 on 2026-10-17 14:20
+
+from django.db import migrations, models
+
+
+def seed_sequences(apps, schema_editor):
+    """Start each year's counter at the highest ticket number already issued."""
+    Ticket = apps.get_model('tickets', 'Ticket')
+    TicketSequence = apps.get_model('tickets', 'TicketSequence')
+
+    last_numbers = {}
+    for ticket_id in Ticket.objects.filter(ticket_id__startswith='HD-').values_list('ticket_id', flat=True).iterator():
+        try:
+            _, year, number = ticket_id.split('-')
+            year, number = int(year), int(number)
+        except ValueError:
+            continue
+        last_numbers[year] = max(number, last_numbers.get(year, 0))
+
+    TicketSequence.objects.bulk_create([
+        TicketSequence(year=year, last_number=number)
+        for year, number in last_numbers.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0008_ticket_created_at_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketSequence',
+            fields=[
+                ('year', models.PositiveIntegerField(primary_key=True, serialize=False)),
+                ('last_number', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Ticket Sequence',
+                'verbose_name_plural': 'Ticket Sequences',
+                'db_table': 'ticket_sequences',
+            },
+        ),
+        migrations.RunPython(seed_sequences, migrations.RunPython.noop),
+    ]
@@ -3,7 +3,7 @@ Ticket model for Ticket Service.
 """
 import sys
 from pathlib import Path
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django_fsm import FSMField, transition
 from django.utils import timezone
@@ -48,22 +48,16 @@ class Ticket(BaseModel):
     def save(self, *args, **kwargs):
         # Only generate ticket_id when status is not 'draft' AND ticket_id is empty
         if not self.ticket_id and self.status != 'draft':
-            # Generate ticket_id on first non-draft save
-            year = timezone.now().year
-            # Get the last ticket number for this year
-            last_ticket = Ticket.objects.filter(
-                ticket_id__startswith=f'HD-{year}-'
-            ).order_by('-ticket_id').first()
-            
-            if last_ticket and last_ticket.ticket_id:
-                last_num = int(last_ticket.ticket_id.split('-')[-1])
-                new_num = last_num + 1
-            else:
-                new_num = 1
-            
-            self.ticket_id = f'HD-{year}-{str(new_num).zfill(4)}'
+            # Generate ticket_id on first non-draft save from the per-year sequence
+            from apps.tickets.services.ticket_number_service import TicketNumberAllocator
+            self.ticket_id = TicketNumberAllocator.next_ticket_id()
         
         super().save(*args, **kwargs)
+        
+        # Other services cache ticket lookups; drop ours once the change is visible
+        from hdms_core.clients.ticket_client import TicketClient
+        ticket_pk = self.pk
+        transaction.on_commit(lambda: TicketClient.invalidate_ticket(ticket_pk))
     
     # Status with FSM
     status = FSMField(default=TicketStatus.DRAFT, protected=True, db_index=True)
@@ -103,6 +97,7 @@ class Ticket(BaseModel):
             models.Index(fields=['assignee_id']),
             models.Index(fields=['is_deleted', 'status']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['created_at', 'id']),  # Keyset pagination
         ]
         ordering = ['-created_at']
     
@@ -0,0 +1,72 @@
+"""
+TicketSequence model for Ticket Service.
+"""
+import threading
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections, models
+
+# Per-thread autocommit connection used by TicketSequence.reserve()
+_reserve_local = threading.local()
+
+
+class TicketSequence(models.Model):
+    """
+    Per-year counter backing human-readable ticket IDs (HD-YYYY-NNNN).
+    
+    One row per year; `last_number` is the highest number handed out.
+    Rows are only ever advanced through `reserve()`, which is a single
+    atomic upsert, so concurrent submissions never read-then-write.
+    Reservations commit on their own, so a number taken by a request that
+    later rolls back is skipped.
+    """
+    year = models.PositiveIntegerField(primary_key=True)
+    last_number = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        db_table = 'ticket_sequences'
+        verbose_name = 'Ticket Sequence'
+        verbose_name_plural = 'Ticket Sequences'
+    
+    def __str__(self):
+        return f"HD-{self.year}: {self.last_number}"
+    
+    @staticmethod
+    def _reserve_connection():
+        """
+        Connection to run the upsert on, outside any request transaction.
+        
+        The upsert locks the year's row until its transaction ends. On the
+        request's connection inside an atomic block that is the end of the
+        request, so every submission of the year would queue behind it. On
+        PostgreSQL a separate autocommit connection releases the lock as
+        soon as the statement finishes; SQLite has a single writer anyway.
+        """
+        if connection.vendor != 'postgresql' or not connection.in_atomic_block:
+            return connection
+        conn = getattr(_reserve_local, 'connection', None)
+        if conn is None:
+            conn = connections.create_connection(DEFAULT_DB_ALIAS)
+            _reserve_local.connection = conn
+        conn.close_if_unusable_or_obsolete()
+        return conn
+    
+    @classmethod
+    def reserve(cls, year: int, count: int = 1) -> int:
+        """
+        Atomically reserve `count` consecutive numbers for `year`.
+        
+        Returns:
+            The last number of the reserved block; the block is
+            `result - count + 1` .. `result` inclusive.
+        """
+        conn = cls._reserve_connection()
+        table = conn.ops.quote_name(cls._meta.db_table)
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (year, last_number) VALUES (%s, %s) "
+                f"ON CONFLICT (year) DO UPDATE "
+                f"SET last_number = {table}.last_number + EXCLUDED.last_number "
+                f"RETURNING last_number",
+                [year, count],
+            )
+            return cursor.fetchone()[0]
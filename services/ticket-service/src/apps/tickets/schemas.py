@@ -4,7 +4,7 @@ Pydantic schemas for Ticket Service.
 from uuid import UUID
 from ninja import Schema
 from typing import Optional, List
-from datetime import datetime
+from datetime import date, datetime
 
 
 class AttachmentCreateIn(Schema):
@@ -46,6 +46,35 @@ class TicketOut(Schema):
     attachments: List[AttachmentOut] = []
 
 
+class TicketPageOut(Schema):
+    """Cursor-paginated ticket list."""
+    results: List[TicketOut]
+    count: int
+    next: Optional[str] = None
+    previous: Optional[str] = None
+
+
+class TicketStatsGroupOut(Schema):
+    """Ticket count for one status, priority and department."""
+    status: str
+    priority: str
+    department_id: Optional[UUID] = None
+    count: int
+
+
+class TicketDayCountOut(Schema):
+    """Tickets created on one day."""
+    date: date
+    count: int
+
+
+class TicketStatsOut(Schema):
+    """Aggregated ticket counts for dashboards."""
+    total: int
+    groups: List[TicketStatsGroupOut]
+    created_by_day: List[TicketDayCountOut] = []
+
+
 class TicketIn(Schema):
     """Ticket input schema."""
     title: str
@@ -1,13 +1,86 @@
 """
 Optimized query selectors for Ticket app.
 """
-from django.db.models import Q
+from datetime import date, timedelta
+from typing import List, Optional
+
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
 from .models import Ticket
 
 
 class TicketSelector:
     """Optimized queries for Ticket model."""
     
+    @staticmethod
+    def with_attachments(queryset):
+        """
+        Prefetch attachments for a ticket queryset.
+        
+        TicketOut serializes the reverse `attachments` relation, so without
+        this every listed ticket costs one extra query.
+        """
+        return queryset.prefetch_related('attachments')
+    
+    @staticmethod
+    def filter_listing(queryset, statuses: Optional[List[str]] = None, requestor_id: str = None,
+                       assignee_id: str = None, exclude_drafts: bool = True, older_than_hours: int = None,
+                       created_from: date = None, created_to: date = None):
+        """
+        Apply the ticket listing filters shared by the list and stats endpoints.
+        
+        Drafts are excluded unless `exclude_drafts` is False or the listing is
+        scoped to a requestor or assignee (their own drafts are shown).
+        `created_from` and `created_to` are inclusive calendar days.
+        """
+        if exclude_drafts and not requestor_id and not assignee_id:
+            queryset = queryset.exclude(status='draft')
+        if statuses:
+            queryset = queryset.filter(status__in=statuses)
+        if requestor_id:
+            queryset = queryset.filter(requestor_id=requestor_id)
+        if assignee_id:
+            queryset = queryset.filter(assignee_id=assignee_id)
+        if older_than_hours is not None:
+            queryset = queryset.filter(created_at__lt=timezone.now() - timedelta(hours=older_than_hours))
+        if created_from:
+            queryset = queryset.filter(created_at__date__gte=created_from)
+        if created_to:
+            queryset = queryset.filter(created_at__date__lte=created_to)
+        return queryset
+    
+    @staticmethod
+    def get_stats(queryset, days: int = None) -> dict:
+        """
+        Aggregate ticket counts in the database for dashboards.
+        
+        Returns:
+            Dictionary with 'total', 'groups' (count per status, priority and
+            department_id) and 'created_by_day' (tickets created per day over
+            the last `days` days, oldest first; empty without `days`)
+        """
+        groups = list(
+            queryset.order_by()
+            .values('status', 'priority', 'department_id')
+            .annotate(count=Count('id'))
+        )
+        created_by_day = []
+        if days:
+            since = timezone.now() - timedelta(days=days)
+            created_by_day = list(
+                queryset.filter(created_at__gte=since)
+                .annotate(date=TruncDate('created_at'))
+                .order_by('date')
+                .values('date')
+                .annotate(count=Count('id'))
+            )
+        return {
+            'total': sum(group['count'] for group in groups),
+            'groups': groups,
+            'created_by_day': created_by_day,
+        }
+    
     @staticmethod
     def get_user_tickets(user_id: str, status: str = None):
         """Get tickets for a user (as requestor or assignee)."""
@@ -17,22 +90,22 @@ class TicketSelector:
         )
         if status:
             queryset = queryset.filter(status=status)
-        return queryset.select_related().order_by('-created_at')
+        return TicketSelector.with_attachments(queryset).order_by('-created_at')
     
     @staticmethod
     def get_department_tickets(department_id: str):
         """Get tickets for a department."""
-        return Ticket.objects.filter(
+        return TicketSelector.with_attachments(Ticket.objects.filter(
             department_id=department_id,
             is_deleted=False
-        ).select_related().order_by('-created_at')
+        )).order_by('-created_at')
     
     @staticmethod
     def get_tickets_by_status(status: str):
         """Get tickets by status."""
-        return Ticket.objects.filter(
+        return TicketSelector.with_attachments(Ticket.objects.filter(
             status=status,
             is_deleted=False
-        ).select_related().order_by('-created_at')
+        )).order_by('-created_at')
 
 
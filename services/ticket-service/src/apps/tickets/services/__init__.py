@@ -2,7 +2,8 @@
 Ticket services package.
 """
 from .ticket_service import TicketService
+from .ticket_number_service import TicketNumberAllocator
 
-__all__ = ['TicketService']
+__all__ = ['TicketService', 'TicketNumberAllocator']
 
 
@@ -0,0 +1,55 @@
+"""
+Allocation of human-readable ticket IDs (HD-YYYY-NNNN).
+"""
+import threading
+from typing import Dict, List
+from django.conf import settings
+from django.utils import timezone
+from ..models.ticket_sequence import TicketSequence
+
+
+class TicketNumberAllocator:
+    """
+    Hands out ticket numbers from the per-year TicketSequence counter.
+    
+    With TICKET_NUMBER_BLOCK_SIZE > 1 each worker process reserves a block
+    of numbers in one round trip and serves from it locally. Numbers stay
+    unique, but may be issued out of submission order across workers and
+    the unused tail of a block is skipped when a worker restarts.
+    """
+    
+    _lock = threading.Lock()
+    # year -> [next_number, last_number_in_block]
+    _blocks: Dict[int, List[int]] = {}
+    
+    @staticmethod
+    def format_ticket_id(year: int, number: int) -> str:
+        """Format a sequence number as HD-YYYY-NNNN."""
+        return f'HD-{year}-{str(number).zfill(4)}'
+    
+    @classmethod
+    def block_size(cls) -> int:
+        return max(1, getattr(settings, 'TICKET_NUMBER_BLOCK_SIZE', 1))
+    
+    @classmethod
+    def next_number(cls, year: int) -> int:
+        """Return the next unused number for `year`."""
+        size = cls.block_size()
+        if size == 1:
+            return TicketSequence.reserve(year)
+        
+        with cls._lock:
+            block = cls._blocks.get(year)
+            if not block or block[0] > block[1]:
+                last = TicketSequence.reserve(year, size)
+                block = [last - size + 1, last]
+                cls._blocks[year] = block
+            number = block[0]
+            block[0] += 1
+            return number
+    
+    @classmethod
+    def next_ticket_id(cls) -> str:
+        """Allocate the next ticket ID for the current year."""
+        year = timezone.now().year
+        return cls.format_ticket_id(year, cls.next_number(year))
@@ -0,0 +1,167 @@
+"""
+Tests for the tickets app.
+"""
+import threading
+import uuid
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.db import OperationalError, connection, transaction
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from apps.tickets.api import list_tickets, ticket_stats, update_status
+from apps.tickets.models.attachment import Attachment
+from apps.tickets.models.ticket import Ticket
+from apps.tickets.models import ticket_sequence
+from apps.tickets.models.ticket_sequence import TicketSequence
+from apps.tickets.schemas import StatusUpdateIn, TicketPageOut
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ListTicketsQueryCountTests(TestCase):
+    """Listing tickets costs the same number of queries whatever the page size."""
+
+    @classmethod
+    def setUpTestData(cls):
+        requestor_id = uuid.uuid4()
+        for i in range(12):
+            ticket = Ticket.objects.create(
+                title=f'Ticket {i}', description='d', requestor_id=requestor_id, status='submitted',
+            )
+            for name in ('a.pdf', 'b.png'):
+                Attachment.objects.create(ticket=ticket, filename=name, file_size=1, content_type='application/pdf')
+
+    def setUp(self):
+        self.request = RequestFactory().get('/api/v1/tickets/')
+
+    def _list(self, page_size: int) -> TicketPageOut:
+        # Serializing reads each ticket's attachments, where an N+1 would show
+        return TicketPageOut.from_orm(list_tickets(self.request, page_size=page_size))
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        # Page, attachments prefetch, count
+        for page_size in (2, 10):
+            cache.clear()  # The total is cached per filter set
+            with self.subTest(page_size=page_size), self.assertNumQueries(3):
+                page = self._list(page_size)
+            self.assertEqual(len(page.results), page_size)
+            self.assertTrue(all(len(ticket.attachments) == 2 for ticket in page.results))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class TicketStatsTests(TestCase):
+    """Dashboard counts come from one aggregate query, not from listing tickets."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.requestor_id = uuid.uuid4()
+        cls.department_id = uuid.uuid4()
+        for status, priority, age_hours in [
+            ('submitted', 'high', 1), ('submitted', 'high', 30), ('assigned', 'low', 100),
+            ('resolved', 'medium', 200), ('draft', 'medium', 1),
+        ]:
+            ticket = Ticket.objects.create(
+                title=status, description='d', requestor_id=cls.requestor_id,
+                department_id=cls.department_id, status=status, priority=priority,
+            )
+            Ticket.objects.filter(id=ticket.id).update(created_at=timezone.now() - timedelta(hours=age_hours))
+
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().get('/api/v1/tickets/stats')
+
+    def test_counts_by_status_priority_and_department(self):
+        with self.assertNumQueries(2):
+            stats = ticket_stats(self.request, days=30)
+
+        self.assertEqual(stats['total'], 4)  # Drafts are excluded as in the list
+        counts = {(g['status'], g['priority']): g['count'] for g in stats['groups']}
+        self.assertEqual(counts, {('submitted', 'high'): 2, ('assigned', 'low'): 1, ('resolved', 'medium'): 1})
+        self.assertTrue(all(g['department_id'] == self.department_id for g in stats['groups']))
+        self.assertEqual(sum(day['count'] for day in stats['created_by_day']), 4)
+
+    def test_filters_match_the_list(self):
+        stats = ticket_stats(self.request, status='submitted,assigned', older_than_hours=24)
+        self.assertEqual(stats['total'], 2)
+        self.assertEqual(stats['created_by_day'], [])
+
+        stats = ticket_stats(self.request, requestor_id=str(self.requestor_id))
+        self.assertEqual(stats['total'], 5)  # A requestor sees their own drafts
+
+        today = timezone.localdate()
+        stats = ticket_stats(self.request, created_from=today - timedelta(days=3), created_to=today)
+        self.assertEqual(stats['total'], 2)
+
+    def test_results_are_cached_per_filter_set(self):
+        ticket_stats(self.request, status='submitted')
+        with self.assertNumQueries(0):
+            ticket_stats(self.request, status='submitted')
+
+
+class UpdateStatusTests(TestCase):
+    """Status changes are idempotent and a failed change leaves the request usable."""
+
+    def setUp(self):
+        self.request = RequestFactory().post('/api/v1/tickets/status')
+        self.request.user = SimpleNamespace(id=uuid.uuid4())
+
+    def _ticket(self, status):
+        return Ticket.objects.create(title='t', description='d', requestor_id=uuid.uuid4(), status=status)
+
+    def test_repeated_action_succeeds_without_a_transition(self):
+        ticket = self._ticket('submitted')
+        with mock.patch('apps.tickets.api.AuditService.log') as log:
+            out = update_status(self.request, str(ticket.id), StatusUpdateIn(action='submit'))
+        self.assertEqual(out.status, 'submitted')
+        log.assert_not_called()
+
+    def test_failed_write_returns_400_and_rolls_back_the_transition(self):
+        ticket = self._ticket('draft')
+
+        def broken_audit_write(**kwargs):
+            # A real database error, which poisons the surrounding transaction
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT * FROM no_such_table')
+
+        with mock.patch('apps.tickets.api.AuditService.log', side_effect=broken_audit_write):
+            with self.assertRaises(HttpError) as raised:
+                update_status(self.request, str(ticket.id), StatusUpdateIn(action='submit'))
+        self.assertEqual(raised.exception.status_code, 400)
+        # The transaction is still usable and the status change was rolled back
+        self.assertEqual(Ticket.objects.get(id=ticket.id).status, 'draft')
+
+
+@skipUnless(connection.vendor == 'postgresql', 'reservations only leave the transaction on PostgreSQL')
+class TicketSequenceTests(TransactionTestCase):
+    """A reserved number does not keep its year locked until the request commits."""
+
+    def tearDown(self):
+        # reserve() keeps a connection per thread; close it so the test database can be dropped
+        reserve_connection = getattr(ticket_sequence._reserve_local, 'connection', None)
+        if reserve_connection is not None:
+            reserve_connection.close()
+
+    def _reserve_elsewhere(self, year, results):
+        # Another request's connection, which gives up instead of queueing
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SET lock_timeout = '2s'")
+            results.append(TicketSequence.reserve(year))
+        except OperationalError as e:
+            results.append(e)
+        finally:
+            connection.close()
+
+    def test_concurrent_reservation_does_not_wait_for_the_open_transaction(self):
+        results = []
+        with transaction.atomic():
+            first = TicketSequence.reserve(2001)
+            other = threading.Thread(target=self._reserve_elsewhere, args=(2001, results))
+            other.start()
+            other.join()
+
+        self.assertEqual(results, [first + 1])
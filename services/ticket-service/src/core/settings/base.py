@@ -151,20 +151,28 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.wsgi.application'
 
+# Database connection profile (see hdms_core.db): none, persistent, pgbouncer or pool
+from hdms_core.db import database_settings
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': config('DB_NAME', default='hdms_db'),
-        'USER': config('DB_USER', default='hdms_user'),
-        'PASSWORD': config('DB_PASSWORD', default='hdms_pwd'),
-        'HOST': config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
-        'PORT': config('DB_PORT', default='6432'),  # PgBouncer port
-        'CONN_MAX_AGE': 0,
-        'OPTIONS': {
+    'default': database_settings(
+        config('DB_POOL_PROFILE', default='pgbouncer'),
+        conn_max_age=config('DB_CONN_MAX_AGE', default=600, cast=int),
+        pool_options={
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+        },
+        NAME=config('DB_NAME', default='hdms_db'),
+        USER=config('DB_USER', default='hdms_user'),
+        PASSWORD=config('DB_PASSWORD', default='hdms_pwd'),
+        HOST=config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
+        PORT=config('DB_PORT', default='6432'),  # PgBouncer port
+        OPTIONS={
             'connect_timeout': int(config('DB_CONNECT_TIMEOUT', default=20))
             # Note: 'options' parameter not supported by PgBouncer in transaction pooling mode
-        }
-    }
+        },
+    )
 }
 
 # Cache Configuration (Redis)
@@ -239,6 +247,21 @@ TICKET_SERVICE_URL = config('TICKET_SERVICE_URL', default='http://ticket-service
 COMMUNICATION_SERVICE_URL = config('COMMUNICATION_SERVICE_URL', default='http://communication-service:8003')
 FILE_SERVICE_URL = config('FILE_SERVICE_URL', default='http://file-service:8005')
 
+# Ticket listing: seconds a cached total count may lag behind writes
+TICKET_LIST_COUNT_TTL = config('TICKET_LIST_COUNT_TTL', default=30, cast=int)
+
+# Ticket numbers (HD-YYYY-NNNN): numbers reserved per worker per round trip.
+# 1 keeps numbers in submission order; larger blocks trade ordering for fewer writes.
+TICKET_NUMBER_BLOCK_SIZE = config('TICKET_NUMBER_BLOCK_SIZE', default=1, cast=int)
+
+# Audit log writes: 'sync', 'on_commit' (bulk insert per transaction) or
+# 'background' (per-process flusher thread, batched bulk_create)
+AUDIT_SINK = config('AUDIT_SINK', default='on_commit')
+AUDIT_BATCH_SIZE = config('AUDIT_BATCH_SIZE', default=100, cast=int)
+AUDIT_FLUSH_INTERVAL = config('AUDIT_FLUSH_INTERVAL', default=0.5, cast=float)
+AUDIT_QUEUE_SIZE = config('AUDIT_QUEUE_SIZE', default=10000, cast=int)
+AUDIT_PARTITION_MONTHS_AHEAD = config('AUDIT_PARTITION_MONTHS_AHEAD', default=3, cast=int)
+
 # Logging - use shared logging configuration
 LOGGING = get_logging_config()
 
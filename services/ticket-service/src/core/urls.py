@@ -5,6 +5,7 @@ from django.contrib import admin
 from django.urls import path
 from .routers import api
 from django.http import JsonResponse
+from hdms_core.metrics import metrics_view
 
 def health_check(request):
     """Health check endpoint for Docker health checks."""
@@ -14,4 +15,5 @@ urlpatterns = [
     path('ticket-admin/', admin.site.urls),
     path('api/v1/', api.urls),
     path('health/', health_check, name='health'),
+    path('metrics/', metrics_view, name='metrics'),
 ]
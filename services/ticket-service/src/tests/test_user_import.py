@@ -0,0 +1,139 @@
+"""
+Tests for the shared users app's bulk import.
+
+The app lives in services/shared (installed as `users`), outside every
+service's source tree, so its tests run with this service's suite.
+"""
+import base64
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
+from django.test import TestCase
+
+from users.models import Role, User
+from users.services import import_service
+from users.services.import_service import ImportService
+
+
+def _csv(*lines: str) -> str:
+    return base64.b64encode('\n'.join(lines).encode()).decode()
+
+
+class ImportServiceUpsertTests(TestCase):
+    """Re-imports must only change what the file actually fills in."""
+
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            'EMP-1', password='secret', email='admin@example.com',
+            first_name='Ada', last_name='Admin', role=Role.ADMIN,
+        )
+        self.service = ImportService(hash_workers=1)
+
+    def test_reimport_without_role_column_keeps_role_and_email(self):
+        result = self.service.import_users(_csv(
+            'employee_code,first_name',
+            'EMP-1,Adele',
+            'EMP-2,Newton',
+        ))
+
+        self.assertEqual((result['created'], result['updated'], result['errors']), (1, 1, []))
+        self.admin.refresh_from_db()
+        self.assertEqual(self.admin.role, Role.ADMIN)
+        self.assertEqual(self.admin.email, 'admin@example.com')
+        self.assertEqual(self.admin.first_name, 'Adele')
+        self.assertTrue(self.admin.check_password('secret'))
+        self.assertEqual(User.objects.get(employee_code='EMP-2').role, Role.requestor)
+
+    def test_blank_cells_keep_existing_values(self):
+        result = self.service.import_users(_csv(
+            'employee_code,email,first_name,last_name,role',
+            'EMP-1,,,,',
+            'EMP-2,new@example.com,Newton,New,moderator',
+        ))
+
+        self.assertEqual((result['created'], result['updated'], result['errors']), (1, 1, []))
+        self.admin.refresh_from_db()
+        self.assertEqual(
+            (self.admin.role, self.admin.email, self.admin.first_name, self.admin.last_name),
+            (Role.ADMIN, 'admin@example.com', 'Ada', 'Admin'),
+        )
+        self.assertEqual(User.objects.get(employee_code='EMP-2').role, Role.MODERATOR)
+
+
+class ImportServiceChunkingTests(TestCase):
+    """Files are written chunk by chunk, and one bad row never sinks its chunk."""
+
+    def test_rows_are_written_in_chunks_with_progress_per_chunk(self):
+        progress = []
+        result = ImportService(chunk_size=2, hash_workers=1).import_users(_csv(
+            'employee_code,email',
+            'EMP-1,a@example.com',
+            'EMP-2,b@example.com',
+            'EMP-3,c@example.com',
+            'EMP-1,d@example.com',  # Duplicate of a row in an earlier chunk
+            'EMP-5,e@example.com',
+        ), progress=progress.append)
+
+        self.assertEqual([p['last_row'] for p in progress], [3, 5, 6])
+        self.assertEqual([p['processed'] for p in progress], [2, 4, 5])
+        self.assertEqual((result['created'], result['failed']), (4, 1))
+        self.assertEqual(result['errors'], ['Row 5: Duplicate employee_code in file'])
+        self.assertEqual(User.objects.get(employee_code='EMP-1').email, 'a@example.com')
+
+    def test_failed_bulk_write_falls_back_to_row_by_row(self):
+        validate = ImportService._validate
+
+        def validate_then_race(service, chunk, seen):
+            # Another import takes an email between validation and the bulk write
+            valid, errors = validate(service, chunk, seen)
+            User.objects.create_user('OTHER', email='b@example.com')
+            return valid, errors
+
+        with mock.patch.object(ImportService, '_validate', validate_then_race):
+            result = ImportService(hash_workers=1).import_users(_csv(
+                'employee_code,email',
+                'EMP-1,a@example.com',
+                'EMP-2,b@example.com',
+                'EMP-3,c@example.com',
+            ))
+
+        self.assertEqual((result['created'], result['failed']), (2, 1))
+        self.assertEqual(len(result['errors']), 1)
+        self.assertTrue(result['errors'][0].startswith('Row 3: '))
+        self.assertEqual(
+            set(User.objects.filter(employee_code__startswith='EMP-').values_list('employee_code', flat=True)),
+            {'EMP-1', 'EMP-3'},
+        )
+
+
+class ImportServiceHashingTests(TestCase):
+    """Passwords of new users are hashed outside the importing process."""
+
+    def test_passwords_are_hashed_in_a_process_pool(self):
+        pools = []
+        make_pool = import_service._hash_pool
+
+        def hash_pool(workers):
+            pool = make_pool(workers)
+            pools.append(pool)
+            return pool
+
+        with mock.patch.object(import_service, '_hash_pool', hash_pool):
+            result = ImportService(hash_workers=2).import_users(_csv(
+                'employee_code,password',
+                'EMP-1,first-secret',
+                'EMP-2,',
+            ))
+
+        self.assertEqual((result['created'], result['errors']), (2, []))
+        self.assertIsInstance(pools[0], ProcessPoolExecutor)
+        self.assertTrue(User.objects.get(employee_code='EMP-1').check_password('first-secret'))
+        self.assertTrue(User.objects.get(employee_code='EMP-2').check_password(import_service.DEFAULT_PASSWORD))
+
+    def test_daemon_workers_hash_in_threads(self):
+        # Celery prefork children are daemonic and may not start processes
+        with mock.patch('multiprocessing.current_process') as current_process:
+            current_process.return_value.daemon = True
+            pool = import_service._hash_pool(2)
+        pool.shutdown()
+        self.assertIsInstance(pool, ThreadPoolExecutor)